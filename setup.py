@@ -32,6 +32,10 @@ setuptools.setup(
             'pytest',
             'pytest-cov',
             'build'
+        ],
+        'speedups': [
+            'wsaccel',
+            'orjson'
         ]
     },
     project_urls={
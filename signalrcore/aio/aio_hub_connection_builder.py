@@ -4,6 +4,26 @@ from .hub.aio_auth_hub_connection import AIOAuthHubConnection
 
 
 class AIOHubConnectionBuilder(HubConnectionBuilder):
+    def __init__(self):
+        super(AIOHubConnectionBuilder, self).__init__()
+        self.native_transport = False
+
+    def with_native_transport(self, enabled: bool = True):
+        """Uses the asyncio native websocket transport. Handshake,
+        keep alive and reconnection run on the event loop instead of
+        a receive thread and a connection checker thread per connection.
+        Handlers are called on the event loop, they must not block.
+        Server sent events and long polling are not affected.
+
+        Args:
+            enabled (bool, optional): Defaults to True.
+
+        Returns:
+            [AIOHubConnectionBuilder]: self object for fluent interface
+        """
+        self.native_transport = enabled
+        return self
+
     def build(self):
         """Creates the connection hub
 
@@ -13,28 +33,10 @@ class AIOHubConnectionBuilder(HubConnectionBuilder):
         """
 
         return AIOAuthHubConnection(
-                headers=self.headers,
                 auth_function=self.auth_function,
-                url=self.hub_url,
-                protocol=self.protocol,
-                preferred_protocol=self.preferred_protocol,
-                keep_alive_interval=self.keep_alive_interval,
-                reconnection_handler=self.reconnection_handler,
-                ssl_context=self.ssl_context,
-                proxies=self.proxies,
-                skip_negotiation=self.skip_negotiation,
-                enable_trace=self.enable_trace,
-                preferred_transport=self.preferred_transport)\
+                native_transport=self.native_transport,
+                **self._get_connection_kwargs())\
             if self.has_auth_configured else\
             AIOBaseHubConnection(
-                url=self.hub_url,
-                protocol=self.protocol,
-                preferred_protocol=self.preferred_protocol,
-                keep_alive_interval=self.keep_alive_interval,
-                reconnection_handler=self.reconnection_handler,
-                headers=self.headers,
-                ssl_context=self.ssl_context,
-                proxies=self.proxies,
-                skip_negotiation=self.skip_negotiation,
-                enable_trace=self.enable_trace,
-                preferred_transport=self.preferred_transport)
+                native_transport=self.native_transport,
+                **self._get_connection_kwargs())
@@ -2,23 +2,67 @@ import asyncio
 import time
 from typing import Awaitable, Any, List, Callable, Optional
 from ...hub.base_hub_connection import BaseHubConnection
+from ...hub.dispatchers import AsyncioDispatcher
 from ...transport.base_transport import TransportState
 from ...messages.completion_message import CompletionMessage
+from ..transport.aio_transport_factory import AIOTransportFactory
+from ..transport.aio_websocket_transport import AIOWebsocketTransport
 
 
 class AIOBaseHubConnection(BaseHubConnection):
-    def __init__(self, **kwargs):
+    def __init__(self, native_transport: bool = False, **kwargs):
         super().__init__(**kwargs)
+        if native_transport:
+            self.transport_factory = AIOTransportFactory
+            if self.stateful_reconnect:
+                self.logger.warning(
+                    "Stateful reconnect is not available on the native "
+                    "transport, disabled")
+                self.stateful_reconnect = False
+
+    def _is_native_transport(self) -> bool:
+        return isinstance(self.transport, AIOWebsocketTransport)
+
+    async def _call(self, func, *args):
+        """Runs a blocking connection method. With the native
+        transport sends only buffer data on the loop, so it is
+        called inline and the writer is drained afterwards.
+        """
+        if self._is_native_transport():
+            result = func(*args)
+            await self.transport.drain()
+            return result
+        return await asyncio.to_thread(func, *args)
 
     async def wait_until_state(
             self,
             state: TransportState,
             timeout: float = None) -> Awaitable:
         t0 = time.time()
-        while self.transport is None or self.transport.state != state:
+        while self.transport is None:  # pragma: no cover
             await asyncio.sleep(0.1)
             if timeout is not None and t0 + timeout < time.time():  # pragma: no cover # noqa E501
                 raise TimeoutError()
+
+        loop = asyncio.get_running_loop()
+        reached = asyncio.Event()
+
+        def listener(new_state: TransportState):
+            if new_state == state:
+                loop.call_soon_threadsafe(reached.set)
+
+        self.transport.add_state_listener(listener)
+        try:
+            if self.transport.state != state:
+                await asyncio.wait_for(
+                    reached.wait(),
+                    None if timeout is None
+                    else max(0, t0 + timeout - time.time()))
+        except asyncio.TimeoutError:  # pragma: no cover
+            raise TimeoutError()
+        finally:
+            self.transport.remove_state_listener(listener)
+
         self.logger.info(
             f"Time elapsed until state change {time.time() - t0}s")
 
@@ -30,10 +74,29 @@ class AIOBaseHubConnection(BaseHubConnection):
             bool: True if connection stars successfully, False
             if connection cant start or is already connected
         """
-        t1 = asyncio.to_thread(super().start)
-        t2 = self.wait_until_state(TransportState.connected)
+        if self.transport is not None and self.transport.is_connected():
+            self.logger.warning("Already connected unable to start")
+            return False
 
-        result, _ = await asyncio.gather(t1, t2)
+        self.logger.debug("Connection started")
+
+        if isinstance(self.dispatcher, AsyncioDispatcher)\
+                and self.dispatcher.loop is None:
+            self.dispatcher.loop = asyncio.get_running_loop()
+
+        self.transport = await asyncio.to_thread(self._create_transport)
+
+        try:
+            if self._is_native_transport():
+                return await self.transport.start()
+
+            t1 = asyncio.to_thread(self.transport.start)
+            t2 = self.wait_until_state(TransportState.connected)
+
+            result, _ = await asyncio.gather(t1, t2)
+        except Exception:
+            self._negotiation.invalidate()  # cached negotiation failed
+            raise
 
         return result
 
@@ -44,6 +107,9 @@ class AIOBaseHubConnection(BaseHubConnection):
         Returns:
             None
         """
+        if self._is_native_transport():
+            return await self.transport.stop()
+
         t1 = asyncio.to_thread(super().stop)
         t2 = self.wait_until_state(TransportState.disconnected)
         result, _ = await asyncio.gather(t1, t2)
@@ -70,23 +136,27 @@ class AIOBaseHubConnection(BaseHubConnection):
             HubConnectionError: If hub is not ready to send
             TypeError: If arguments are invalid list or Subject
         """
-        result = await asyncio.to_thread(
+        return await self._call(
             super().invoke,
             method,
             arguments,
             on_invocation,
             invocation_id
         )
-        return result
 
     async def invoke(
             self,
             method: str,
             arguments: List[Any],
             on_invocation: Optional[Callable[[List[CompletionMessage]], Awaitable[None]]] = None,  # noqa: E501
-            invocation_id: str = None):
+            invocation_id: str = None,
+            timeout: Optional[float] = None,
+            return_future: bool = False):
         """invokes a server function
 
+            result = await (await connection.invoke(
+                "Add", [1, 2], timeout=10, return_future=True))
+
         Args:
             method (string): Method name
             arguments (list|Subject): Method parameters
@@ -95,19 +165,25 @@ class AIOBaseHubConnection(BaseHubConnection):
             invocation_id (string, optional): Override invocation ID.
                 Exceptions thrown by the hub will use this ID,
                 making it easier to handle with the on_error call.
+            timeout (float, optional): Seconds until the returned future
+                fails with TimeoutError. Defaults to None, no timeout.
+            return_future (bool, optional): Returns an asyncio future
+                resolved with the invocation result. Defaults to False.
 
         Raises:
             HubConnectionError: If hub is not ready to send
             TypeError: If arguments are invalid list or Subject
         """
-        result = await asyncio.to_thread(
+        result = await self._call(
             super().invoke,
             method,
             arguments,
             on_invocation,
-            invocation_id
+            invocation_id,
+            timeout,
+            return_future
         )
-        return result
+        return asyncio.wrap_future(result) if return_future else result
 
     def on(
             self,
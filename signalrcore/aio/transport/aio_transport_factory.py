@@ -0,0 +1,15 @@
+from ...transport.transport_factory import TransportFactory, TRANSPORTS
+from ...types import HttpTransportType
+from .aio_websocket_transport import AIOWebsocketTransport
+
+
+AIO_TRANSPORTS = dict(TRANSPORTS)
+AIO_TRANSPORTS[HttpTransportType.web_sockets] = AIOWebsocketTransport
+
+
+class AIOTransportFactory(TransportFactory):
+    """Same negotiation rules as :class:`TransportFactory`, websockets
+    are served by the asyncio native transport. Server sent events and
+    long polling keep using the thread based transports.
+    """
+    transports = AIO_TRANSPORTS
@@ -0,0 +1,294 @@
+import asyncio
+import base64
+import os
+import ssl
+import struct
+import urllib.parse as parse
+
+from typing import Callable, Optional, Union
+
+from ...helpers import Helpers
+from ...transport.sockets.errors import SocketClosedError, \
+    SocketHandshakeError, MessageTooBigError
+from ...transport.websockets.frame import encode_frame, \
+    OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG
+from ...types import DEFAULT_ENCODING, CRLF, CRLF_CRLF
+
+
+class AIOWebSocketClient(object):
+    """WebSocket client running on the asyncio event loop, frames are
+    read with a StreamReader and written with a StreamWriter, so no
+    receive thread is needed.
+    """
+    def __init__(
+            self,
+            url: str,
+            connection_id: str = "",
+            is_binary: bool = False,
+            headers: Optional[dict] = None,
+            proxies: Optional[dict] = None,
+            ssl_context: ssl.SSLContext = None,
+            enable_trace: bool = False,
+            on_message: Callable = None,
+            on_open: Callable = None,
+            on_error: Callable = None,
+            on_close: Callable = None,
+            max_message_size: Optional[int] = None):
+        self.url = url
+        self.connection_id = connection_id
+        self.is_binary = is_binary
+        self.headers = headers or {}
+        self.proxies = proxies or {}
+        self.ssl_context = ssl_context
+        self.enable_trace = enable_trace
+        self.on_message = on_message
+        self.on_open = on_open
+        self.on_error = on_error
+        self.on_close = on_close
+        self.max_message_size = max_message_size
+
+        self.logger = Helpers.get_logger()
+
+        self.running: bool = False
+        self.is_closing: bool = False
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._recv_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def is_trace_enabled(self) -> bool:
+        return self.enable_trace
+
+    def is_connection_closed(self) -> bool:
+        return not self.running\
+            or self._recv_task is None\
+            or self._recv_task.done()
+
+    def get_socket_headers(self):
+        parsed_url = parse.urlparse(self.url)
+
+        key = base64.b64encode(os.urandom(16)).decode(DEFAULT_ENCODING)
+        relative_reference = parsed_url.path
+
+        if parsed_url.query:
+            relative_reference = f"{parsed_url.path}?{parsed_url.query}"
+        else:
+            relative_reference =\
+                f"{parsed_url.path}?connectionId={self.connection_id}"
+
+        return [
+            f"GET {relative_reference} HTTP/1.1",
+            f"Host: {parsed_url.hostname}",
+            "Upgrade: websocket",
+            "Connection: Upgrade",
+            f"Sec-WebSocket-Key: {key}",
+            "Sec-WebSocket-Version: 13"
+        ]
+
+    async def connect(self):
+        parsed_url = parse.urlparse(self.url)
+        host = parsed_url.hostname
+        is_secure_connection = parsed_url.scheme in ("wss", "https")
+        port = Helpers.get_port(parsed_url)
+
+        proxy_info = Helpers.get_proxy_info(
+            is_secure_connection,
+            self.proxies
+        )
+
+        if proxy_info is not None:  # pragma: no cover
+            host = proxy_info.hostname
+            port = proxy_info.port
+
+        self._loop = asyncio.get_running_loop()
+
+        self._reader, self._writer = await asyncio.open_connection(
+            host,
+            port,
+            ssl=self.ssl_context if is_secure_connection else None,
+            server_hostname=host if is_secure_connection else None)
+
+        request_headers = self.get_socket_headers()
+
+        for k, v in self.headers.items():
+            request_headers.append(f"{k}: {v}")
+
+        request = CRLF.join(request_headers) + CRLF_CRLF
+        req = request.encode(DEFAULT_ENCODING)
+
+        if self.is_trace_enabled():
+            self.logger.debug(f"[TRACE] - {req}")
+
+        self._writer.write(req)
+        await self._writer.drain()
+
+        try:
+            response = await self._reader.readuntil(
+                CRLF_CRLF.encode(DEFAULT_ENCODING))
+        except asyncio.IncompleteReadError:
+            raise SocketHandshakeError(
+                "Connection closed during handshake")
+
+        if self.is_trace_enabled():
+            self.logger.debug(f"[TRACE] - {response}")
+
+        if b"101" not in response.split(b"\r\n", 1)[0]:
+            raise SocketHandshakeError(
+                f"Handshake failed: {response.decode()}")
+
+        self.running = True
+        self._recv_task = self._loop.create_task(self.run())
+
+    def send(
+            self,
+            message: Union[str, bytes],
+            opcode=0x1):
+        """Writes a frame, it does not wait until the data is flushed,
+        await :meth:`drain` for that. Safe to call from other threads.
+        """
+        if self.is_connection_closed():
+            raise SocketClosedError()
+
+        payload = message.encode(DEFAULT_ENCODING)\
+            if type(message) is str else message
+
+        frame = encode_frame(payload, opcode)
+
+        if self._is_loop_thread():
+            self._writer.write(frame)
+        else:
+            self._loop.call_soon_threadsafe(self._writer.write, frame)
+
+    async def drain(self):
+        if self._writer is not None and self._is_loop_thread():
+            await self._writer.drain()
+
+    def _is_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    async def close(self):
+        if not self.running or self.is_closing:
+            return
+
+        self.is_closing = True
+        self.running = False
+
+        try:
+            self.logger.debug("AIO websocket client: closing socket")
+            try:
+                self._writer.write(
+                    encode_frame(struct.pack(">H", 1000), OPCODE_CLOSE))
+            except Exception:  # pragma: no cover
+                pass
+            await self.dispose()
+            self.logger.debug("AIO websocket client: closed successfully")
+        except Exception as ex:  # pragma: no cover
+            self.logger.error(ex)
+            self.on_error(ex)
+        finally:
+            self.is_closing = False
+            self.on_close()
+
+    async def dispose(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (OSError, ssl.SSLError):  # pragma: no cover
+                pass
+
+        current_task = asyncio.current_task()
+
+        if self._recv_task is not None\
+                and self._recv_task is not current_task\
+                and not self._recv_task.done():
+            self._recv_task.cancel()
+            try:
+                await self._recv_task
+            except asyncio.CancelledError:
+                pass
+
+    async def run(self):
+        self.on_open()
+        try:
+            while self.running:
+                message = await self._recv_frame()
+
+                if self.on_message and message is not None:
+                    self.on_message(self, message)
+
+        except asyncio.CancelledError:
+            self.running = False
+        except (asyncio.IncompleteReadError, OSError, SocketClosedError):
+            self.running = False
+            if not self.is_closing:
+                self.on_close()
+        except Exception as e:  # pragma: no cover
+            self.running = False
+            self.logger.error(f"Receive error: {e}")
+            self.on_error(e)
+
+    def prepare_data(self, data):
+        if self.is_binary:
+            return data
+        return data.decode(DEFAULT_ENCODING)
+
+    async def _read_one_frame(self):
+        """Read a single WebSocket frame. Returns (fin, opcode, data)."""
+        header = await self._reader.readexactly(2)
+
+        fin = (header[0] & 0x80) != 0
+        opcode = header[0] & 0x0F
+        masked_len = header[1]
+
+        if masked_len & 0x80:  # pragma: no cover
+            # RFC 6455 §5.1: server MUST NOT mask frames sent to the client
+            raise SocketClosedError()
+
+        payload_len = masked_len & 0x7F
+        if payload_len == 126:
+            payload_len = struct.unpack(
+                ">H", await self._reader.readexactly(2))[0]
+        elif payload_len == 127:  # pragma: no cover
+            payload_len = struct.unpack(
+                ">Q", await self._reader.readexactly(8))[0]
+
+        self._check_message_size(payload_len)
+
+        data = await self._reader.readexactly(payload_len)
+
+        return fin, opcode, data
+
+    def _check_message_size(self, size: int):
+        if self.max_message_size is not None\
+                and size > self.max_message_size:
+            raise MessageTooBigError(size, self.max_message_size)
+
+    async def _recv_frame(self):
+        fin, opcode, data = await self._read_one_frame()
+
+        if opcode == OPCODE_CLOSE:  # pragma: no cover
+            raise SocketClosedError()
+
+        if opcode in (OPCODE_PING, OPCODE_PONG):  # pragma: no cover
+            return None
+
+        payload = data
+
+        if not fin:
+            fragments = bytearray(data)
+            while not fin:
+                fin, cont_opcode, data = await self._read_one_frame()
+                if cont_opcode == OPCODE_CLOSE:  # pragma: no cover
+                    raise SocketClosedError()
+                self._check_message_size(len(fragments) + len(data))
+                fragments += data
+            payload = bytes(fragments)
+
+        if self.is_trace_enabled():
+            self.logger.debug(f"[TRACE] - {payload}")
+
+        return self.prepare_data(payload)
@@ -0,0 +1,246 @@
+import asyncio
+import time
+from typing import Optional
+from ...messages.ping_message import PingMessage
+from ...protocol.messagepack_protocol import MessagePackHubProtocol
+from ...transport.base_transport import BaseTransport, TransportState
+from ...transport.sockets.errors import SocketClosedError
+from .aio_websocket_client import AIOWebSocketClient
+
+
+class AIOWebsocketTransport(BaseTransport):
+    """Websocket transport driven by the asyncio event loop.
+    Handshake, keep alive and reconnection run as tasks on the loop
+    that called :meth:`start`, instead of dedicated threads.
+    """
+    _client: Optional[AIOWebSocketClient] = None
+    requires_connection_token = False
+
+    def __init__(
+            self,
+            keep_alive_interval=15,
+            **kwargs):
+        super(AIOWebsocketTransport, self).__init__(**kwargs)
+        self.keep_alive_interval = keep_alive_interval
+        self.handshake_received = False
+        self.last_message = time.time()
+        self.last_received = time.time()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handshake: Optional[asyncio.Future] = None
+        self._keep_alive_task: Optional[asyncio.Task] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    def create_client(self) -> AIOWebSocketClient:
+        return AIOWebSocketClient(
+            url=self.url,
+            connection_id=self.connection_id,
+            headers=self.headers,
+            proxies=self.proxies,
+            is_binary=type(self.protocol) is MessagePackHubProtocol,
+            ssl_context=self.ssl_context,
+            enable_trace=self.enable_trace,
+            on_message=self.on_message,
+            on_error=self.on_socket_error,
+            on_close=self.on_socket_close,
+            on_open=self.on_socket_open,
+            max_message_size=self.max_message_size)
+
+    async def start(self, reconnection: bool = False):
+        """Opens the socket and waits until the handshake response
+        is received.
+
+        Returns:
+            bool: True once the connection is ready
+        """
+        self._loop = asyncio.get_running_loop()
+
+        if reconnection:
+            await asyncio.to_thread(self.negotiate)
+            self._set_state(TransportState.reconnecting)
+        else:
+            self.manually_closing = False
+            self._set_state(TransportState.connecting)
+
+        self.logger.debug("start url:" + self.url)
+
+        self._handshake = self._loop.create_future()
+        self._client = self.create_client()
+
+        if self.inbound_queue is not None:
+            self.inbound_queue.start()
+
+        await self._client.connect()
+        await self._handshake
+        self.last_received = time.time()
+
+        if self._keep_alive_task is None or self._keep_alive_task.done():
+            self._keep_alive_task = self._loop.create_task(
+                self._keep_alive())
+
+        return True
+
+    async def stop(self):
+        if self.manually_closing or self.is_disconnected():
+            return
+        self.manually_closing = True
+        self.handshake_received = False
+
+        for task in (self._keep_alive_task, self._reconnect_task):
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+
+        if self._client is not None:
+            await self._client.close()
+
+        if self.inbound_queue is not None:
+            await asyncio.to_thread(self.inbound_queue.stop)
+
+        self._set_state(TransportState.disconnected)
+
+    def dispose(self):
+        if not self.is_disconnected() and self._client is not None:
+            self._loop.create_task(self._client.close())
+
+    async def drain(self):
+        if self._client is not None:
+            await self._client.drain()
+
+    def evaluate_handshake(self, message):
+        self.logger.debug("Evaluating handshake {0}".format(message))
+        msg, messages = self.protocol.decode_handshake(message)
+        if msg.error is None or msg.error == "":
+            self.handshake_received = True
+            self._set_state(TransportState.connected)
+            if self.reconnection_handler is not None:
+                self.reconnection_handler.reconnecting = False
+            if not self._handshake.done():
+                self._handshake.set_result(True)
+        else:
+            self.logger.error(msg.error)
+            if not self._handshake.done():
+                self._handshake.set_exception(ValueError(msg.error))
+            self._loop.create_task(self.stop())
+        return messages
+
+    def on_socket_error(self, error: Exception):  # pragma: no cover
+        self.logger.debug("-- aio web socket error --")
+        if self._handshake is not None and not self._handshake.done():
+            self._handshake.set_exception(error)
+        super().on_socket_error(error)
+
+    def on_socket_close(self):
+        if self._handshake is not None and not self._handshake.done():
+            self._handshake.set_exception(SocketClosedError())
+
+        if not self.manually_closing and\
+                self.reconnection_handler is not None\
+                and not self.is_reconnecting():
+            self.handle_reconnect()
+            return
+
+        if not self.is_reconnecting():
+            self._set_state(TransportState.disconnected)
+
+    def on_socket_open(self):
+        self.logger.debug("-- aio web socket open --")
+        self.send_handshake()
+
+    def on_message(self, app, raw_message):
+        self.logger.debug("Message received {0}".format(raw_message))
+        self.last_received = time.time()
+        if not self.handshake_received:
+            messages = self.evaluate_handshake(raw_message)
+
+            if len(messages) > 0:
+                return self._on_message(messages)
+
+            return []
+
+        return self._on_message(
+            self.protocol.parse_messages(raw_message))
+
+    def send(self, message):
+        self.logger.debug("Sending message {0}".format(message))
+        try:
+            self._client.send(
+                self.protocol.encode(message),
+                opcode=0x2
+                if type(self.protocol) is MessagePackHubProtocol else
+                0x1)
+            self.last_message = time.time()
+        except (OSError, SocketClosedError) as ex:  # pragma: no cover
+            self.handshake_received = False
+            self.logger.warning("Connection closed {0}".format(ex))
+            if self.reconnection_handler is None:
+                self._set_state(TransportState.disconnected)
+                raise ValueError(str(ex))
+            self.handle_reconnect()
+
+    def handle_reconnect(self) -> bool:
+        if self.manually_closing or self.reconnection_handler is None:
+            return False
+
+        if self._reconnect_task is not None\
+                and not self._reconnect_task.done():
+            return False
+
+        self.reconnection_handler.reconnecting = True
+        self._set_state(TransportState.reconnecting)
+        self._reconnect_task = self._loop.create_task(self._reconnect())
+        return True
+
+    async def _reconnect(self):
+        metrics = self.reconnect_metrics
+        number, sleep_time = 0, 0
+        while not self.manually_closing:
+            number += 1
+            attempt = metrics.start_attempt(number, sleep_time)
+            try:
+                await self.start(reconnection=True)
+                metrics.end_attempt(attempt)
+                self.reconnection_handler.reset()
+                return
+            except Exception as ex:
+                metrics.end_attempt(attempt, ex)
+                self.logger.error(ex)
+                self.invalidate_negotiation()
+
+            try:
+                sleep_time = self.reconnection_handler.next()
+            except ValueError as ex:
+                metrics.gave_up += 1
+                self.logger.error(ex)
+                self._set_state(TransportState.disconnected)
+                return
+
+            await asyncio.sleep(sleep_time)
+
+    def on_server_timeout(self):
+        self.logger.warning(
+            "Server timeout elapsed without receiving a message "
+            f"({self.server_timeout} s), closing connection")
+        self.last_received = time.time()
+        if self._client is not None:
+            self._loop.create_task(self._client.close())
+
+    async def _keep_alive(self):
+        while not self.is_disconnected():
+            delay = self.last_message + self.keep_alive_interval\
+                - time.time()
+
+            if self.server_timeout is not None and self.is_connected():
+                timeout_delay = self.last_received + self.server_timeout\
+                    - time.time()
+                if timeout_delay <= 0:
+                    self.on_server_timeout()
+                    continue
+                delay = min(delay, timeout_delay)
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            if self.is_connected():
+                self.send(PingMessage())
+            else:
+                self.last_message = time.time()
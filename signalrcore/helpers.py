@@ -1,12 +1,16 @@
+import io
 import json
 import ssl
 import copy
 import logging
+import threading
+import http.client
 import urllib
 import urllib.parse as parse
 import urllib.request
 
-from typing import Callable, List, Dict, TypeVar, Union
+from urllib.error import HTTPError
+from typing import Callable, List, Dict, Optional, Tuple, TypeVar, Union
 from .types import DEFAULT_ENCODING
 
 T = TypeVar("T")
@@ -32,7 +36,168 @@ class HTTPResponse(object):
             if len(response_body) > 0 else None
 
 
+class PooledHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that resumes the last TLS session of its pool,
+    so new sockets to the same host skip the full handshake."""
+    tls_session: Optional[ssl.SSLSession] = None
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+
+        server_hostname = self._tunnel_host\
+            if self._tunnel_host else self.host
+
+        self.sock = self._context.wrap_socket(
+            self.sock,
+            server_hostname=server_hostname,
+            session=self.tls_session)
+
+
+class HttpConnectionPool(object):
+    """Keeps HTTP/1.1 keep-alive connections open between requests,
+    idle connections are stored by scheme, host, port and ssl context.
+    Each connection is used by a single request at a time.
+    """
+    def __init__(self, max_idle_per_host: int = 4):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[Tuple, List[http.client.HTTPConnection]] = {}
+        self._sessions: Dict[Tuple, ssl.SSLSession] = {}
+        self._default_context: Optional[ssl.SSLContext] = None
+        self._lock = threading.Lock()
+        self.logger = Helpers.get_logger()
+
+    def _get_key(
+            self,
+            parsed_url: parse.ParseResult,
+            ssl_context: Optional[ssl.SSLContext]) -> Tuple:
+        is_secure = parsed_url.scheme == "https"
+        return (
+            parsed_url.scheme,
+            parsed_url.hostname,
+            Helpers.get_port(parsed_url),
+            id(ssl_context) if is_secure else None)
+
+    def _acquire(
+            self,
+            key: Tuple,
+            timeout: Optional[float],
+            ssl_context: Optional[ssl.SSLContext])\
+            -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key, [])
+            if len(idle) > 0:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+
+        scheme, host, port, _ = key
+
+        if scheme != "https":
+            return http.client.HTTPConnection(
+                host, port, timeout=timeout), False
+
+        if ssl_context is None:
+            with self._lock:
+                if self._default_context is None:
+                    self._default_context = ssl.create_default_context()
+            ssl_context = self._default_context
+
+        connection = PooledHTTPSConnection(
+            host, port, timeout=timeout, context=ssl_context)
+        connection.tls_session = self._sessions.get(key, None)
+        return connection, False
+
+    def _release(self, key: Tuple, connection: http.client.HTTPConnection):
+        with self._lock:
+            if type(connection.sock) is ssl.SSLSocket\
+                    and connection.sock.session is not None:
+                self._sessions[key] = connection.sock.session
+
+            idle = self._idle.setdefault(key, [])
+
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+
+        connection.close()
+
+    def request(
+            self,
+            url: str,
+            method: str,
+            headers: dict,
+            data: Optional[bytes] = None,
+            timeout: Optional[float] = None,
+            ssl_context: Optional[ssl.SSLContext] = None)\
+            -> "HTTPResponse":
+        parsed_url = parse.urlparse(url)
+        key = self._get_key(parsed_url, ssl_context)
+
+        selector = parsed_url.path or "/"
+        if parsed_url.query:
+            selector += "?" + parsed_url.query
+
+        while True:
+            connection, reused = self._acquire(key, timeout, ssl_context)
+            try:
+                connection.request(
+                    method, selector, body=data, headers=headers)
+                raw_response = connection.getresponse()
+                response = HTTPResponse(
+                    context=ssl_context,
+                    request=None,
+                    response=raw_response)
+                break
+            except TimeoutError as ex:
+                connection.close()
+                raise ex
+            except (http.client.RemoteDisconnected, OSError) as ex:
+                connection.close()
+                if not reused:
+                    raise ex
+                # Server closed an idle connection, retry with a new one
+                self.logger.debug(f"Pooled connection closed {ex}")
+            except Exception as ex:
+                connection.close()
+                raise ex
+
+        if raw_response.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+
+        if not 200 <= response.status_code < 300:
+            raise HTTPError(
+                url,
+                response.status_code,
+                raw_response.reason,
+                raw_response.headers,
+                io.BytesIO(response.content))
+
+        return response
+
+    def close(self):
+        with self._lock:
+            connections = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+
 class RequestHelpers:
+    # Shared by negotiation, long polling and server sent events requests
+    pool: Optional[HttpConnectionPool] = None
+    _pool_lock = threading.Lock()
+
+    @staticmethod
+    def get_pool() -> HttpConnectionPool:
+        with RequestHelpers._pool_lock:
+            if RequestHelpers.pool is None:
+                RequestHelpers.pool = HttpConnectionPool()
+            return RequestHelpers.pool
+
     @staticmethod
     def update_querystring(url: str, params: dict = {}) -> str:
         parsed = parse.urlparse(url)
@@ -124,13 +289,19 @@ class RequestHelpers:
         if data is not None:
             request_headers.update({"Content-Length": str(len(data))})
 
-        proxy_handler = None
+        updated_url = RequestHelpers.update_querystring(url, params)
 
-        if len(proxies.keys()) > 0:
-            proxy_handler = urllib.request.ProxyHandler(proxies)
-            # pragma: no cover
+        if len(proxies.keys()) == 0:
+            return RequestHelpers.get_pool().request(
+                updated_url,
+                method,
+                headers=request_headers,
+                data=data,
+                timeout=timeout,
+                ssl_context=ssl_context)
 
-        updated_url = RequestHelpers.update_querystring(url, params)
+        proxy_handler = urllib.request.ProxyHandler(proxies)
+        # pragma: no cover
 
         req = urllib.request.Request(
                 updated_url,
@@ -138,9 +309,7 @@ class RequestHelpers:
                 headers=request_headers,
                 data=data)
 
-        opener = urllib.request.build_opener(proxy_handler)\
-            if proxy_handler is not None else\
-            urllib.request.urlopen
+        opener = urllib.request.build_opener(proxy_handler)
 
         with opener(
                 req,
@@ -256,6 +425,19 @@ class Helpers:
 
         return Helpers.http_to_websocket(parse.urlunsplit(url_parts))
 
+    @staticmethod
+    def remove_connection_id(url):
+        url_parts = parse.urlsplit(url)
+        query_string_parts = parse.parse_qs(url_parts.query)
+        query_string_parts.pop("id", None)
+
+        url_parts = url_parts._replace(
+            query=parse.urlencode(
+                query_string_parts,
+                doseq=True))
+
+        return parse.urlunsplit(url_parts)
+
     @staticmethod
     def get_port(parsed_url) -> int:
         port = parsed_url.port
@@ -1,13 +1,16 @@
 import uuid
 import copy
 import ssl
-from typing import Callable, List, Union, Optional
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, List, Union, Optional
 from signalrcore.messages.message_type import MessageType
 from signalrcore.messages.stream_invocation_message\
     import StreamInvocationMessage
 from .errors import HubConnectionError
 from signalrcore.helpers import Helpers
-from .handlers import StreamHandler, InvocationHandler
+from .handlers import StreamHandler, InvocationHandler, LatestHandler
+from .invocations import PendingInvocations, MAX_PENDING_INVOCATIONS
+from .dispatchers import BaseDispatcher, InlineDispatcher
 from ..transport.base_transport import BaseTransport
 from ..subject import Subject
 from ..messages.invocation_message import InvocationMessage
@@ -15,7 +18,8 @@ from collections import defaultdict
 from ..protocol.base_hub_protocol import BaseHubProtocol
 from ..protocol.protocol_factory import ProtocolFactory
 from ..transport.transport_factory import TransportFactory
-from .negotiation import NegotiateResponse, NegotiationHandler
+from .negotiation import NegotiateResponse, NegotiationHandler, \
+    NegotiateCache
 from ..types import HttpTransportType, HubProtocolEncoding
 from ..messages.base_message import BaseMessage
 from ..messages.completion_message import CompletionMessage
@@ -70,6 +74,7 @@ class BaseHubConnection(object):
     transport: BaseTransport = None
     preferred_transport: Optional[HttpTransportType] = None
     preferred_protocol: Optional[HubProtocolEncoding] = None
+    transport_factory = TransportFactory
 
     def __init__(
             self,
@@ -81,6 +86,10 @@ class BaseHubConnection(object):
             ssl_context: ssl.SSLContext = ssl.create_default_context(),
             protocol=None,
             proxies: dict = {},
+            max_pending_invocations: int = MAX_PENDING_INVOCATIONS,
+            dispatcher: Optional[BaseDispatcher] = None,
+            stateful_reconnect: bool = False,
+            negotiate_cache: Optional[NegotiateCache] = None,
             **kwargs):
         self.preferred_protocol = preferred_protocol
         self.preferred_transport = preferred_transport
@@ -99,7 +108,13 @@ class BaseHubConnection(object):
         self.logger = Helpers.get_logger()
         self.handlers = defaultdict(list)
         self.stream_handlers = defaultdict(list)
+        self.pending_invocations = PendingInvocations(max_pending_invocations)
         self.skip_negotiation = skip_negotiation
+        self.stateful_reconnect = stateful_reconnect
+        self.negotiate_cache = negotiate_cache
+        self._negotiation: Optional[NegotiationHandler] = None
+        self.dispatcher = InlineDispatcher()\
+            if dispatcher is None else dispatcher
         self._callbacks = HubCallbacks()
 
     def _negotiate(self) -> NegotiateResponse:
@@ -114,9 +129,14 @@ class BaseHubConnection(object):
             self.headers,
             self.proxies,
             self.ssl_context,
-            self.skip_negotiation
+            self.skip_negotiation,
+            self.stateful_reconnect,
+            self.negotiate_cache,
+            self.preferred_transport not in (
+                None, HttpTransportType.web_sockets)
         )
 
+        self._negotiation = handler
         (url, headers, response) = handler.negotiate()
 
         self.url = url
@@ -137,6 +157,20 @@ class BaseHubConnection(object):
 
         self.logger.debug("Connection started")
 
+        self.transport = self._create_transport()
+
+        try:
+            return self.transport.start()
+        except Exception:
+            self._negotiation.invalidate()  # cached negotiation failed
+            raise
+
+    def _create_transport(self) -> BaseTransport:
+        """Negotiates with the server and builds the transport,
+        do not call it manually.
+        Returns:
+            BaseTransport: transport ready to be started.
+        """
         negotiate_response = self._negotiate()
 
         self.protocol = ProtocolFactory.create(
@@ -146,7 +180,7 @@ class BaseHubConnection(object):
             if self._selected_protocol is None else\
             self._selected_protocol
 
-        self.transport = TransportFactory.create(
+        return self.transport_factory.create(
             negotiate_response,
             self.preferred_transport,
             url=self.url,
@@ -157,15 +191,16 @@ class BaseHubConnection(object):
             connection_id=negotiate_response.get_id(),
             ssl_context=self.ssl_context,
             proxies=self.proxies,
-            on_close=self._callbacks.on_close,
+            on_close=self._on_close,
             on_open=self._callbacks.on_open,
             on_reconnect=self._callbacks.on_reconnect,
             on_message=self.on_message,
+            stateful_reconnect=self.stateful_reconnect
+            and negotiate_response.use_stateful_reconnect,
+            negotiate_cache=self.negotiate_cache,
             **self.kwargs
         )
 
-        return self.transport.start()
-
     def stop(self) -> None:
         """Stops the connection
 
@@ -176,6 +211,11 @@ class BaseHubConnection(object):
         if self.transport is not None:
             return self.transport.stop()
 
+    def _on_close(self):
+        self.pending_invocations.fail_all(
+            HubConnectionError("Connection closed"))
+        return self._callbacks.on_close()
+
     def on_close(self, callback) -> None:
         """Configures on_close connection callback.
             It will be raised on connection closed event
@@ -226,6 +266,40 @@ class BaseHubConnection(object):
         self.logger.debug("Handler registered started {0}".format(event))
         self.handlers[event].append(callback_function)
 
+    def on_latest(
+            self,
+            event: str,
+            callback_function: Callable[[List[Any]], None],
+            key: Optional[Callable[[List[Any]], Hashable]] = None,
+            min_interval: float = 0) -> LatestHandler:
+        """Register a callback that only receives the freshest
+        arguments of the event. Invocations received while the
+        callback is busy, or during min_interval, replace the pending
+        ones instead of being queued.
+
+            connection.on_latest(
+                "ReceivePrice",
+                lambda args: print(args),
+                key=lambda args: args[0],  # one value per symbol
+                min_interval=0.1)
+
+        Args:
+            event (string): Event name
+            callback_function (Function): callback function,
+                called on a worker thread of the subscription
+            key (Function, optional): extracts the coalescing key from
+                the arguments. Defaults to None, one value per event.
+            min_interval (float, optional): min seconds between two
+                calls with the same key. Defaults to 0.
+
+        Returns:
+            LatestHandler: subscription, unsubscribe it to stop it
+        """
+        handler = LatestHandler(
+            event, callback_function, key=key, min_interval=min_interval)
+        self.on(event, handler)
+        return handler
+
     def unsubscribe(self, event, callback_function: Callable) -> None:
         """Removes a callback from the specified event
         Args:
@@ -237,6 +311,9 @@ class BaseHubConnection(object):
 
         self.handlers[event].remove(callback_function)
 
+        if isinstance(callback_function, LatestHandler):
+            callback_function.close()
+
         if len(self.handlers[event]) == 0:
             del self.handlers[event]
 
@@ -265,10 +342,16 @@ class BaseHubConnection(object):
             method: str,
             arguments: Union[List, Subject],
             on_invocation: Optional[Callable[[List[CompletionMessage]], None]] = None,  # noqa: E501
-            invocation_id: Optional[str] = None)\
-            -> InvocationResult:
+            invocation_id: Optional[str] = None,
+            timeout: Optional[float] = None,
+            return_future: bool = False)\
+            -> Union[InvocationResult, Future]:
         """invokes a server function
 
+            future = connection.invoke(
+                "Add", [1, 2], timeout=10, return_future=True)
+            future.result()  # 3
+
         Args:
             method (string): Method name
             arguments (list|Subject): Method parameters
@@ -277,6 +360,12 @@ class BaseHubConnection(object):
             invocation_id (string, optional): Override invocation ID.
                 Exceptions thrown by the hub will use this ID,
                 making it easier to handle with the on_error call.
+            timeout (float, optional): Seconds until the returned future
+                fails with TimeoutError. Defaults to None, no timeout.
+            return_future (bool, optional): Returns a
+                concurrent.futures.Future resolved with the invocation
+                result instead of an InvocationResult. Hub errors are
+                raised as InvocationError. Defaults to False.
 
         Raises:
             HubConnectionError: If hub is not ready to send
@@ -292,7 +381,11 @@ class BaseHubConnection(object):
         if type(arguments) is not list and type(arguments) is not Subject:
             raise TypeError("Arguments of a message must be a list or subject")
 
+        if return_future and type(arguments) is Subject:
+            raise TypeError("Client streams can not return a future")
+
         result = InvocationResult(invocation_id)
+        future = None
 
         if type(arguments) is list:
             message = InvocationMessage(
@@ -307,7 +400,16 @@ class BaseHubConnection(object):
                         message.invocation_id,
                         on_invocation))
 
-            self.transport.send(message)
+            if return_future:
+                future = self.pending_invocations.add(
+                    message.invocation_id, timeout)
+
+            try:
+                self.transport.send(message)
+            except Exception as ex:
+                self.pending_invocations.remove(message.invocation_id)
+                raise ex
+
             result.message = message
 
         if type(arguments) is Subject:
@@ -317,7 +419,7 @@ class BaseHubConnection(object):
             result.invocation_id = arguments.invocation_id
             result.message = arguments
 
-        return result
+        return future if return_future else result
 
     def __on_invocation_message(self, message: InvocationMessage) -> None:  # 1
         message: InvocationMessage
@@ -328,7 +430,8 @@ class BaseHubConnection(object):
                 f"Event '{message.target}' hasn't fired any handler")
 
         for handler in fired_handlers:
-            handler(message.arguments)
+            self.dispatcher.dispatch(
+                message.target, handler, message.arguments)
 
     def __on_stream_item_message(
             self, message: StreamItemMessage) -> None:  # 2
@@ -341,9 +444,12 @@ class BaseHubConnection(object):
                     message.invocation_id))
 
         for handler in fired_handlers:
-            handler.next_callback(message.item)
+            self.dispatcher.dispatch(
+                message.invocation_id, handler.next_callback, message.item)
 
     def __on_completion_message(self, message: CompletionMessage) -> None:  # 3
+        self.pending_invocations.complete(message)
+
         if message.error is not None and len(message.error) > 0:
             self._callbacks.on_error(message)
         else:
@@ -354,7 +460,8 @@ class BaseHubConnection(object):
             # Stream callbacks
             for handler in fired_handlers:
                 handler: StreamHandler
-                handler.complete_callback(message)
+                self.dispatcher.dispatch(
+                    message.invocation_id, handler.complete_callback, message)
 
         # unregister handler
         if message.invocation_id in self.stream_handlers:
@@ -375,7 +482,8 @@ class BaseHubConnection(object):
                     message.invocation_id))
 
         for handler in fired_handlers:
-            handler.error_callback(message)
+            self.dispatcher.dispatch(
+                message.invocation_id, handler.error_callback, message)
 
         # unregister handler
         if message.invocation_id in self.stream_handlers:
@@ -384,6 +492,7 @@ class BaseHubConnection(object):
     def __on_ping_message(
             self, message: PingMessage) -> None:  # 6
         self.logger.debug(f"Ping message {message}")
+        self.pending_invocations.expire()
 
     def __on_close_message(
             self, message: CloseMessage) -> None:  # 6
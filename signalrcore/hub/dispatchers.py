@@ -0,0 +1,192 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Optional, Tuple
+from ..helpers import Helpers
+
+THREAD_NAME_PREFIX = "Signalrcore dispatcher"
+
+
+class DispatchMetrics(object):
+    """Counters about the callbacks run by a dispatcher.
+    pending is the number of callbacks waiting to run, depths
+    the pending callbacks of each key (target or invocation id).
+    """
+    def __init__(self):
+        self.dispatched = 0
+        self.completed = 0
+        self.errors = 0
+        self.max_pending = 0
+        self.depths: Dict[str, int] = {}
+
+    @property
+    def pending(self) -> int:
+        return self.dispatched - self.completed
+
+    def __repr__(self):
+        return "DispatchMetrics: dispatched {0}, completed {1}, "\
+            "errors {2}, pending {3}, max pending {4}".format(
+                self.dispatched,
+                self.completed,
+                self.errors,
+                self.pending,
+                self.max_pending)
+
+
+class BaseDispatcher(object):
+    """Runs hub handlers. Callbacks are dispatched with a key,
+    the target name of invocations or the invocation id of streams,
+    dispatchers that keep order do it per key.
+    """
+    def __init__(self):
+        self.logger = Helpers.get_logger()
+        self.metrics = DispatchMetrics()
+        self._lock = threading.Lock()
+
+    def dispatch(self, key: str, callback: Callable, *args) -> None:
+        raise NotImplementedError(
+            "Dispatcher must implement this method")  # pragma: no cover
+
+    def queue_depth(self, key: Optional[str] = None) -> int:
+        """Callbacks waiting to run, for a key or in total"""
+        with self._lock:
+            return self.metrics.pending\
+                if key is None else\
+                self.metrics.depths.get(key, 0)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Releases dispatcher resources, pending callbacks run
+        if wait is True"""
+        pass
+
+    def _enqueued(self, key: str):
+        with self._lock:
+            metrics = self.metrics
+            metrics.dispatched += 1
+            metrics.depths[key] = metrics.depths.get(key, 0) + 1
+            metrics.max_pending = max(metrics.max_pending, metrics.pending)
+
+    def _run(self, key: str, callback: Callable, args: tuple):
+        try:
+            callback(*args)
+        except Exception as ex:
+            with self._lock:
+                self.metrics.errors += 1
+            self.logger.error(f"Handler of '{key}' failed: {ex}")
+        finally:
+            self._done(key)
+
+    def _done(self, key: str):
+        with self._lock:
+            metrics = self.metrics
+            metrics.completed += 1
+            depth = metrics.depths.get(key, 1) - 1
+            if depth > 0:
+                metrics.depths[key] = depth
+            else:
+                metrics.depths.pop(key, None)
+
+
+class InlineDispatcher(BaseDispatcher):
+    """Runs handlers on the receive thread, a slow handler delays every
+    message of the connection and its errors reach the receive loop.
+    Default dispatcher."""
+    def dispatch(self, key: str, callback: Callable, *args) -> None:
+        self._enqueued(key)
+        try:
+            callback(*args)
+        finally:
+            self._done(key)
+
+
+class ThreadPoolDispatcher(BaseDispatcher):
+    """Runs handlers on a thread pool, without any order guarantee
+
+    Args:
+        max_workers (int, optional): Threads of the pool.
+            Defaults to None, ThreadPoolExecutor default.
+    """
+    def __init__(self, max_workers: Optional[int] = None):
+        super(ThreadPoolDispatcher, self).__init__()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=THREAD_NAME_PREFIX)
+
+    def dispatch(self, key: str, callback: Callable, *args) -> None:
+        self._enqueued(key)
+        self.executor.submit(self._run, key, callback, args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
+
+
+class SerializedDispatcher(ThreadPoolDispatcher):
+    """Runs handlers on a thread pool keeping the order of each key:
+    callbacks of a target run one after another, different targets
+    run in parallel.
+
+    Args:
+        max_workers (int, optional): Threads of the pool.
+            Defaults to None, ThreadPoolExecutor default.
+    """
+    def __init__(self, max_workers: Optional[int] = None):
+        super(SerializedDispatcher, self).__init__(max_workers)
+        self._queues: Dict[str, Deque[Tuple[Callable, tuple]]] = {}
+
+    def dispatch(self, key: str, callback: Callable, *args) -> None:
+        self._enqueued(key)
+        with self._lock:
+            queue = self._queues.get(key, None)
+            is_running = queue is not None
+            if not is_running:
+                queue = self._queues[key] = deque()
+            queue.append((callback, args))
+
+        if not is_running:
+            self.executor.submit(self._drain, key)
+
+    def _drain(self, key: str):
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if len(queue) == 0:
+                    del self._queues[key]
+                    return
+                callback, args = queue.popleft()
+            self._run(key, callback, args)
+
+
+class AsyncioDispatcher(BaseDispatcher):
+    """Runs handlers on an asyncio event loop, in order.
+    Coroutine functions are scheduled as tasks.
+
+    Args:
+        loop (asyncio.AbstractEventLoop, optional): Loop running the
+            handlers. Defaults to None, the loop of the AIO connection
+            start.
+    """
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        super(AsyncioDispatcher, self).__init__()
+        self.loop = loop
+
+    def dispatch(self, key: str, callback: Callable, *args) -> None:
+        if self.loop is None:
+            raise RuntimeError("AsyncioDispatcher has not event loop")
+        self._enqueued(key)
+        self.loop.call_soon_threadsafe(self._run, key, callback, args)
+
+    def _run(self, key: str, callback: Callable, args: tuple):
+        if not asyncio.iscoroutinefunction(callback):
+            return super(AsyncioDispatcher, self)._run(key, callback, args)
+
+        task = self.loop.create_task(callback(*args))
+        task.add_done_callback(lambda t: self._task_done(key, t))
+
+    def _task_done(self, key: str, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            with self._lock:
+                self.metrics.errors += 1
+            self.logger.error(
+                f"Handler of '{key}' failed: {task.exception()}")
+        self._done(key)
@@ -10,3 +10,14 @@ class HubConnectionError(ValueError):
     """Hub connection error
     """
     pass
+
+
+class InvocationError(HubError):
+    """Hub method invocation completed with an error
+
+    Args:
+        message (CompletionMessage): completion message with the error
+    """
+    def __init__(self, message):
+        self.message = message
+        super().__init__(message.error)
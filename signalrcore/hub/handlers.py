@@ -1,4 +1,7 @@
-from typing import Callable
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 from ..helpers import Helpers
 
 
@@ -49,3 +52,112 @@ class InvocationHandler(object):
     def __init__(self, invocation_id: str, complete_callback: Callable):
         self.invocation_id = invocation_id
         self.complete_callback = complete_callback
+
+
+class LatestMetrics(object):
+    """Counters of a :class:`LatestHandler`"""
+    def __init__(self):
+        self.received = 0
+        self.delivered = 0
+        self.coalesced = 0
+
+    def __repr__(self):
+        return "LatestMetrics: received {0}, delivered {1}, "\
+            "coalesced {2}".format(
+                self.received, self.delivered, self.coalesced)
+
+
+class LatestHandler(object):
+    """Hub handler that only delivers the freshest arguments.
+    Invocations are kept per key (one key per target by default),
+    a value received while the previous one is still waiting replaces
+    it. A worker thread calls the callback, at most once every
+    min_interval seconds per key.
+    """
+    IDLE_TIMEOUT = 1  # seconds without values before the worker exits
+
+    def __init__(
+            self,
+            event: str,
+            callback: Callable[[List[Any]], None],
+            key: Optional[Callable[[List[Any]], Hashable]] = None,
+            min_interval: float = 0):
+        self.event = event
+        self.callback = callback
+        self.key = key
+        self.min_interval = min_interval
+        self.metrics = LatestMetrics()
+        self.logger = Helpers.get_logger()
+        self._latest: "OrderedDict[Hashable, List[Any]]" = OrderedDict()
+        self._next_delivery: Dict[Hashable, float] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def __call__(self, arguments: List[Any]):
+        key = self.key(arguments) if self.key is not None else None
+
+        with self._condition:
+            if self._closed:
+                return
+            self.metrics.received += 1
+            if key in self._latest:
+                self.metrics.coalesced += 1
+            self._latest[key] = arguments
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"Signalrcore latest {self.event}")
+                self._thread.daemon = True
+                self._thread.start()
+            else:
+                self._condition.notify()
+
+    def pending(self) -> int:
+        return len(self._latest)
+
+    def close(self):
+        """Drops pending values and stops the worker"""
+        with self._condition:
+            self._closed = True
+            self._latest.clear()
+            self._condition.notify()
+
+    def _next(self) -> Optional[Tuple[Hashable, List[Any]]]:
+        with self._condition:
+            idle_since = time.monotonic()
+            while True:
+                now = time.monotonic()
+                wait = None
+
+                for key in self._latest:
+                    delay = self._next_delivery.get(key, now) - now
+                    if delay <= 0:
+                        if self.min_interval > 0:
+                            self._next_delivery[key] =\
+                                now + self.min_interval
+                        return key, self._latest.pop(key)
+                    wait = delay if wait is None else min(wait, delay)
+
+                if wait is None:
+                    wait = self.IDLE_TIMEOUT - (now - idle_since)
+                    if self._closed or wait <= 0:
+                        self._thread = None
+                        self._next_delivery.clear()
+                        return None
+
+                self._condition.wait(wait)
+
+    def _run(self):
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            _, arguments = item
+            try:
+                self.callback(arguments)
+            except Exception as ex:
+                self.logger.error(
+                    f"Latest handler of '{self.event}' failed: {ex}")
+            self.metrics.delivered += 1
@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Tuple
+from .errors import InvocationError, HubConnectionError
+from ..messages.completion_message import CompletionMessage
+
+MAX_PENDING_INVOCATIONS = 1000
+
+
+class PendingInvocations(object):
+    """Futures of invocations waiting for their completion message,
+    indexed by invocation id. The table is bounded: once full, the
+    oldest invocation fails to make room for the new one. Invocations
+    with a timeout fail with TimeoutError once it expires, expired
+    entries are swept on every add, completion and server ping.
+    """
+    def __init__(self, max_pending: int = MAX_PENDING_INVOCATIONS):
+        self.max_pending = max_pending
+        self._pending: "OrderedDict[str, Tuple[Future, Optional[float]]]"\
+            = OrderedDict()
+        self._next_deadline: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __contains__(self, invocation_id: str) -> bool:
+        return invocation_id in self._pending
+
+    def add(
+            self,
+            invocation_id: str,
+            timeout: Optional[float] = None) -> Future:
+        future = Future()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._lock:
+            evicted = self._pending.popitem(last=False)[1][0]\
+                if len(self._pending) >= self.max_pending else None
+
+            self._pending[invocation_id] = (future, deadline)
+
+            if deadline is not None and (
+                    self._next_deadline is None
+                    or deadline < self._next_deadline):
+                self._next_deadline = deadline
+
+        if evicted is not None:
+            self._fail(evicted, HubConnectionError(
+                "Too many pending invocations, "
+                f"max {self.max_pending} reached"))
+
+        self.expire()
+        return future
+
+    def complete(self, message: CompletionMessage) -> bool:
+        """Resolves the future of a completion message
+
+        Returns:
+            bool: True if the invocation was pending
+        """
+        with self._lock:
+            entry = self._pending.pop(message.invocation_id, None)
+
+        if entry is not None:
+            future, _ = entry
+            if message.error is not None and len(message.error) > 0:
+                self._fail(future, InvocationError(message))
+            elif not future.done():
+                future.set_result(message.result)
+
+        self.expire()
+        return entry is not None
+
+    def remove(self, invocation_id: str) -> None:
+        with self._lock:
+            self._pending.pop(invocation_id, None)
+
+    def expire(self) -> None:
+        now = time.monotonic()
+
+        if self._next_deadline is None or now < self._next_deadline:
+            return
+
+        expired = []
+        with self._lock:
+            self._next_deadline = None
+            for invocation_id, (future, deadline) in\
+                    list(self._pending.items()):
+                if deadline is None:
+                    continue
+                if deadline <= now:
+                    expired.append(future)
+                    del self._pending[invocation_id]
+                elif self._next_deadline is None\
+                        or deadline < self._next_deadline:
+                    self._next_deadline = deadline
+
+        for future in expired:
+            self._fail(future, TimeoutError("Invocation timed out"))
+
+    def fail_all(self, error: Exception) -> None:
+        with self._lock:
+            futures = [future for future, _ in self._pending.values()]
+            self._pending.clear()
+            self._next_deadline = None
+
+        for future in futures:
+            self._fail(future, error)
+
+    def _fail(self, future: Future, error: Exception):
+        if not future.done():
+            future.set_exception(error)
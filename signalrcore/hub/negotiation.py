@@ -1,8 +1,12 @@
 import copy
 import base64
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from ..helpers import Helpers, RequestHelpers
 from .errors import UnAuthorizedHubError, HubError
 from ..types import HttpTransportType, HubProtocolEncoding, DEFAULT_ENCODING
@@ -48,6 +52,7 @@ class BaseResponse(object):
     connection_id: str
     access_token: str
     available_transports: List[AvailableTransport]
+    use_stateful_reconnect = False
 
     def get_id(self) -> str:
         if self.negotiate_version == 0:
@@ -114,6 +119,7 @@ class NegotiateResponse(BaseResponse):
     access_token: str
     url: str
     available_transports: List[AvailableTransport]
+    use_stateful_reconnect: bool = False
 
     @classmethod
     def from_dict(cls, data: dict) -> "NegotiateResponse":
@@ -148,48 +154,244 @@ class NegotiateResponse(BaseResponse):
             connection_id=connection_id,
             available_transports=parsed_transports,
             access_token=access_token,
-            url=url
+            url=url,
+            use_stateful_reconnect=data.get(
+                "useStatefulReconnect", False) is True
         )
 
 
+@dataclass(frozen=True)
+class NegotiateCacheEntry:
+    url: str
+    headers: dict
+    response: BaseResponse
+    expires: float
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """Expiration (exp claim) of a JWT access token, None if the token
+    is not a JWT. The signature is not checked, only used to avoid
+    reusing expired tokens."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if type(exp) in (int, float) else None
+    except Exception:
+        return None
+
+
+class NegotiateCache(object):
+    """Negotiate responses keyed by hub url (without connection id) and
+    Authorization header, shared by the connections of the same hub so
+    reconnections (and new connections) skip the negotiate request
+    while the entry is alive.
+
+    Azure SignalR redirections (url and access token) are reused as
+    they are, until the ttl or the access token expires. ASP.NET
+    responses carry a connection token valid for a single connection,
+    only transports and protocols are reused: websockets connections
+    start without connection token, as with skip_negotiation. A new
+    negotiation is done when a connection token is required (server
+    sent events, long polling and stateful reconnect).
+
+    Args:
+        ttl (float, optional): seconds an entry is reused. Defaults
+            to 60.
+        max_entries (int, optional): entries kept, least recently used
+            are dropped. Defaults to 256.
+    """
+    token_expiry_margin = 30  # seconds, access tokens renewed before
+
+    def __init__(self, ttl: float = 60, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, NegotiateCacheEntry]" =\
+            OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(url: str, headers: Optional[dict]) -> Tuple:
+        authorization = None if headers is None else\
+            headers.get("Authorization", None)
+        negotiate_url = Helpers.get_negotiate_url(
+            Helpers.remove_connection_id(url))
+        return negotiate_url, authorization
+
+    def get(
+            self,
+            url: str,
+            headers: Optional[dict]) -> Optional[NegotiateCacheEntry]:
+        key = self.get_key(url, headers)
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None and entry.expires <= time.time():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(
+            self,
+            url: str,
+            headers: Optional[dict],
+            negotiated_url: str,
+            negotiated_headers: dict,
+            response: BaseResponse):
+        expires = time.time() + self.ttl
+
+        if type(response) is AzureResponse:
+            token_expires = token_expiry(response.access_token)
+            if token_expires is not None:
+                expires = min(
+                    expires, token_expires - self.token_expiry_margin)
+
+        entry = NegotiateCacheEntry(
+            url=negotiated_url,
+            headers=copy.deepcopy(negotiated_headers),
+            response=response,
+            expires=expires)
+
+        key = self.get_key(url, headers)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str, headers: Optional[dict]):
+        with self._lock:
+            self._entries.pop(self.get_key(url, headers), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def skip_negotiation_response(
+        url: str,
+        available_transports: List[AvailableTransport])\
+        -> NegotiateResponse:
+    """Response used when connecting without negotiate request, the
+    server assigns the connection id"""
+    key = base64.b64encode(os.urandom(16)).decode(DEFAULT_ENCODING)
+    return NegotiateResponse(
+        negotiate_version=0,
+        connection_id=key,
+        access_token=None,
+        url=url,
+        available_transports=available_transports
+    )
+
+
 class NegotiationHandler(object):
+    """Negotiates the connection with the server
+
+    Args:
+        url (str): hub url
+        headers (dict): request headers
+        proxies (dict): http proxies
+        ssl_context (ssl.SSLContext): context of https requests
+        skip_negotiation (bool): connect without negotiating,
+            websockets only
+        stateful_reconnect (bool, optional): asks the server for
+            stateful reconnect. Defaults to False.
+        cache (NegotiateCache, optional): reuses previous negotiations.
+            Defaults to None, always negotiates.
+        require_connection_token (bool, optional): the transport needs a
+            connection token, cached ASP.NET negotiations are not
+            reused. Defaults to True.
+    """
     def __init__(
             self,
             url,
             headers,
             proxies,
             ssl_context,
-            skip_negotiation):
+            skip_negotiation,
+            stateful_reconnect: bool = False,
+            cache: Optional[NegotiateCache] = None,
+            require_connection_token: bool = True):
         self.logger = Helpers.get_logger()
         self.url = url
         self.headers = headers
         self.proxies = proxies
         self.ssl_context = ssl_context
         self.skip_negotiation = skip_negotiation
+        self.stateful_reconnect = stateful_reconnect
+        self.cache = cache
+        self.require_connection_token = require_connection_token\
+            or stateful_reconnect
 
     def negotiate(self) -> Tuple[str, dict, NegotiateResponse]:
         if self.skip_negotiation:
-            key = base64.b64encode(os.urandom(16)).decode(DEFAULT_ENCODING)
-            return self.url, self.headers, NegotiateResponse(
-                negotiate_version=0,
-                connection_id=key,
-                access_token=None,
-                url=self.url,
-                available_transports=[
+            return self.url, self.headers, skip_negotiation_response(
+                self.url,
+                [
                     AvailableTransport(
                         HttpTransportType.web_sockets,
                         transfer_formats=[
                             HubProtocolEncoding.text,
                             HubProtocolEncoding.binary]
                     )
-                ]
-            )
+                ])
+
+        if self.cache is not None:
+            cached = self._from_cache()
+            if cached is not None:
+                return cached
+
+        url, headers, response = self._negotiate()
+
+        if self.cache is not None:
+            self.cache.put(self.url, self.headers, url, headers, response)
+
+        return url, headers, response
+
+    def invalidate(self):
+        """Drops the cached negotiation, i.e. connection failed with it"""
+        if self.cache is not None:
+            self.cache.invalidate(self.url, self.headers)
+
+    def _from_cache(self) -> Optional[Tuple[str, dict, NegotiateResponse]]:
+        entry = self.cache.get(self.url, self.headers)
+
+        if entry is None:
+            return None
+
+        if type(entry.response) is AzureResponse:
+            self.logger.debug(f"Negotiate cached, redirect to {entry.url}")
+            return entry.url, copy.deepcopy(entry.headers), entry.response
+
+        transports = [
+            transport
+            for transport in entry.response.available_transports
+            if transport.transport is HttpTransportType.web_sockets
+        ]
+
+        if self.require_connection_token or len(transports) == 0:
+            return None
+
+        url = Helpers.remove_connection_id(entry.url)
+        self.logger.debug(f"Negotiate cached, connecting to {url}")
+        response = skip_negotiation_response(url, transports)
+        return url, copy.deepcopy(entry.headers), response
+
+    def _negotiate(self) -> Tuple[str, dict, NegotiateResponse]:
         url = self.url
         headers = copy.deepcopy(self.headers)
         headers.update({'Content-Type': 'application/json'})
 
         negotiate_url = Helpers.get_negotiate_url(self.url)
 
+        if self.stateful_reconnect:
+            negotiate_url += "&" if "?" in negotiate_url else "?"
+            negotiate_url += "useStatefulReconnect=true"
+
         self.logger.debug("Negotiate url:{0}".format(negotiate_url))
 
         response = RequestHelpers.post(
@@ -1,10 +1,17 @@
 import ssl
+from typing import Optional, Union
 from .hub.base_hub_connection import BaseHubConnection
 from .hub.auth_hub_connection import AuthHubConnection
+from .hub.invocations import MAX_PENDING_INVOCATIONS
+from .hub.negotiation import NegotiateCache
+from .hub.dispatchers import BaseDispatcher, InlineDispatcher, \
+    ThreadPoolDispatcher, SerializedDispatcher, AsyncioDispatcher
 from .transport.reconnection import \
-    IntervalReconnectionHandler, RawReconnectionHandler, ReconnectionType
+    IntervalReconnectionHandler, RawReconnectionHandler, ReconnectionType, \
+    ExponentialReconnectionHandler, JitterType
 from .helpers import Helpers
-from .types import HttpTransportType, HubProtocolEncoding
+from .types import HttpTransportType, HubProtocolEncoding, DispatchMode, \
+    OverflowPolicy
 from .protocol.protocol_factory import BaseHubProtocol
 from .transport.sockets.utils import create_ssl_context
 
@@ -33,11 +40,22 @@ class HubConnectionBuilder(object):
 
         self.reconnection_handler = None
         self.keep_alive_interval = 15
+        self.server_timeout = None  # server timeout detection disabled
+        self.stateful_reconnect = False
+        self.stateful_reconnect_buffer_size = 100 * 1024
+        self.negotiate_cache = None  # negotiates on every connection
 
         self.ssl_context = ssl.create_default_context()
         self.enable_trace = False  # socket trace
         self.skip_negotiation = False  # By default do not skip negotiation
         self.proxies = dict()
+        self.max_message_size = None  # unbounded
+        self.max_batch_bytes = None  # send batching disabled
+        self.max_linger = 0
+        self.max_pending_invocations = MAX_PENDING_INVOCATIONS
+        self.dispatcher = None  # handlers run on the receive thread
+        self.max_inbound_messages = None  # inbound queue disabled
+        self.overflow_policy = OverflowPolicy.block
         self.logger = Helpers.get_logger()
 
     def with_url(
@@ -131,6 +149,21 @@ class HubConnectionBuilder(object):
                     raise TypeError("headers must be a Dict[str, str]")
                 self.headers.update(value)
 
+            if "max_message_size" in options.keys():
+                value = options.get("max_message_size", None)
+                if value is not None\
+                        and (type(value) is not int or value <= 0):
+                    raise TypeError(
+                        "max_message_size must be a positive int")
+                self.max_message_size = value
+
+            if "max_pending_invocations" in options.keys():
+                value = options.get("max_pending_invocations", None)
+                if type(value) is not int or value <= 0:
+                    raise TypeError(
+                        "max_pending_invocations must be a positive int")
+                self.max_pending_invocations = value
+
             if "access_token_factory" in options.keys():
                 auth_function = options.get("access_token_factory", None)
                 if auth_function is None\
@@ -184,6 +217,228 @@ class HubConnectionBuilder(object):
         self.proxies = proxies
         return self
 
+    def with_server_timeout(self, server_timeout: float = 30):
+        """Closes the connection if nothing is received from the server
+        in server_timeout seconds, the automatic reconnection (if
+        configured) starts right away instead of waiting for the OS to
+        notice a dead connection. Servers ping every 15 seconds by
+        default, use at least twice the server keep alive interval.
+
+            HubConnectionBuilder()\
+                .with_url(server_url)\
+                .with_server_timeout(30)\
+                .build()
+
+        Args:
+            server_timeout (float, optional): seconds without server
+                messages. Defaults to 30, as ASP.NET clients.
+
+        Raises:
+            ValueError: if server_timeout is not a positive number
+
+        Returns:
+            [HubConnectionBuilder]: self object for fluent interface purposes
+        """
+        if type(server_timeout) not in (int, float) or server_timeout <= 0:
+            raise ValueError("server_timeout must be a positive number")
+
+        self.server_timeout = server_timeout
+        return self
+
+    def with_stateful_reconnect(self, buffer_size: int = 100 * 1024):
+        """Enables ASP.NET Core stateful reconnect (server must allow it,
+        websockets transport only). When the socket drops, the client
+        reconnects to the same server connection and both sides send
+        again the messages not acknowledged, so short network failures
+        do not lose hub messages.
+
+            HubConnectionBuilder()\
+                .with_url(server_url)\
+                .with_stateful_reconnect()\
+                .with_automatic_reconnect({"type": "raw"})\
+                .build()
+
+        Args:
+            buffer_size (int, optional): bytes of sent messages kept
+                until the server acknowledges them, sends wait for acks
+                once reached. Defaults to 100KB.
+
+        Raises:
+            ValueError: if buffer_size is not a positive int
+
+        Returns:
+            [HubConnectionBuilder]: self object for fluent interface purposes
+        """
+        if type(buffer_size) is not int or buffer_size <= 0:
+            raise ValueError("buffer_size must be a positive int")
+
+        self.stateful_reconnect = True
+        self.stateful_reconnect_buffer_size = buffer_size
+        return self
+
+    def with_negotiate_cache(
+            self,
+            ttl: float = 60,
+            cache: Optional[NegotiateCache] = None):
+        """Reuses negotiations during ttl seconds, reconnections (and
+        connections sharing the cache) skip the negotiate request.
+        Azure SignalR redirections are reused until the access token
+        expires. ASP.NET connection tokens are never reused, websockets
+        connections start without one (as skip_negotiation does), other
+        transports and stateful reconnect negotiate again. If the
+        connection fails the entry is dropped.
+
+            cache = NegotiateCache(ttl=60)
+            HubConnectionBuilder()\
+                .with_url(server_url)\
+                .with_negotiate_cache(cache=cache)\
+                .build()
+
+        Args:
+            ttl (float, optional): seconds a negotiation is reused.
+                Defaults to 60.
+            cache (NegotiateCache, optional): cache shared with other
+                connections. Defaults to None, a new cache.
+
+        Raises:
+            ValueError: if ttl is not a positive number
+
+        Returns:
+            [HubConnectionBuilder]: self object for fluent interface purposes
+        """
+        if cache is None:
+            if type(ttl) not in (int, float) or ttl <= 0:
+                raise ValueError("ttl must be a positive number")
+            cache = NegotiateCache(ttl)
+
+        self.negotiate_cache = cache
+        return self
+
+    def with_send_batching(
+            self,
+            max_batch_bytes: int = 64 * 1024,
+            max_linger: float = 0):
+        """Sends messages through an outbound queue drained by a writer
+        thread, that coalesces queued messages in a single websocket
+        frame or http request. invoke returns once the message is queued.
+
+            HubConnectionBuilder()\
+                .with_url(server_url)\
+                .with_send_batching(max_batch_bytes=32768, max_linger=0.005)\
+                .build()
+
+        Args:
+            max_batch_bytes (int, optional): max size of a batch,
+                a single bigger message is sent alone. Defaults to 64KB.
+            max_linger (float, optional): seconds the writer waits
+                for more messages before sending a batch. Defaults to 0.
+
+        Raises:
+            ValueError: if max_batch_bytes or max_linger are not valid
+
+        Returns:
+            [HubConnectionBuilder]: self object for fluent interface purposes
+        """
+        if type(max_batch_bytes) is not int or max_batch_bytes <= 0:
+            raise ValueError("max_batch_bytes must be a positive int")
+
+        if max_linger is None or max_linger < 0:
+            raise ValueError("max_linger must be a positive number")
+
+        self.max_batch_bytes = max_batch_bytes
+        self.max_linger = max_linger
+        return self
+
+    def with_inbound_queue(
+            self,
+            max_size: int = 1000,
+            policy: OverflowPolicy = OverflowPolicy.block):
+        """Queues received messages between the transport and the hub,
+        a reader thread hands them to the hub so the socket keeps being
+        drained while handlers run. Once max_size messages are queued
+        the policy applies to invocation messages; completions, stream
+        items and other messages are never dropped.
+
+            from signalrcore.types import OverflowPolicy
+
+            HubConnectionBuilder()\
+                .with_url(server_url)\
+                .with_inbound_queue(
+                    max_size=5000,
+                    policy=OverflowPolicy.coalesce_latest)\
+                .build()
+
+        Args:
+            max_size (int, optional): queued messages before the
+                overflow policy applies. Defaults to 1000.
+            policy (OverflowPolicy, optional): block (receive loop
+                waits), drop_oldest, drop_newest or coalesce_latest
+                (replaces the queued invocation of the same target).
+                Defaults to OverflowPolicy.block.
+
+        Raises:
+            ValueError: if max_size is not a positive int
+            TypeError: if policy is not an OverflowPolicy
+
+        Returns:
+            [HubConnectionBuilder]: self object for fluent interface purposes
+        """
+        if type(max_size) is not int or max_size <= 0:
+            raise ValueError("max_size must be a positive int")
+
+        if type(policy) is not OverflowPolicy:
+            raise TypeError(f"Wrong overflow policy type {type(policy)}")
+
+        self.max_inbound_messages = max_size
+        self.overflow_policy = policy
+        return self
+
+    def with_dispatcher(
+            self,
+            dispatcher: Union[BaseDispatcher, DispatchMode],
+            max_workers: Optional[int] = None):
+        """Configures where hub handlers run. By default they run on
+        the receive thread, so a slow handler stalls reads, keep alive
+        and stream items of the connection.
+
+            from signalrcore.types import DispatchMode
+
+            HubConnectionBuilder()\
+                .with_url(server_url)\
+                .with_dispatcher(DispatchMode.serialized, max_workers=4)\
+                .build()
+
+        Args:
+            dispatcher (BaseDispatcher|DispatchMode): dispatcher instance
+                or mode: inline, thread_pool (no order guarantee),
+                serialized (ordered per target, targets in parallel)
+                or asyncio (event loop of the AIO connection).
+            max_workers (int, optional): threads of thread_pool and
+                serialized modes. Defaults to None.
+
+        Raises:
+            TypeError: if dispatcher is not a dispatcher or DispatchMode
+
+        Returns:
+            [HubConnectionBuilder]: self object for fluent interface purposes
+        """
+        if isinstance(dispatcher, BaseDispatcher):
+            self.dispatcher = dispatcher
+            return self
+
+        if type(dispatcher) is not DispatchMode:
+            raise TypeError(f"Wrong dispatcher type {type(dispatcher)}")
+
+        if dispatcher is DispatchMode.inline:
+            self.dispatcher = InlineDispatcher()
+        elif dispatcher is DispatchMode.thread_pool:
+            self.dispatcher = ThreadPoolDispatcher(max_workers)
+        elif dispatcher is DispatchMode.serialized:
+            self.dispatcher = SerializedDispatcher(max_workers)
+        else:
+            self.dispatcher = AsyncioDispatcher()
+        return self
+
     def with_hub_protocol(self, protocol):
         """Changes transport protocol
             from signalrcore.types\
@@ -215,6 +470,31 @@ class HubConnectionBuilder(object):
 
         raise TypeError(f"Wrong protocol type {type(protocol)}")
 
+    def _get_connection_kwargs(self) -> dict:
+        return dict(
+            url=self.hub_url,
+            protocol=self.protocol,
+            preferred_protocol=self.preferred_protocol,
+            keep_alive_interval=self.keep_alive_interval,
+            server_timeout=self.server_timeout,
+            stateful_reconnect=self.stateful_reconnect,
+            stateful_reconnect_buffer_size=self.stateful_reconnect_buffer_size,
+            negotiate_cache=self.negotiate_cache,
+            reconnection_handler=self.reconnection_handler,
+            headers=self.headers,
+            ssl_context=self.ssl_context,
+            proxies=self.proxies,
+            skip_negotiation=self.skip_negotiation,
+            enable_trace=self.enable_trace,
+            preferred_transport=self.preferred_transport,
+            max_message_size=self.max_message_size,
+            max_batch_bytes=self.max_batch_bytes,
+            max_linger=self.max_linger,
+            max_inbound_messages=self.max_inbound_messages,
+            overflow_policy=self.overflow_policy,
+            max_pending_invocations=self.max_pending_invocations,
+            dispatcher=self.dispatcher)
+
     def build(self):
         """Creates the connection hub
 
@@ -222,31 +502,10 @@ class HubConnectionBuilder(object):
             [BaseHubConnection]: [connection SignalR object]
         """
         return AuthHubConnection(
-                headers=self.headers,
                 auth_function=self.auth_function,
-                url=self.hub_url,
-                protocol=self.protocol,
-                preferred_protocol=self.preferred_protocol,
-                keep_alive_interval=self.keep_alive_interval,
-                reconnection_handler=self.reconnection_handler,
-                ssl_context=self.ssl_context,
-                proxies=self.proxies,
-                skip_negotiation=self.skip_negotiation,
-                enable_trace=self.enable_trace,
-                preferred_transport=self.preferred_transport)\
+                **self._get_connection_kwargs())\
             if self.has_auth_configured else\
-            BaseHubConnection(
-                url=self.hub_url,
-                protocol=self.protocol,
-                preferred_protocol=self.preferred_protocol,
-                keep_alive_interval=self.keep_alive_interval,
-                reconnection_handler=self.reconnection_handler,
-                headers=self.headers,
-                ssl_context=self.ssl_context,
-                proxies=self.proxies,
-                skip_negotiation=self.skip_negotiation,
-                enable_trace=self.enable_trace,
-                preferred_transport=self.preferred_transport)
+            BaseHubConnection(**self._get_connection_kwargs())
 
     def with_automatic_reconnect(self, data: dict):
         """Configures automatic reconnection
@@ -265,6 +524,11 @@ class HubConnectionBuilder(object):
 
         Args:
             data (dict): [dict with automatic reconnection parameters]
+                type "raw": reconnect_interval, max_attempts
+                type "interval": intervals
+                type "exponential": base_interval, max_interval,
+                    max_attempts, jitter ("none", "full" or
+                    "decorrelated")
 
         Returns:
             [HubConnectionBuilder]: [self object for fluent interface purposes]
@@ -294,4 +558,11 @@ class HubConnectionBuilder(object):
             self.reconnection_handler = IntervalReconnectionHandler(
                 intervals
             )
+        if reconnection_type == ReconnectionType.exponential:
+            self.reconnection_handler = ExponentialReconnectionHandler(
+                data.get("base_interval", 1),
+                data.get("max_interval", 60),
+                max_attempts,
+                JitterType[data.get("jitter", "full")]
+            )
         return self
@@ -15,6 +15,48 @@ from ..messages.sequence_message import SequenceMessage  # 9
 from ..messages.message_type import MessageType
 
 
+def _headers(d: dict) -> dict:
+    return d.get("headers", {})
+
+
+MESSAGE_BUILDERS = {
+    MessageType.invocation.value: lambda d: InvocationMessage(
+        d.get("invocationId", None),
+        d["target"],
+        d["arguments"],
+        headers=_headers(d)),
+    MessageType.stream_item.value: lambda d: StreamItemMessage(
+        d.get("invocationId", None),
+        d.get("item", None),
+        headers=_headers(d)),
+    MessageType.completion.value: lambda d: CompletionMessage(
+        d.get("invocationId", None),
+        d.get("result", None),
+        d.get("error", None),
+        headers=_headers(d)),
+    MessageType.stream_invocation.value: lambda d: StreamInvocationMessage(
+        d.get("invocationId", None),
+        d["target"],
+        d["arguments"],
+        stream_ids=d.get("streamIds", []),
+        headers=_headers(d)),
+    MessageType.cancel_invocation.value: lambda d: CancelInvocationMessage(
+        d.get("invocationId", None),
+        headers=_headers(d)),
+    MessageType.ping.value: lambda d: PingMessage(),
+    MessageType.close.value: lambda d: CloseMessage(
+        d.get("error", None),
+        d.get("allowReconnect", None),
+        headers=_headers(d)),
+    MessageType.ack.value: lambda d: AckMessage(
+        d.get("sequenceId", None),
+        headers=_headers(d)),
+    MessageType.sequence.value: lambda d: SequenceMessage(
+        d.get("sequenceId", None),
+        headers=_headers(d)),
+}
+
+
 class BaseHubProtocol(object):
     def __init__(
             self,
@@ -29,39 +71,24 @@ class BaseHubProtocol(object):
         self.logger = Helpers.get_logger()
 
     @staticmethod
-    def get_message(dict_message):
-        message_type = MessageType.ping\
-            if "type" not in dict_message.keys() else\
-            MessageType(dict_message["type"])
-
-        dict_message["invocation_id"] = dict_message.get("invocationId", None)
-        dict_message["headers"] = dict_message.get("headers", {})
-        dict_message["error"] = dict_message.get("error", None)
-        dict_message["result"] = dict_message.get("result", None)
-        dict_message["sequence_id"] = dict_message.get("sequenceId", None)
-
-        if message_type is MessageType.invocation:
-            return InvocationMessage(**dict_message)
-        if message_type is MessageType.stream_item:
-            return StreamItemMessage(**dict_message)
-        if message_type is MessageType.completion:
-            return CompletionMessage(**dict_message)
-        if message_type is MessageType.stream_invocation:
-            return StreamInvocationMessage(**dict_message)
-        if message_type is MessageType.cancel_invocation:
-            return CancelInvocationMessage(**dict_message)
-        if message_type is MessageType.ping:
-            return PingMessage()
-        if message_type is MessageType.close:
-            dict_message["allow_reconnect"] =\
-                dict_message.get("allowReconnect", None)
-            return CloseMessage(**dict_message)
-        if message_type is MessageType.ack:  # pragma: no cover
-            return AckMessage(**dict_message)
-        if message_type is MessageType.sequence:  # pragma: no cover
-            return SequenceMessage(**dict_message)
+    def get_message(dict_message: dict):
+        """Builds a hub message from its decoded protocol dict"""
+        builder = MESSAGE_BUILDERS.get(
+            dict_message.get("type", MessageType.ping.value), None)
+
+        if builder is None:
+            raise ValueError(
+                f"Unknown message type {dict_message.get('type')}")
+
+        return builder(dict_message)
+
+    def reset(self) -> None:
+        """Drops parser state kept from a previous connection"""
+        pass
 
     def decode_handshake(self, raw_message: str) -> HandshakeResponseMessage:
+        self.reset()
+
         has_record_separator = self.record_separator in raw_message
 
         messages = raw_message.split(self.record_separator)
@@ -0,0 +1,201 @@
+"""JSON hub protocol message encoding
+
+Messages are turned into dicts from precomputed field tables (python
+attribute -> protocol key) and dumped once. Message objects are never
+modified, so they can be encoded again (resends, logging, retries).
+
+Dumps is done by orjson or ujson if installed, the standard json
+module otherwise.
+"""
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..messages.handshake.request import HandshakeRequestMessage
+from ..messages.invocation_message import \
+    InvocationMessage, InvocationClientStreamMessage  # 1
+from ..messages.stream_item_message import StreamItemMessage  # 2
+from ..messages.completion_message import \
+    CompletionMessage, CompletionClientStreamMessage  # 3
+from ..messages.stream_invocation_message import StreamInvocationMessage  # 4
+from ..messages.cancel_invocation_message import CancelInvocationMessage  # 5
+from ..messages.ping_message import PingMessage  # 6
+from ..messages.close_message import CloseMessage  # 7
+from ..messages.ack_message import AckMessage  # 8
+from ..messages.sequence_message import SequenceMessage  # 9
+from ..messages.message_type import MessageType
+
+try:  # pragma: no cover
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # pragma: no cover
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+# python attribute -> protocol key, for non message objects found
+# inside arguments
+KEY_NAMES = {
+    "invocation_id": "invocationId",
+    "stream_ids": "streamIds",
+    "sequence_id": "sequenceId",
+    "allow_reconnect": "allowReconnect"
+}
+
+FIELD_TABLES: Dict[type, Tuple[Tuple[str, str], ...]] = {
+    HandshakeRequestMessage: (
+        ("protocol", "protocol"),
+        ("version", "version")),
+    InvocationMessage: (
+        ("headers", "headers"),
+        ("invocation_id", "invocationId"),
+        ("target", "target"),
+        ("arguments", "arguments")),
+    InvocationClientStreamMessage: (
+        ("headers", "headers"),
+        ("target", "target"),
+        ("arguments", "arguments"),
+        ("stream_ids", "streamIds")),
+    StreamItemMessage: (
+        ("headers", "headers"),
+        ("invocation_id", "invocationId"),
+        ("item", "item")),
+    CompletionMessage: (
+        ("headers", "headers"),
+        ("invocation_id", "invocationId"),
+        ("result", "result"),
+        ("error", "error")),
+    CompletionClientStreamMessage: (
+        ("headers", "headers"),
+        ("invocation_id", "invocationId")),
+    StreamInvocationMessage: (
+        ("headers", "headers"),
+        ("invocation_id", "invocationId"),
+        ("target", "target"),
+        ("arguments", "arguments"),
+        ("stream_ids", "streamIds")),
+    CancelInvocationMessage: (
+        ("headers", "headers"),
+        ("invocation_id", "invocationId")),
+    PingMessage: (),
+    CloseMessage: (
+        ("headers", "headers"),
+        ("error", "error"),
+        ("allow_reconnect", "allowReconnect")),
+    AckMessage: (
+        ("headers", "headers"),
+        ("sequence_id", "sequenceId")),
+    SequenceMessage: (
+        ("headers", "headers"),
+        ("sequence_id", "sequenceId")),
+}
+
+
+def to_dict(message) -> dict:
+    """Protocol representation of a hub message
+
+    Args:
+        message: Hub message or handshake request
+
+    Returns:
+        dict: new dict, the message is not modified
+    """
+    fields = FIELD_TABLES.get(type(message), None)
+
+    if fields is None:
+        return {
+            KEY_NAMES.get(key, key): value
+            for key, value in vars(message).items()
+        }
+
+    data = {"type": message.type.value}\
+        if type(message) is not HandshakeRequestMessage else {}
+
+    for attribute, key in fields:
+        data[key] = getattr(message, attribute)
+    return data
+
+
+def default(o: Any) -> Any:
+    """Serializes objects unknown to the json backends"""
+    if type(o) is MessageType:
+        return o.value
+    try:
+        return to_dict(o)
+    except TypeError:
+        raise TypeError(
+            f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps() -> Callable[[Any], str]:
+    return json.JSONEncoder(
+        default=default,
+        separators=(",", ":")).encode
+
+
+def _orjson_dumps() -> Callable[[Any], str]:  # pragma: no cover
+    def dumps(data: Any) -> str:
+        return orjson.dumps(data, default=default).decode()
+    return dumps
+
+
+def _ujson_dumps() -> Callable[[Any], str]:  # pragma: no cover
+    def dumps(data: Any) -> str:
+        return ujson.dumps(data, default=default, ensure_ascii=False)
+    return dumps
+
+
+BACKENDS: Dict[str, Callable[[], Callable[[Any], str]]] = {
+    "json": _stdlib_dumps,
+    "orjson": _orjson_dumps,
+    "ujson": _ujson_dumps
+}
+
+
+def available_backends() -> Tuple[str, ...]:
+    modules = {"json": json, "orjson": orjson, "ujson": ujson}
+    return tuple(name for name in BACKENDS if modules[name] is not None)
+
+
+def default_backend() -> str:
+    """Fastest installed backend"""
+    for name in ("orjson", "ujson"):
+        if name in available_backends():  # pragma: no cover
+            return name
+    return "json"
+
+
+class JsonMessageEncoder(object):
+    """Encodes hub messages as JSON strings
+
+    Args:
+        backend (str, optional): "json", "orjson" or "ujson".
+            Defaults to None, the fastest installed backend.
+
+    Raises:
+        ValueError: Unknown or not installed backend
+    """
+    def __init__(self, backend: Optional[str] = None):
+        if backend is None:
+            backend = default_backend()
+
+        if backend not in available_backends():
+            raise ValueError(
+                f"JSON backend {backend} is not available, "
+                f"use one of {available_backends()}")
+
+        self.backend = backend
+        self._dumps = BACKENDS[backend]()
+        self._fallback = _stdlib_dumps()\
+            if backend != "json" else None
+
+    def encode(self, message) -> str:
+        data = to_dict(message)
+        try:
+            return self._dumps(data)
+        except TypeError:
+            # i.e. integers bigger than 64 bits on orjson
+            if self._fallback is None:
+                raise
+            return self._fallback(data)
@@ -1,56 +1,70 @@
 import json
+import logging
 
-from json import JSONEncoder
+from typing import List, Optional
 
 from .base_hub_protocol import BaseHubProtocol
-from ..messages.message_type import MessageType
+from .json_encoder import JsonMessageEncoder
+from ..messages.base_message import BaseMessage
 from ..types import HubProtocolEncoding, RECORD_SEPARATOR
 
 
-class MyEncoder(JSONEncoder):
-    # https://github.com/PyCQA/pylint/issues/414
-    def default(self, o):
-        if type(o) is MessageType:
-            return o.value
-        data = o.__dict__
-        if "invocation_id" in data:
-            data["invocationId"] = data["invocation_id"]
-            del data["invocation_id"]
-        if "stream_ids" in data:
-            data["streamIds"] = data["stream_ids"]
-            del data["stream_ids"]
-        return data
-
-
 class JsonHubProtocol(BaseHubProtocol):
-    def __init__(self, version: int = 1):
+    def __init__(self, version: int = 1, backend: Optional[str] = None):
+        """JSON hub protocol
+
+        Args:
+            version (int, optional): Protocol version. Defaults to 1.
+            backend (str, optional): JSON library used to encode
+                messages: "json", "orjson" or "ujson".
+                Defaults to None, the fastest installed.
+        """
         super(JsonHubProtocol, self).__init__(
             "json",
             version,
             HubProtocolEncoding.text,
             RECORD_SEPARATOR)
-        self.encoder = MyEncoder()
+        self.encoder = JsonMessageEncoder(backend)
+        self._partial = ""  # trailing record without separator
+
+    def reset(self) -> None:
+        self._partial = ""
 
-    def parse_messages(self, raw):
-        self.logger.debug("Raw message incoming: ")
-        self.logger.debug(raw)
+    def parse_messages(self, raw: str) -> List[BaseMessage]:
+        """Decodes every complete record of raw. A trailing record
+        without separator is kept and completed by the next call.
 
-        raw_messages = [
-            record.replace(self.record_separator, "")
-            for record in raw.split(self.record_separator)
-            if record is not None and record != ""
-            and record != self.record_separator
-            ]
+        Records are always loaded with the json module, fast backends
+        load integers wider than 64 bits as floats.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Raw message incoming: {raw}")
 
+        buffer = self._partial + raw if self._partial else raw
+        separator = self.record_separator
+        end = buffer.rfind(separator)
+
+        if end == -1:
+            self._partial = buffer
+            return []
+
+        self._partial = buffer[end + 1:]
+
+        get_message = self.get_message
         result = []
+        start = 0
 
-        for raw_message in raw_messages:
-            dict_message = json.loads(raw_message)
-            if len(dict_message.keys()) > 0:
-                result.append(self.get_message(dict_message))
+        while start < end:
+            record_end = buffer.find(separator, start)
+            if record_end > start:
+                dict_message = json.loads(buffer[start: record_end])
+                if len(dict_message) > 0:
+                    result.append(get_message(dict_message))
+            start = record_end + 1
         return result
 
     def encode(self, message):
-        self.logger\
-            .debug(self.encoder.encode(message) + self.record_separator)
-        return self.encoder.encode(message) + self.record_separator
+        data = self.encoder.encode(message) + self.record_separator
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(data)
+        return data
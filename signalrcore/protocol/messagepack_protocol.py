@@ -1,12 +1,16 @@
 import json
+import threading
 import msgpack
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 from .base_hub_protocol import BaseHubProtocol
 from ..messages.handshake.request import HandshakeRequestMessage
 from ..messages.handshake.response import HandshakeResponseMessage
 from ..messages.invocation_message\
     import InvocationMessage, InvocationClientStreamMessage  # 1
 from ..messages.stream_item_message import StreamItemMessage  # 2
-from ..messages.completion_message import CompletionMessage  # 3
+from ..messages.completion_message import \
+    CompletionMessage, CompletionClientStreamMessage  # 3
 from ..messages.stream_invocation_message import StreamInvocationMessage  # 4
 from ..messages.cancel_invocation_message import CancelInvocationMessage  # 5
 from ..messages.ping_message import PingMessage  # 6
@@ -14,23 +18,57 @@ from ..messages.close_message import CloseMessage  # 7
 from ..messages.ack_message import AckMessage  # 8
 from ..messages.sequence_message import SequenceMessage  # 9
 
+from ..messages.base_message import BaseMessage
 from ..helpers import Helpers
 from ..types import HubProtocolEncoding, RECORD_SEPARATOR, DEFAULT_ENCODING
 
+MAX_LENGTH_PREFIX_SIZE = 5
+VARINTS = [bytes((i, )) for i in range(0x80)]  # one byte length prefixes
+
+
+def _layout(message_type: int, *attributes: str) -> Callable[[Any], tuple]:
+    """Encoder of a fixed array layout: the message type followed by
+    the message attributes"""
+    getter = attrgetter(*attributes)
+    if len(attributes) == 1:
+        return lambda message: (message_type, getter(message))
+    return lambda message: (message_type, *getter(message))
+
+
+def _encode_completion(message: CompletionMessage) -> tuple:
+    # [3, Headers, InvocationId, ResultKind, Result?]
+    if message.error is not None:
+        return 3, message.headers, message.invocation_id, 1, message.error
+    if message.result is None:
+        return 3, message.headers, message.invocation_id, 2
+    return 3, message.headers, message.invocation_id, 3, message.result
+
+
+MESSAGE_ENCODERS: Dict[type, Callable[[Any], tuple]] = {
+    InvocationMessage: _layout(
+        1, "headers", "invocation_id", "target", "arguments"),
+    InvocationClientStreamMessage: lambda message: (
+        1,
+        message.headers,
+        None,
+        message.target,
+        message.arguments,
+        message.stream_ids),
+    StreamItemMessage: _layout(2, "headers", "invocation_id", "item"),
+    CompletionMessage: _encode_completion,
+    CompletionClientStreamMessage: lambda message: (
+        3, message.headers, message.invocation_id, 2),
+    StreamInvocationMessage: _layout(
+        4, "headers", "invocation_id", "target", "arguments", "stream_ids"),
+    CancelInvocationMessage: _layout(5, "headers", "invocation_id"),
+    PingMessage: lambda message: (6, ),
+    CloseMessage: _layout(7, "error", "allow_reconnect"),
+    AckMessage: _layout(8, "sequence_id"),
+    SequenceMessage: _layout(9, "sequence_id"),
+}
 
-class MessagePackHubProtocol(BaseHubProtocol):
 
-    _priority = [
-        "type",
-        "headers",
-        "invocation_id",
-        "target",
-        "arguments",
-        "item",
-        "result_kind",
-        "result",
-        "stream_ids"
-    ]
+class MessagePackHubProtocol(BaseHubProtocol):
 
     def __init__(self, version: int = 1):
         super(MessagePackHubProtocol, self).__init__(
@@ -39,37 +77,95 @@ class MessagePackHubProtocol(BaseHubProtocol):
             HubProtocolEncoding.binary,
             RECORD_SEPARATOR)
         self.logger = Helpers.get_logger()
+        self._buffer = bytearray()  # bytes of an incomplete message
+        self._packers = threading.local()
 
-    def parse_messages(self, raw):
-        try:
-            messages = []
-            offset = 0
-            max_length_prefix_size = 5
-            num_bits_to_shift = [0, 7, 14, 21, 28]
-            while offset < len(raw):
-                length = 0
-                num_bytes = 0
-                while True:
-                    byte_read = raw[offset + num_bytes]
-                    length |=\
-                        (byte_read & 0x7F) << num_bits_to_shift[num_bytes]
-                    num_bytes += 1
-                    if byte_read & 0x80 == 0:
+    def reset(self) -> None:
+        self._buffer = bytearray()
+
+    def parse_messages(self, raw) -> List[BaseMessage]:
+        return list(self.iter_messages(raw))
+
+    def iter_messages(self, raw) -> Iterator[BaseMessage]:
+        """Decodes every complete message of raw, lazily. Bytes of a
+        message split across frames are kept until the next call.
+        A message that can not be decoded is skipped, the rest of the
+        batch is still parsed.
+        """
+        if len(self._buffer) > 0:
+            self._buffer += raw
+            data = self._buffer
+        else:
+            data = raw
+
+        size = len(data)
+        offset = 0
+        unpackb = msgpack.unpackb
+        decode_message = self._decode_message
+
+        with memoryview(data) as view:
+            while offset < size:
+                length = view[offset]
+                num_bytes = 1
+
+                if length & 0x80:
+                    try:
+                        length, num_bytes =\
+                            self._read_varint(view, offset, size)
+                    except ValueError as ex:
+                        # Corrupted stream, drop the buffered bytes
+                        self.logger.error(
+                            "Parse messages Error {0}".format(ex))
+                        offset = size
                         break
-                    if offset == max_length_prefix_size\
-                            or offset + num_bytes > len(raw):
-                        raise Exception("Cannot read message length")
-                offset = offset + num_bytes
-                values = msgpack.unpackb(raw[offset: offset + length])
-                offset = offset + length
-                message = self._decode_message(values)
-                messages.append(message)
-        except Exception as ex:
-            self.logger.error("Parse messages Error {0}".format(ex))
-            self.logger.error("raw msg '{0}'".format(raw))
-        return messages
+
+                if num_bytes == 0\
+                        or offset + num_bytes + length > size:
+                    break  # incomplete message
+
+                start = offset + num_bytes
+                offset = start + length
+
+                try:
+                    message = decode_message(unpackb(view[start: offset]))
+                except Exception as ex:
+                    self.logger.error(
+                        "Parse messages Error {0}".format(ex))
+                    self.logger.error(
+                        "raw msg '{0}'".format(bytes(view[start: offset])))
+                    continue
+
+                yield message
+
+        if data is self._buffer:
+            del self._buffer[:offset]
+        elif offset < size:
+            self._buffer += data[offset:]
+
+    def _read_varint(
+            self,
+            view: memoryview,
+            offset: int,
+            size: int) -> Tuple[int, int]:
+        """Reads a length prefix longer than one byte
+
+        Returns:
+            Tuple[int, int]: length and size of the prefix,
+                the prefix size is 0 if more bytes are needed
+        """
+        length = 0
+        for num_bytes in range(MAX_LENGTH_PREFIX_SIZE):
+            if offset + num_bytes >= size:
+                return 0, 0
+            byte_read = view[offset + num_bytes]
+            length |= (byte_read & 0x7F) << (7 * num_bytes)
+            if byte_read & 0x80 == 0:
+                return length, num_bytes + 1
+
+        raise ValueError("Cannot read message length")
 
     def decode_handshake(self, raw_message):
+        self.reset()
         try:
             has_various_messages = 0x1E in raw_message
             handshake_data = raw_message[0: raw_message.index(0x1E)]\
@@ -95,22 +191,32 @@ class MessagePackHubProtocol(BaseHubProtocol):
             content = json.dumps(message.__dict__)
             return content + self.record_separator
 
-        msg = self._encode_message(message)
-        encoded_message = msgpack.packb(msg)
-        varint_length = self._to_varint(len(encoded_message))
-        return varint_length + encoded_message
+        packer = self._get_packer()
+        try:
+            packer.pack(self._encode_message(message))
+            payload = packer.getbuffer()
+            try:
+                # length prefix and payload in a single allocation
+                return b"".join((self._to_varint(len(payload)), payload))
+            finally:
+                payload.release()
+        finally:
+            packer.reset()
 
-    def _encode_message(self, message):
-        result = []
+    def _get_packer(self) -> msgpack.Packer:
+        """Packer of the calling thread, packers are not thread safe"""
+        packer = getattr(self._packers, "packer", None)
+        if packer is None:
+            packer = msgpack.Packer(autoreset=False)
+            self._packers.packer = packer
+        return packer
 
-        # sort attributes
-        for attribute in self._priority:
-            if hasattr(message, attribute):
-                if (attribute == "type"):
-                    result.append(getattr(message, attribute).value)
-                else:
-                    result.append(getattr(message, attribute))
-        return result
+    def _encode_message(self, message) -> tuple:
+        encoder = MESSAGE_ENCODERS.get(type(message), None)
+        if encoder is None:
+            raise TypeError(
+                f"Can not encode {type(message).__name__} as MessagePack")
+        return encoder(message)
 
     def _decode_message(self, raw):
         # {} {"error"}
@@ -125,7 +231,7 @@ class MessagePackHubProtocol(BaseHubProtocol):
         # [9, SequenceId]
 
         if raw[0] == 1:  # InvocationMessage
-            if len(raw[5]) > 0:
+            if len(raw) > 5 and len(raw[5]) > 0:
                 return InvocationClientStreamMessage(
                     headers=raw[1],
                     stream_ids=raw[5],
@@ -187,23 +293,18 @@ class MessagePackHubProtocol(BaseHubProtocol):
                 allow_reconnect=raw[2] if len(raw) > 2 else None)
         elif raw[0] == 8:  # pragma: no cover # AckMessage
             return AckMessage(sequence_id=raw[1])
-        elif raw[0] == 7:  # pragma: no cover # SequenceMessage
+        elif raw[0] == 9:  # pragma: no cover # SequenceMessage
             return SequenceMessage(sequence_id=raw[1])
 
         raise Exception("Unknown message type.")  # pragma: no cover
 
-    def _to_varint(self, value):
-        buffer = b''
-
-        while True:
+    def _to_varint(self, value: int) -> bytes:
+        if value < 0x80:
+            return VARINTS[value]
 
-            byte = value & 0x7f
+        buffer = bytearray()
+        while value > 0x7F:
+            buffer.append((value & 0x7F) | 0x80)
             value >>= 7
-
-            if value:
-                buffer += bytes((byte | 0x80, ))
-            else:
-                buffer += bytes((byte, ))
-                break
-
-        return buffer
+        buffer.append(value)
+        return bytes(buffer)
@@ -1,15 +1,22 @@
 import enum
 import traceback
-import time
 import ssl
 from typing import Callable, Dict, Optional
 from ..helpers import Helpers
 from ..transport.base_reconnection import BaseReconnection
 from ..protocol.base_hub_protocol import BaseHubProtocol
-from ..hub.negotiation import NegotiateResponse, NegotiationHandler
+from ..hub.negotiation import NegotiateResponse, NegotiationHandler, \
+    NegotiateCache
 from .base_client import BaseClient
-from ..messages.ping_message import PingMessage
+from ..messages.ack_message import AckMessage
+from ..hub.errors import HubConnectionError
 from .reconnection import ConnectionStateChecker
+from .scheduler import Scheduler, get_scheduler
+from .send_queue import SendQueue
+from .inbound_queue import InboundQueue
+from .message_buffer import MessageBuffer
+from .reconnector import Reconnector, ReconnectMetrics
+from ..types import OverflowPolicy
 
 
 class TransportState(enum.Enum):
@@ -23,6 +30,8 @@ class BaseTransport(object):
     _client: Optional[BaseClient]
     connection_checker: ConnectionStateChecker
     manually_closing: bool
+    supports_stateful_reconnect = False
+    requires_connection_token = True  # cached negotiations not reused
 
     def __init__(
             self,
@@ -40,7 +49,17 @@ class BaseTransport(object):
             on_reconnect: Callable = None,
             protocol: BaseHubProtocol = None,
             reconnection_handler: BaseReconnection = None,
-            on_message: Callable = None):
+            on_message: Callable = None,
+            max_message_size: Optional[int] = None,
+            max_batch_bytes: Optional[int] = None,
+            max_linger: float = 0,
+            max_inbound_messages: Optional[int] = None,
+            overflow_policy: OverflowPolicy = OverflowPolicy.block,
+            scheduler: Optional[Scheduler] = None,
+            server_timeout: Optional[float] = None,
+            stateful_reconnect: bool = False,
+            stateful_reconnect_buffer_size: int = 100 * 1024,
+            negotiate_cache: Optional[NegotiateCache] = None):
         self.url = url
         self.is_binary = is_binary
         self.headers = headers
@@ -51,17 +70,74 @@ class BaseTransport(object):
         self.connection_id = connection_id
         self.proxies = proxies
         self.protocol = protocol
+        self.max_message_size = max_message_size
+        self.server_timeout = server_timeout
+        self.negotiate_cache = negotiate_cache
+        self._negotiation: Optional[NegotiationHandler] = None
+        self.scheduler = scheduler\
+            if scheduler is not None else get_scheduler()
 
         self.logger = Helpers.get_logger()
 
-        self._on_message = on_message
+        self.inbound_queue: Optional[InboundQueue] = None\
+            if max_inbound_messages is None else\
+            InboundQueue(on_message, max_inbound_messages, overflow_policy)
+
+        self._on_message = on_message\
+            if self.inbound_queue is None else\
+            self.inbound_queue.put_all
         self._on_open = on_open
         self._on_close = on_close
         self._on_reconnect = on_reconnect
 
         self.state = TransportState.disconnected
+        self.handshake_received = False
         self.reconnection_handler = reconnection_handler
+        self.reconnect_metrics = ReconnectMetrics()
+        self.reconnector: Optional[Reconnector] = None\
+            if reconnection_handler is None else\
+            Reconnector(
+                reconnection_handler,
+                self._reconnect_attempt,
+                self._on_reconnect_failed,
+                self.scheduler,
+                self.reconnect_metrics)
         self.manually_closing = False
+        self._state_listeners = []
+
+        self.send_queue: Optional[SendQueue] = None\
+            if max_batch_bytes is None else\
+            SendQueue(self._send_data, max_batch_bytes, max_linger)
+
+        # stateful reconnect, agreed with the server on negotiation
+        self.message_buffer: Optional[MessageBuffer] = None
+        self._resuming = False
+
+        if stateful_reconnect and self.supports_stateful_reconnect:
+            self.message_buffer = MessageBuffer(
+                self._send_ack,
+                self.scheduler,
+                stateful_reconnect_buffer_size)
+            self._deliver = self._on_message
+            self._on_message = self._receive_sequenced
+            if self.protocol is not None:
+                # ack and sequence messages need protocol version 2
+                self.protocol.version = max(self.protocol.version, 2)
+
+    def add_state_listener(
+            self,
+            listener: Callable[[TransportState], None]) -> None:
+        """Registers a function that will be called with the new state
+        on every state change. Listeners run on the thread that changed
+        the state, so they must not block.
+        """
+        self._state_listeners.append(listener)
+
+    def remove_state_listener(
+            self,
+            listener: Callable[[TransportState], None]) -> None:
+        if listener in self._state_listeners:
+            self._state_listeners.remove(listener)
 
     def _set_state(self, new_state: TransportState):
         """Internal helper to change state and call appropriate callbacks."""
@@ -74,6 +150,9 @@ class BaseTransport(object):
         self.logger.debug(
             f"Transport state changed: {old_state.name} → {new_state.name}")
 
+        for listener in list(self._state_listeners):
+            listener(new_state)
+
         was_connecting = old_state == TransportState.connecting
         was_connected = old_state == TransportState.connected
         was_reconnecting = old_state == TransportState.reconnecting
@@ -106,9 +185,66 @@ class BaseTransport(object):
     def is_running(self):
         return self.state != TransportState.disconnected
 
-    def send(self, message, on_invocation=None):  # pragma: no cover
+    def send(self, message):
+        self.logger.debug("Sending message {0}".format(message))
+        data = self.protocol.encode(message)
+
+        if self.message_buffer is None:
+            return self._write(data)
+
+        with self.message_buffer.condition:
+            is_sequenced = self.message_buffer.add(message, data)
+            if not self._resuming:
+                self._write(data)
+            elif not is_sequenced:
+                self.logger.debug(f"Reconnecting, {message} not sent")
+
+    def _write(self, data):
+        if self.send_queue is not None and self.handshake_received:
+            self.send_queue.put(data)
+            return
+
+        self._send_data(data)
+
+    def _send_data(self, data):  # pragma: no cover
+        """Writes encoded messages on the client"""
         raise NotImplementedError()
 
+    def _send_ack(self, sequence_id: int):
+        if self._resuming or not self.is_connected():
+            raise HubConnectionError("Not connected")
+        self._write(self.protocol.encode(AckMessage(sequence_id)))
+
+    def _receive_sequenced(self, messages):
+        try:
+            messages = self.message_buffer.receive(messages)
+        except HubConnectionError as ex:
+            # messages lost, the server state can not be recovered
+            self.logger.error(ex)
+            self.handshake_received = False  # reconnect from scratch
+            self._client.close()
+            return []
+
+        if len(messages) > 0:
+            return self._deliver(messages)
+        return []
+
+    def _resend(self):
+        """Sends the messages not acknowledged by the server on the
+        new socket of a stateful reconnection"""
+        with self.message_buffer.condition:
+            sequence, messages = self.message_buffer.resend_messages()
+            self._send_data(self.protocol.encode(sequence))
+            for data in messages:
+                self._send_data(data)
+            self._resuming = False
+            self.handshake_received = True
+
+        self.logger.debug(
+            f"Stateful reconnect, {len(messages)} messages sent again")
+        self._set_state(TransportState.connected)
+        self.message_buffer.schedule_ack()
+
     def negotiate(self) -> NegotiateResponse:
         """Negotiates connection with the signalR server, updates:
             - url
@@ -123,14 +259,24 @@ class BaseTransport(object):
             self.headers,
             self.proxies,
             self.ssl_context,
-            self.skip_negotiation
+            self.skip_negotiation,
+            self.message_buffer is not None,
+            self.negotiate_cache,
+            self.requires_connection_token
         )
 
+        self._negotiation = handler
         self.url, self.headers, response = handler.negotiate()
         self.connection_id = response.get_id()
 
         return response
 
+    def invalidate_negotiation(self):
+        """Drops the cached negotiation used by the last reconnection,
+        so the next attempt negotiates again"""
+        if self._negotiation is not None:
+            self._negotiation.invalidate()
+
     def create_client(self) -> BaseClient:  # pragma: no cover
         raise NotImplementedError()
 
@@ -147,11 +293,23 @@ class BaseTransport(object):
 
         self._client.connect()
 
+        if self.send_queue is not None:
+            self.send_queue.start()
+
+        if self.inbound_queue is not None:
+            self.inbound_queue.start()
+
         return True
 
     def dispose(self):
         if not self.is_disconnected():
+            if self.send_queue is not None:
+                self.send_queue.stop()
+            if self.inbound_queue is not None:
+                self.inbound_queue.stop()
             self.connection_checker.stop()
+            if self.message_buffer is not None:
+                self.message_buffer.close()
             self._client.close()
 
     def stop(self):
@@ -159,7 +317,12 @@ class BaseTransport(object):
             return
         self.manually_closing = True
         self.handshake_received = False
+        if self.reconnector is not None:
+            self.reconnector.cancel()
+        was_reconnecting = self.is_reconnecting()
         self.dispose()
+        if was_reconnecting:  # no socket left to report the close
+            self._set_state(TransportState.disconnected)
 
     def on_socket_error(self, error: Exception):  # pragma: no cover
         """
@@ -174,41 +337,57 @@ class BaseTransport(object):
         self.logger.error("{0} {1}".format(error, type(error)))
         self._set_state(TransportState.disconnected)
 
-    def deferred_reconnect(self, sleep_time):  # pragma: no cover
-        time.sleep(sleep_time)
-        try:
-            if not self.connection_alive:
-                if not self.connection_checker.running:
-                    self.send(PingMessage())
-        except Exception as ex:
-            self.logger.error(ex)
-            self.reconnection_handler.reconnecting = False
-            self.connection_alive = False
+    def on_server_timeout(self):
+        """Nothing received from the server in server_timeout seconds,
+        the connection is closed so the reconnection starts (or the
+        connection ends if reconnection is not configured)"""
+        self.logger.warning(
+            "Server timeout elapsed without receiving a message "
+            f"({self.server_timeout} s), closing connection")
+        if self.reconnection_handler is None:
+            self.connection_checker.stop()
+        self._client.close()
 
     def handle_reconnect(self) -> bool:
-        if self.is_reconnecting() or self.manually_closing:
-            return False
+        """Starts the reconnection if the connection is lost, attempts
+        run on the scheduler, never on the calling thread
 
-        if self.reconnection_handler is None:  # pragma: no cover
+        Returns:
+            bool: True if the reconnection started
+        """
+        if self.manually_closing or self.reconnector is None:
             return False
 
         if not self._client.is_connection_closed():
             return False
 
-        try:
-            self.reconnection_handler.reconnecting = True
+        return self._reconnect()
 
-            self._set_state(TransportState.reconnecting)
+    def _reconnect(self) -> bool:
+        if self.reconnector.running:
+            return False
+        self.reconnection_handler.reconnecting = True
+        self._set_state(TransportState.reconnecting)
+        return self.reconnector.start()
 
-            self._client.dispose()
+    def _reconnect_attempt(self):
+        self._client.dispose()
+        try:
             self.start(reconnection=True)
-        except Exception as ex:  # pragma: no cover
-            self.logger.error(ex)
-            sleep_time = self.reconnection_handler.next()
-            self.deferred_reconnect(sleep_time)
-        return True
+        except Exception:
+            self.invalidate_negotiation()
+            raise
+        if self.manually_closing:  # stopped while connecting
+            self._client.close()
+
+    def _on_reconnect_failed(self, error: Exception):
+        self.logger.error(f"Reconnection failed, last error {error}")
+        self.reconnection_handler.reconnecting = False
+        self._set_state(TransportState.disconnected)
 
     def send_handshake(self):
         msg = self.protocol.handshake_message()
+        if self.message_buffer is not None:
+            self.message_buffer.reset()  # new server connection
         self.handshake_received = False
         self.send(msg)
@@ -0,0 +1,169 @@
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, List
+from ..helpers import Helpers
+from ..messages.base_message import BaseMessage
+from ..messages.message_type import MessageType
+from ..types import OverflowPolicy
+
+THREAD_NAME = "Signalrcore inbound queue reader"
+
+
+class InboundMetrics(object):
+    """Counters about the messages handled by an :class:`InboundQueue`"""
+    def __init__(self):
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.blocked = 0  # times the receive thread waited for room
+        self.max_depth = 0
+
+    def __repr__(self):
+        return "InboundMetrics: received {0}, delivered {1}, dropped {2}, "\
+            "coalesced {3}, blocked {4}, max depth {5}".format(
+                self.received,
+                self.delivered,
+                self.dropped,
+                self.coalesced,
+                self.blocked,
+                self.max_depth)
+
+
+class InboundQueue(object):
+    """Bounded queue between the transport receive loop and the hub.
+    A reader thread hands queued messages to the hub, so the receive
+    loop keeps draining the socket while handlers run.
+
+    Once max_size messages are queued the overflow policy applies to
+    invocation messages:
+        block: the receive loop waits for room (tcp backpressure)
+        drop_oldest: the oldest queued invocation is dropped
+        drop_newest: the incoming invocation is dropped
+        coalesce_latest: the incoming invocation replaces the queued
+            invocation of its target, the oldest one is dropped if
+            there is none
+    Other messages (completions, stream items, close...) are never
+    dropped, with drop policies they are queued over max_size.
+    """
+    def __init__(
+            self,
+            handle: Callable[[List[BaseMessage]], None],
+            max_size: int = 1000,
+            policy: OverflowPolicy = OverflowPolicy.block):
+        self.max_size = max_size
+        self.policy = policy
+        self.metrics = InboundMetrics()
+        self.logger = Helpers.get_logger()
+        self._handle = handle
+        # queued entries are one item lists, dropped entries are
+        # emptied in place instead of removed from the deques
+        self._queue: Deque[list] = deque()
+        self._invocations: Deque[list] = deque()
+        self._latest: Dict[str, list] = {}
+        self._size = 0
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: threading.Thread = None
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run,
+                name=THREAD_NAME)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """Stops the reader once queued messages are delivered"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+        is_same_thread = threading.current_thread() is self._thread
+
+        if self._thread is not None and not is_same_thread:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def pending(self) -> int:
+        return self._size
+
+    def put_all(self, messages: List[BaseMessage]):
+        with self._condition:
+            for message in messages:
+                self._put(message)
+            self.metrics.max_depth = max(self.metrics.max_depth, self._size)
+            self._condition.notify_all()
+
+    def _put(self, message: BaseMessage):
+        self.metrics.received += 1
+        is_invocation = message.type is MessageType.invocation
+        is_full = self._size >= self.max_size
+
+        if is_full and self.policy is OverflowPolicy.block:
+            self.metrics.blocked += 1
+            self._condition.notify_all()  # wake the reader up
+            while self._size >= self.max_size and self._running:
+                self._condition.wait()
+        elif is_full and is_invocation:
+            if self.policy is OverflowPolicy.drop_newest:
+                self.metrics.dropped += 1
+                return
+
+            if self.policy is OverflowPolicy.coalesce_latest:
+                entry = self._latest.get(message.target, None)
+                if entry is not None and len(entry) > 0:
+                    entry[0] = message
+                    self.metrics.coalesced += 1
+                    return
+
+            self._drop_oldest_invocation()
+
+        entry = [message]
+        self._queue.append(entry)
+        self._size += 1
+
+        if is_invocation:
+            self._invocations.append(entry)
+            self._latest[message.target] = entry
+
+    def _drop_oldest_invocation(self):
+        while len(self._invocations) > 0:
+            entry = self._invocations.popleft()
+            if len(entry) > 0:
+                entry.clear()
+                self._size -= 1
+                self.metrics.dropped += 1
+                return
+
+    def _next_messages(self) -> List[BaseMessage]:
+        with self._condition:
+            while self._size == 0 and self._running:
+                self._condition.wait()
+
+            messages = [entry[0] for entry in self._queue if len(entry) > 0]
+            self._queue.clear()
+            self._invocations.clear()
+            self._latest.clear()
+
+            self._size -= len(messages)
+            self._condition.notify_all()
+            return messages
+
+    def _run(self):
+        while True:
+            messages = self._next_messages()
+
+            if len(messages) == 0:
+                return
+
+            try:
+                self._handle(messages)
+            except Exception as ex:  # pragma: no cover
+                self.logger.error(f"Inbound queue handler error {ex}")
+            finally:
+                self.metrics.delivered += len(messages)
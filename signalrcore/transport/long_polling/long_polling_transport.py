@@ -24,7 +24,10 @@ class LongPollingTransport(BaseTransport):
 
         self.connection_checker = ConnectionStateChecker(
             self.connection_check,
-            keep_alive_interval
+            keep_alive_interval,
+            scheduler=self.scheduler,
+            server_timeout=self.server_timeout,
+            on_server_timeout=self.on_server_timeout
         )
 
         self.manually_closing = False
@@ -75,10 +78,9 @@ class LongPollingTransport(BaseTransport):
         super().on_socket_error(error)
 
     def on_client_close(self):
-        if self.reconnection_handler is not None\
-                and not self.is_reconnecting()\
-                and not self.manually_closing:
-            self.handle_reconnect()
+        if self.handle_reconnect():
+            return
+        if self.reconnector is not None and self.reconnector.running:
             return
 
         self.logger.debug("-- Long Polling close --")
@@ -106,6 +108,7 @@ class LongPollingTransport(BaseTransport):
 
     def on_message(self, app, raw_message):
         self.logger.debug("Message received {0}".format(raw_message))
+        self.connection_checker.last_received = time.time()
 
         if not self.manually_closing and not self.handshake_received:
             messages = self.evaluate_handshake(raw_message)
@@ -118,11 +121,9 @@ class LongPollingTransport(BaseTransport):
         return self._on_message(
             self.protocol.parse_messages(raw_message))
 
-    def send(self, message):
-        self.logger.debug("Sending message {0}".format(message))
+    def _send_data(self, data):
         try:
-            self._client.send(
-                self.protocol.encode(message))
+            self._client.send(data)
         except OSError as ex:
             self.handshake_received = False  # pragma: no cover
             self.logger.warning("Connection closed {0}".format(ex))
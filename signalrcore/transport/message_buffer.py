@@ -0,0 +1,193 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple, Union
+from ..helpers import Helpers
+from ..hub.errors import HubConnectionError
+from ..messages.base_message import BaseMessage
+from ..messages.message_type import MessageType
+from ..messages.sequence_message import SequenceMessage
+from .scheduler import Scheduler, ScheduledTask
+
+# Hub invocation messages are numbered, acknowledged and replayed
+SEQUENCED_TYPES = frozenset([
+    MessageType.invocation,
+    MessageType.stream_item,
+    MessageType.completion,
+    MessageType.stream_invocation,
+    MessageType.cancel_invocation
+])
+
+ACK_INTERVAL = 1  # seconds between acks of received messages
+
+
+class MessageBuffer(object):
+    """Stateful reconnect bookkeeping of a connection.
+
+    Outgoing hub invocation messages are numbered and kept encoded until
+    the server acknowledges them, so they can be sent again after a
+    reconnection. Received ones are numbered too: the server is
+    acknowledged every ACK_INTERVAL seconds and messages replayed by the
+    server after a reconnection are dropped if they were already received.
+
+    Args:
+        send_ack (Callable[[int], None]): sends an ack with the given
+            sequence id.
+        scheduler (Scheduler): runs the ack timer.
+        max_bytes (int, optional): encoded bytes kept until acknowledged,
+            sends wait for acks once reached. Defaults to 100KB, as
+            ASP.NET clients.
+        timeout (float, optional): seconds a send waits for room.
+            Defaults to 30.
+    """
+    def __init__(
+            self,
+            send_ack: Callable[[int], None],
+            scheduler: Scheduler,
+            max_bytes: int = 100 * 1024,
+            timeout: float = 30):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.logger = Helpers.get_logger()
+        self.condition = threading.Condition()
+        self._send_ack = send_ack
+        self._scheduler = scheduler
+        self._ack_task: Optional[ScheduledTask] = None
+        self.reset()
+
+    def reset(self):
+        """New server connection, sequence ids start again"""
+        with self.condition:
+            self._buffer: Deque[Tuple[int, Union[str, bytes]]] = deque()
+            self._buffered_bytes = 0
+            self._sent_count = 0  # sequence id of the last buffered message
+            self._next_receiving_id = 1
+            self._latest_received_id = 0
+            self._latest_acked_id = 0
+            self.condition.notify_all()
+
+    def pending(self) -> int:
+        """Messages sent and not acknowledged yet"""
+        return len(self._buffer)
+
+    def buffered_bytes(self) -> int:
+        return self._buffered_bytes
+
+    def add(
+            self,
+            message: BaseMessage,
+            data: Union[str, bytes],
+            wait: bool = True) -> bool:
+        """Keeps an outgoing message until it is acknowledged. Call it
+        with the condition held, so messages are numbered in the same
+        order they are written.
+
+        Args:
+            message (BaseMessage): message being sent
+            data (str|bytes): encoded message
+            wait (bool, optional): wait for acks if the buffer is full,
+                raise otherwise. Defaults to True.
+
+        Raises:
+            HubConnectionError: buffer full
+
+        Returns:
+            bool: True if the message is sequenced
+        """
+        if getattr(message, "type", None) not in SEQUENCED_TYPES:
+            return False
+
+        deadline = time.monotonic() + self.timeout
+        while self._buffered_bytes >= self.max_bytes:
+            remaining = deadline - time.monotonic()
+            if not wait or remaining <= 0:
+                raise HubConnectionError(
+                    "Stateful reconnect buffer full, "
+                    f"{self._buffered_bytes} bytes waiting for an ack")
+            self.condition.wait(remaining)
+
+        self._sent_count += 1
+        self._buffer.append((self._sent_count, data))
+        self._buffered_bytes += len(data)
+        return True
+
+    def ack(self, sequence_id: int):
+        """Releases messages acknowledged by the server"""
+        with self.condition:
+            buffer = self._buffer
+            while len(buffer) > 0 and buffer[0][0] <= sequence_id:
+                self._buffered_bytes -= len(buffer.popleft()[1])
+            self.condition.notify_all()
+
+    def resend_messages(self) -> Tuple[SequenceMessage, List[bytes]]:
+        """Sequence message and messages to send again after a
+        reconnection, call it with the condition held"""
+        first_id = self._buffer[0][0]\
+            if len(self._buffer) > 0 else\
+            self._sent_count + 1
+        return SequenceMessage(first_id), [data for _, data in self._buffer]
+
+    def receive(self, messages: List[BaseMessage]) -> List[BaseMessage]:
+        """Handles acks and sequences of the server and drops replayed
+        messages already received.
+
+        Raises:
+            HubConnectionError: the server restarts the sequence after
+                messages never received, they are lost
+
+        Returns:
+            List[BaseMessage]: messages for the hub
+        """
+        result = []
+        for message in messages:
+            message_type = message.type
+            if message_type is MessageType.ack:
+                self.ack(message.sequence_id)
+            elif message_type is MessageType.sequence:
+                self._reset_sequence(message.sequence_id)
+            elif message_type not in SEQUENCED_TYPES:
+                result.append(message)
+            elif self._should_process():
+                result.append(message)
+        return result
+
+    def _should_process(self) -> bool:
+        current_id = self._next_receiving_id
+        self._next_receiving_id += 1
+
+        if current_id <= self._latest_received_id:
+            return False  # replayed duplicate
+
+        self._latest_received_id = current_id
+        self.schedule_ack()
+        return True
+
+    def _reset_sequence(self, sequence_id: int):
+        if sequence_id > self._next_receiving_id:
+            raise HubConnectionError(
+                f"Sequence id {sequence_id} greater than the messages "
+                f"received {self._next_receiving_id - 1}")
+        self._next_receiving_id = sequence_id
+
+    def schedule_ack(self):
+        """Acks the latest received message in ACK_INTERVAL seconds"""
+        if self._ack_task is None:
+            self._ack_task = self._scheduler.schedule(
+                ACK_INTERVAL, self._ack_timer)
+
+    def _ack_timer(self):
+        self._ack_task = None
+        sequence_id = self._latest_received_id
+        if sequence_id <= self._latest_acked_id:
+            return
+        try:
+            self._send_ack(sequence_id)
+            self._latest_acked_id = sequence_id
+        except Exception as ex:
+            # not connected, acked by the next received message
+            self.logger.debug(f"Ack {sequence_id} not sent {ex}")
+
+    def close(self):
+        task, self._ack_task = self._ack_task, None
+        if task is not None:
+            task.cancel()
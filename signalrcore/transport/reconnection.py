@@ -1,115 +1,214 @@
-import threading
-import time
-from enum import Enum
-from ..helpers import Helpers
-
-THREAD_NAME = "Signalrcore ConnectionStateChecker"
-
-
-class ConnectionStateChecker(object):
-    def __init__(
-            self,
-            ping_function,
-            keep_alive_interval=15,
-            sleep=1):
-        self.sleep = sleep
-        self.keep_alive_interval = keep_alive_interval
-        self.last_message = time.time()
-        self.last_run = time.time()
-        self.ping_function = ping_function
-        self.running = False
-        self._thread = None
-        self._lock = threading.Lock()
-        self.logger = Helpers.get_logger()
-
-    def start(self):
-        assert self._lock.acquire(timeout=10)
-
-        if self._thread is not None:
-            return
-
-        self.running = True
-        self._thread = threading.Thread(
-            target=self.run,
-            name=THREAD_NAME)
-
-        self._thread.daemon = True
-
-        self._thread.start()
-        self._lock.release()
-
-    def run(self):
-        while self.running:
-            time.sleep(0.1)
-            if time.time() - self.last_run < self.sleep:
-                continue
-
-            time_without_messages = time.time() - self.last_message
-
-            if self.keep_alive_interval < time_without_messages:
-                self.ping_function()
-            self.last_run = time.time()
-
-    def stop(self):
-        is_same_thread = threading.current_thread().name == THREAD_NAME
-        self.running = False
-        if self._thread is not None\
-                and not is_same_thread\
-                and self._thread.is_alive():
-
-            self._thread.join(timeout=10)
-            self._thread = None
-
-
-class ReconnectionType(Enum):
-    raw = 0  # Reconnection with max reconnects and constant sleep time
-    interval = 1  # variable sleep time
-
-
-class ReconnectionHandler(object):
-    def __init__(self):
-        self.reconnecting = False
-        self.attempt_number = 0
-        self.last_attempt = time.time()
-
-    def next(self):
-        raise NotImplementedError()
-
-    def reset(self):
-        self.attempt_number = 0
-        self.reconnecting = False
-
-
-class RawReconnectionHandler(ReconnectionHandler):
-    def __init__(self, sleep_time, max_attempts):
-        super(RawReconnectionHandler, self).__init__()
-        self.sleep_time = sleep_time
-        self.max_reconnection_attempts = max_attempts
-
-    def next(self):
-        self.reconnecting = True
-        if self.max_reconnection_attempts is not None:
-            if self.attempt_number <= self.max_reconnection_attempts:
-                self.attempt_number += 1
-                return self.sleep_time
-            else:
-                raise ValueError(
-                    "Max attemps reached {0}"
-                    .format(self.max_reconnection_attempts))
-        else:  # Infinite reconnect
-            return self.sleep_time
-
-
-class IntervalReconnectionHandler(ReconnectionHandler):
-    def __init__(self, intervals):
-        super(IntervalReconnectionHandler, self).__init__()
-        self._intervals = intervals
-
-    def next(self):
-        self.reconnecting = True
-        index = self.attempt_number
-        self.attempt_number += 1
-        if index >= len(self._intervals):
-            raise ValueError(
-                "Max intervals reached {0}".format(self._intervals))
-        return self._intervals[index]
+import random
+import threading
+import time
+from enum import Enum
+from typing import Callable, Optional
+from ..helpers import Helpers
+from .scheduler import Scheduler, ScheduledTask, get_scheduler
+
+
+class ConnectionStateChecker(object):
+    """Calls ping_function once keep_alive_interval seconds pass
+    without messages, then every sleep seconds while no message is
+    sent. If server_timeout is set, on_server_timeout is called when
+    nothing is received from the server for server_timeout seconds.
+    Runs on the shared scheduler, there is no thread per connection.
+    """
+    def __init__(
+            self,
+            ping_function,
+            keep_alive_interval=15,
+            sleep=1,
+            scheduler: Optional[Scheduler] = None,
+            server_timeout: Optional[float] = None,
+            on_server_timeout: Optional[Callable[[], None]] = None):
+        self.sleep = sleep
+        self.keep_alive_interval = keep_alive_interval
+        self.server_timeout = server_timeout
+        self.last_message = time.time()  # last sent message
+        self.last_received = time.time()
+        self.last_run = time.time()
+        self.ping_function = ping_function
+        self.on_server_timeout = on_server_timeout
+        self.running = False
+        self.scheduler = scheduler
+        self._task: Optional[ScheduledTask] = None
+        self._lock = threading.Lock()
+        self.logger = Helpers.get_logger()
+
+    def start(self):
+        with self._lock:
+            if self.running:
+                return
+            self.running = True
+            self.last_received = time.time()
+            if self.scheduler is None:
+                self.scheduler = get_scheduler()
+            self._schedule(self._next_delay())
+
+    def _schedule(self, delay: float):
+        self._task = self.scheduler.schedule(max(delay, 0), self.run)
+
+    def _next_delay(self) -> float:
+        now = time.time()
+        delay = max(
+            self.last_message + self.keep_alive_interval - now,
+            self.last_run + self.sleep - now)
+
+        if self.server_timeout is not None:
+            delay = min(
+                delay,
+                self.last_received + self.server_timeout - now)
+        return delay
+
+    def is_server_timed_out(self) -> bool:
+        return self.server_timeout is not None\
+            and self.server_timeout < time.time() - self.last_received
+
+    def run(self):
+        if self.is_server_timed_out():
+            # a whole timeout until the next check, reconnection included
+            self.last_received = time.time()
+            if self.on_server_timeout is not None:
+                self.on_server_timeout()
+        elif self.keep_alive_interval < time.time() - self.last_message:
+            self.ping_function()
+            self.last_run = time.time()
+
+        with self._lock:
+            if not self.running:
+                return
+            self._schedule(self._next_delay())
+
+    def stop(self):
+        with self._lock:
+            self.running = False
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+
+class ReconnectionType(Enum):
+    raw = 0  # Reconnection with max reconnects and constant sleep time
+    interval = 1  # variable sleep time
+    exponential = 2  # exponential backoff with jitter
+
+
+class JitterType(Enum):
+    none = 0  # base * 2 ^ attempt, capped
+    full = 1  # random between 0 and the capped exponential delay
+    decorrelated = 2  # random between base and 3 times the last delay
+
+
+class ReconnectionHandler(object):
+    def __init__(self):
+        self.reconnecting = False
+        self.attempt_number = 0
+        self.last_attempt = time.time()
+
+    def next(self):
+        raise NotImplementedError()
+
+    def reset(self):
+        self.attempt_number = 0
+        self.reconnecting = False
+
+
+class RawReconnectionHandler(ReconnectionHandler):
+    def __init__(self, sleep_time, max_attempts):
+        super(RawReconnectionHandler, self).__init__()
+        self.sleep_time = sleep_time
+        self.max_reconnection_attempts = max_attempts
+
+    def next(self):
+        self.reconnecting = True
+        if self.max_reconnection_attempts is not None:
+            if self.attempt_number <= self.max_reconnection_attempts:
+                self.attempt_number += 1
+                return self.sleep_time
+            else:
+                raise ValueError(
+                    "Max attemps reached {0}"
+                    .format(self.max_reconnection_attempts))
+        else:  # Infinite reconnect
+            return self.sleep_time
+
+
+class IntervalReconnectionHandler(ReconnectionHandler):
+    def __init__(self, intervals):
+        super(IntervalReconnectionHandler, self).__init__()
+        self._intervals = intervals
+
+    def next(self):
+        self.reconnecting = True
+        index = self.attempt_number
+        self.attempt_number += 1
+        if index >= len(self._intervals):
+            raise ValueError(
+                "Max intervals reached {0}".format(self._intervals))
+        return self._intervals[index]
+
+
+class ExponentialReconnectionHandler(ReconnectionHandler):
+    """Waits base_interval * 2 ^ attempt seconds, up to max_interval,
+    randomized by the jitter so clients disconnected at the same time
+    (i.e. a server restart) do not reconnect in lockstep.
+
+    Args:
+        base_interval (float, optional): first delay. Defaults to 1.
+        max_interval (float, optional): delay cap. Defaults to 60.
+        max_attempts (int, optional): attempts before giving up.
+            Defaults to None, infinite.
+        jitter (JitterType, optional): Defaults to JitterType.full.
+        rng (random.Random, optional): random source. Defaults to None,
+            a new generator.
+    """
+    def __init__(
+            self,
+            base_interval: float = 1,
+            max_interval: float = 60,
+            max_attempts: Optional[int] = None,
+            jitter: JitterType = JitterType.full,
+            rng: Optional[random.Random] = None):
+        super(ExponentialReconnectionHandler, self).__init__()
+        if base_interval <= 0 or max_interval < base_interval:
+            raise ValueError(
+                "base_interval must be positive and lower than "
+                "max_interval")
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.max_reconnection_attempts = max_attempts
+        self.jitter = jitter
+        self._random = random.Random() if rng is None else rng
+        self._last_delay = base_interval
+
+    def next(self):
+        self.reconnecting = True
+        if self.max_reconnection_attempts is not None\
+                and self.attempt_number >= self.max_reconnection_attempts:
+            raise ValueError(
+                "Max attemps reached {0}"
+                .format(self.max_reconnection_attempts))
+
+        attempt = self.attempt_number
+        self.attempt_number += 1
+
+        if self.jitter is JitterType.decorrelated:
+            self._last_delay = min(
+                self.max_interval,
+                self._random.uniform(
+                    self.base_interval, self._last_delay * 3))
+            return self._last_delay
+
+        # exponent bounded, the cap is reached long before
+        delay = min(
+            self.max_interval,
+            self.base_interval * 2 ** min(attempt, 32))
+
+        if self.jitter is JitterType.full:
+            return self._random.uniform(0, delay)
+        return delay
+
+    def reset(self):
+        super(ExponentialReconnectionHandler, self).reset()
+        self._last_delay = self.base_interval
@@ -0,0 +1,184 @@
+import enum
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+from ..helpers import Helpers
+from .base_reconnection import BaseReconnection
+from .scheduler import Scheduler, ScheduledTask
+
+MAX_HISTORY = 20  # attempts kept on ReconnectMetrics.history
+
+
+class ReconnectState(enum.Enum):
+    idle = 0  # not reconnecting
+    waiting = 1  # next attempt scheduled
+    connecting = 2  # attempt running
+
+
+class ReconnectAttempt(object):
+    """Timings of a reconnection attempt, in seconds"""
+    def __init__(self, number: int, delay: float):
+        self.number = number
+        self.delay = delay  # waited before the attempt
+        self.started = time.time()
+        self.duration: Optional[float] = None
+        self.error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.duration is not None and self.error is None
+
+    def __repr__(self):
+        return "ReconnectAttempt: number {0}, delay {1:.3f}, "\
+            "duration {2}, error {3}".format(
+                self.number,
+                self.delay,
+                None if self.duration is None
+                else "{0:.3f}".format(self.duration),
+                self.error)
+
+
+class ReconnectMetrics(object):
+    """Counters and timings of the reconnections of a transport,
+    history keeps the last MAX_HISTORY attempts"""
+    def __init__(self):
+        self.attempts = 0
+        self.successes = 0
+        self.failures = 0
+        self.gave_up = 0
+        self.history: Deque[ReconnectAttempt] = deque(maxlen=MAX_HISTORY)
+
+    @property
+    def last_attempt(self) -> Optional[ReconnectAttempt]:
+        return self.history[-1] if len(self.history) > 0 else None
+
+    def start_attempt(self, number: int, delay: float) -> ReconnectAttempt:
+        attempt = ReconnectAttempt(number, delay)
+        self.attempts += 1
+        self.history.append(attempt)
+        return attempt
+
+    def end_attempt(
+            self,
+            attempt: ReconnectAttempt,
+            error: Optional[Exception] = None):
+        attempt.duration = time.time() - attempt.started
+        attempt.error = error
+        if error is None:
+            self.successes += 1
+        else:
+            self.failures += 1
+
+    def __repr__(self):
+        return "ReconnectMetrics: attempts {0}, successes {1}, "\
+            "failures {2}, gave up {3}, last {4}".format(
+                self.attempts,
+                self.successes,
+                self.failures,
+                self.gave_up,
+                self.last_attempt)
+
+
+class Reconnector(object):
+    """Reconnection state machine, attempts run on the scheduler pool
+    so the thread that noticed the failure (i.e. the receive thread)
+    is never blocked by negotiation, connection nor backoff sleeps.
+
+    The first attempt runs right away, after a failure the next one is
+    scheduled with the delay of the reconnection handler. on_give_up
+    is called with the last error once the handler has no more
+    attempts.
+
+    Args:
+        handler (BaseReconnection): delays between attempts
+        attempt (Callable[[], None]): reconnects, raises on failure
+        on_give_up (Callable[[Exception], None]): called when the
+            handler raises
+        scheduler (Scheduler): runs the attempts
+        metrics (ReconnectMetrics, optional): Defaults to None, new
+            metrics.
+    """
+    def __init__(
+            self,
+            handler: BaseReconnection,
+            attempt: Callable[[], None],
+            on_give_up: Callable[[Exception], None],
+            scheduler: Scheduler,
+            metrics: Optional[ReconnectMetrics] = None):
+        self.handler = handler
+        self.scheduler = scheduler
+        self.metrics = ReconnectMetrics() if metrics is None else metrics
+        self.state = ReconnectState.idle
+        self.logger = Helpers.get_logger()
+        self._attempt = attempt
+        self._on_give_up = on_give_up
+        self._task: Optional[ScheduledTask] = None
+        self._number = 0
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self.state is not ReconnectState.idle
+
+    def start(self) -> bool:
+        """Starts reconnecting
+
+        Returns:
+            bool: False if it was already reconnecting
+        """
+        with self._lock:
+            if self.running:
+                return False
+            self._number = 0
+            self._schedule(0)
+            return True
+
+    def cancel(self):
+        """Stops reconnecting, an attempt already running finishes
+        but no other one is scheduled"""
+        with self._lock:
+            self.state = ReconnectState.idle
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+    def _schedule(self, delay: float):
+        self.state = ReconnectState.waiting
+        self._task = self.scheduler.schedule(delay, self._run, delay)
+
+    def _run(self, delay: float):
+        with self._lock:
+            if self.state is not ReconnectState.waiting:
+                return  # cancelled
+            self.state = ReconnectState.connecting
+            self._task = None
+            self._number += 1
+            attempt = self.metrics.start_attempt(self._number, delay)
+
+        try:
+            self._attempt()
+        except Exception as ex:
+            self.metrics.end_attempt(attempt, ex)
+            self.logger.warning(
+                f"Reconnection attempt {attempt.number} failed {ex}")
+            self._retry(ex)
+            return
+
+        self.metrics.end_attempt(attempt)
+        with self._lock:
+            self.state = ReconnectState.idle
+
+    def _retry(self, error: Exception):
+        with self._lock:
+            if self.state is not ReconnectState.connecting:
+                return  # cancelled while connecting
+            try:
+                self._schedule(self.handler.next())
+                return
+            except ValueError as ex:  # no more attempts
+                self.logger.error(ex)
+                self.state = ReconnectState.idle
+                self.metrics.gave_up += 1
+
+        self._on_give_up(error)
@@ -0,0 +1,150 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from ..helpers import Helpers
+
+THREAD_NAME = "Signalrcore scheduler"
+
+
+class ScheduledTask(object):
+    """Handle of a callback scheduled on a :class:`Scheduler`"""
+    def __init__(
+            self,
+            deadline: float,
+            callback: Callable,
+            args: tuple):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Scheduler(object):
+    """Runs callbacks after a delay for every connection of the process.
+
+    Timers are kept on a heap ordered by deadline, a single thread
+    waits until the nearest one is due, so there is no polling while
+    nothing is scheduled. Due callbacks run on a small thread pool,
+    a slow callback (i.e. a reconnection) does not delay the timers of
+    other connections.
+
+    Args:
+        max_workers (int, optional): Threads running due callbacks.
+            Defaults to 4.
+    """
+    def __init__(self, max_workers: int = 4):
+        self.logger = Helpers.get_logger()
+        self.max_workers = max_workers
+        self._heap: List[Tuple[float, int, ScheduledTask]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running = False
+
+    def schedule(
+            self,
+            delay: float,
+            callback: Callable,
+            *args) -> ScheduledTask:
+        """Runs callback(*args) once, delay seconds from now
+
+        Returns:
+            ScheduledTask: handle to cancel the callback
+        """
+        task = ScheduledTask(time.monotonic() + delay, callback, args)
+        with self._condition:
+            if not self._running:
+                self._start()
+            heapq.heappush(
+                self._heap, (task.deadline, next(self._counter), task))
+            if self._heap[0][2] is task:  # new nearest deadline
+                self._condition.notify()
+        return task
+
+    def pending(self) -> int:
+        """Scheduled callbacks not cancelled yet"""
+        with self._condition:
+            return len([
+                entry for entry in self._heap if not entry[2].cancelled])
+
+    def shutdown(self, wait: bool = True):
+        """Stops the timer thread, scheduled callbacks are discarded"""
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+
+        if wait and thread is not None\
+                and thread is not threading.current_thread():
+            thread.join(timeout=10)
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _start(self):
+        self._running = True
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=THREAD_NAME)
+        self._thread = threading.Thread(
+            target=self._run,
+            name=THREAD_NAME)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _next_task(self) -> Optional[ScheduledTask]:
+        with self._condition:
+            while self._running:
+                while len(self._heap) > 0 and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+
+                if len(self._heap) == 0:
+                    self._condition.wait()
+                    continue
+
+                delay = self._heap[0][0] - time.monotonic()
+                if delay <= 0:
+                    return heapq.heappop(self._heap)[2]
+                self._condition.wait(delay)
+            return None
+
+    def _run(self):
+        executor = self._executor
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            try:
+                executor.submit(self._run_task, task)
+            except RuntimeError:  # pragma: no cover
+                return  # executor shut down
+
+    def _run_task(self, task: ScheduledTask):
+        if task.cancelled:
+            return
+        try:
+            task.callback(*task.args)
+        except Exception as ex:
+            self.logger.error(f"Scheduled callback failed: {ex}")
+
+
+_default_scheduler: Optional[Scheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """Scheduler shared by every connection of the process"""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = Scheduler()
+        return _default_scheduler
@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Union
+from ..helpers import Helpers
+
+THREAD_NAME = "Signalrcore send queue writer"
+
+
+class BatchMetrics(object):
+    """Counters about the batches written by a :class:`SendQueue`"""
+    def __init__(self):
+        self.batches = 0
+        self.messages = 0
+        self.bytes = 0
+        self.max_batch_messages = 0
+        self.max_batch_bytes = 0
+
+    def record(self, messages: int, size: int):
+        self.batches += 1
+        self.messages += messages
+        self.bytes += size
+        self.max_batch_messages = max(self.max_batch_messages, messages)
+        self.max_batch_bytes = max(self.max_batch_bytes, size)
+
+    def average_batch_messages(self) -> float:
+        return self.messages / self.batches if self.batches > 0 else 0
+
+    def average_batch_bytes(self) -> float:
+        return self.bytes / self.batches if self.batches > 0 else 0
+
+    def __repr__(self):
+        return "BatchMetrics: batches {0}, messages {1}, bytes {2}, "\
+            "max batch messages {3}, max batch bytes {4}".format(
+                self.batches,
+                self.messages,
+                self.bytes,
+                self.max_batch_messages,
+                self.max_batch_bytes)
+
+
+class SendQueue(object):
+    """Outbound queue drained by a single writer thread.
+    Encoded hub messages are self delimited (json records end with
+    the record separator, messagepack ones are varint prefixed), so the
+    writer concatenates everything queued into a single write, up to
+    max_batch_bytes. max_linger is the time the writer waits for more
+    messages once the first one is queued.
+    """
+    def __init__(
+            self,
+            write: Callable[[Union[str, bytes]], None],
+            max_batch_bytes: int = 64 * 1024,
+            max_linger: float = 0):
+        self.max_batch_bytes = max_batch_bytes
+        self.max_linger = max_linger
+        self.metrics = BatchMetrics()
+        self.logger = Helpers.get_logger()
+        self._write = write
+        self._queue = deque()
+        self._pending_bytes = 0
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: threading.Thread = None
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run,
+                name=THREAD_NAME)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """Stops the writer once pending messages are written"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+        is_same_thread = threading.current_thread() is self._thread
+
+        if self._thread is not None and not is_same_thread:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def put(self, data: Union[str, bytes]):
+        with self._condition:
+            self._queue.append(data)
+            self._pending_bytes += len(data)
+            self._condition.notify()
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def clear(self):
+        """Discards messages not written yet"""
+        with self._condition:
+            self._queue.clear()
+            self._pending_bytes = 0
+
+    def _next_batch(self) -> List[Union[str, bytes]]:
+        with self._condition:
+            while not self._queue and self._running:
+                self._condition.wait()
+
+            if not self._queue:
+                return []
+
+            deadline = time.monotonic() + self.max_linger
+
+            while self._running\
+                    and self._pending_bytes < self.max_batch_bytes:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = []
+            size = 0
+            while self._queue and (
+                    len(batch) == 0
+                    or size + len(self._queue[0]) <= self.max_batch_bytes):
+                data = self._queue.popleft()
+                batch.append(data)
+                size += len(data)
+
+            self._pending_bytes -= size
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+
+            if len(batch) == 0:
+                return
+
+            data = "".join(batch)\
+                if type(batch[0]) is str else\
+                b"".join(batch)
+
+            self.metrics.record(len(batch), len(data))
+
+            try:
+                self._write(data)
+            except Exception as ex:  # pragma: no cover
+                self.logger.error(f"Send queue write error {ex}")
@@ -45,6 +45,7 @@ class BaseSocketClient(BaseClient):
 
         self.logger = Helpers.get_logger()
 
+        self.sock: Optional[socket.socket] = None
         self.running: bool = False
         self.is_closing: bool = False
         self.recv_thread: threading.Thread = None
@@ -64,6 +65,10 @@ class BaseSocketClient(BaseClient):
     def prepare_data(self, data):  # pragma: no cover
         raise NotImplementedError("Clients must implement data postprocessing")
 
+    def _buffer_initial_data(self, data: bytes):  # pragma: no cover
+        """Receives the bytes read after the http response headers"""
+        raise NotImplementedError("Clients must keep data sent after headers")
+
     def create_socket(self):
         parsed_url = parse.urlparse(self.url)
         host, port = parsed_url.hostname, parsed_url.port
@@ -121,6 +126,12 @@ class BaseSocketClient(BaseClient):
             raise SocketHandshakeError(
                 f"Handshake failed: {response.decode()}")
 
+        crlf_crlf = CRLF_CRLF.encode(DEFAULT_ENCODING)
+        body_start = response[response.index(crlf_crlf) + len(crlf_crlf):]
+
+        if body_start:
+            self._buffer_initial_data(body_start)
+
         self.running = True
         self.recv_thread = threading.Thread(
             target=self.run,
@@ -150,6 +161,11 @@ class BaseSocketClient(BaseClient):
 
     def dispose(self):
         if self.sock is not None:
+            try:
+                # wakes up a receive thread blocked on a dead connection
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             self.sock.close()
 
         is_same_thread = threading.current_thread().name == self.thread_name
@@ -178,8 +194,10 @@ class BaseSocketClient(BaseClient):
             # that file descriptor points to a closed file
             has_closed_fd = type(e) is OSError and e.errno == 9
 
-            # closed by the server
-            connection_closed = has_closed_fd or type(e) is SocketClosedError
+            # closed by the server or reset by the network
+            connection_closed = has_closed_fd\
+                or type(e) is SocketClosedError\
+                or isinstance(e, ConnectionError)
 
             if (has_no_content or connection_closed) and not self.is_closing:
                 self.on_close()
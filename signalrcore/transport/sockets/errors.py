@@ -26,3 +26,18 @@ class SocketClosedError(Exception):
     def __init__(self, data: Optional[bytes] = None):  # pragma: no cover
         self.data = data
         super().__init__("Socket closed by the the server")
+
+
+class MessageTooBigError(Exception):
+    """Message received is bigger than the max message size configured
+
+    Args:
+        size (int): message size
+        max_message_size (int): max message size allowed
+    """
+    def __init__(self, size: int, max_message_size: int):
+        self.size = size
+        self.max_message_size = max_message_size
+        super().__init__(
+            f"Message size {size} exceeds max message size "
+            f"{max_message_size}")
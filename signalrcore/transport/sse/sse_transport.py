@@ -22,7 +22,10 @@ class SSETransport(BaseTransport):
         self.keep_alive_interval = keep_alive_interval
         self.connection_checker = ConnectionStateChecker(
             self.connection_check,
-            keep_alive_interval
+            keep_alive_interval,
+            scheduler=self.scheduler,
+            server_timeout=self.server_timeout,
+            on_server_timeout=self.on_server_timeout
         )
 
         self.manually_closing = False
@@ -109,6 +112,7 @@ class SSETransport(BaseTransport):
 
     def on_message(self, app, raw_message):
         self.logger.debug("Message received {0}".format(raw_message))
+        self.connection_checker.last_received = time.time()
 
         self.connection_checker.last_message = time.time()
 
@@ -126,11 +130,9 @@ class SSETransport(BaseTransport):
         return self._on_message(
             self.protocol.parse_messages(raw_message))
 
-    def send(self, message):
-        self.logger.debug("Sending message {0}".format(message))
+    def _send_data(self, data):
         try:
-            self._client.send(
-                self.protocol.encode(message))
+            self._client.send(data)
         except OSError as ex:  # pragma: no cover
             self.handshake_received = False  # pragma: no cover
             self.logger.warning("Connection closed {0}".format(ex))
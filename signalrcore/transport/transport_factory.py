@@ -13,9 +13,20 @@ TRANSPORTS = {
     HttpTransportType.long_polling: LongPollingTransport
 }
 
+# Fallback order when the preferred transport is not available
+FALLBACKS = [
+    HttpTransportType.web_sockets,
+    HttpTransportType.server_sent_events,
+    HttpTransportType.long_polling
+]
+
 
 class TransportFactory(object):
+    transports = TRANSPORTS
+
+    @classmethod
     def create(
+            cls,
             negotiate_response: NegotiateResponse,
             preferred_transport: Optional[HttpTransportType],
             **kwargs) -> BaseTransport:
@@ -26,17 +37,11 @@ class TransportFactory(object):
                 negotiate_response.available_transports))
 
         if preferred_transport in names:
-            return TRANSPORTS.get(preferred_transport)(**kwargs)
-
-        # Fallbacks
-        if HttpTransportType.web_sockets in names:
-            return WebsocketTransport(**kwargs)
-
-        if HttpTransportType.server_sent_events in names:  # pragma no cover
-            return SSETransport(**kwargs)
+            return cls.transports.get(preferred_transport)(**kwargs)
 
-        if HttpTransportType.server_sent_events in names:  # pragma no cover
-            return LongPollingTransport(**kwargs)
+        for transport_type in FALLBACKS:
+            if transport_type in names:
+                return cls.transports.get(transport_type)(**kwargs)
 
         raise RuntimeError(
             f"Invalid transport types received {names}")  # pragma no cover
@@ -0,0 +1,33 @@
+import os
+import struct
+from .masking import mask_payload
+
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+
+def encode_frame(payload: bytes, opcode: int = OPCODE_TEXT) -> bytes:
+    """Builds a masked client frame (RFC 6455 §5.2), no fragmentation
+
+    Args:
+        payload (bytes): frame payload
+        opcode (int, optional): frame opcode. Defaults to OPCODE_TEXT.
+
+    Returns:
+        bytes: frame ready to be written on the socket
+    """
+    header = bytes([0x80 | opcode])
+    length = len(payload)
+    if length <= 125:
+        header += bytes([0x80 | length])
+    elif length <= 65535:
+        header += bytes([0x80 | 126]) + struct.pack(">H", length)
+    else:
+        header += bytes([0x80 | 127]) + struct.pack(">Q", length)
+
+    # Mask the payload
+    masking_key = os.urandom(4)
+    return header + masking_key + mask_payload(payload, masking_key)
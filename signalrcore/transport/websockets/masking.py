@@ -0,0 +1,39 @@
+"""Client to server payload masking (RFC 6455 §5.3)
+
+Masking is done word wide with python integers, XORing the whole
+payload against the repeated key in a single operation. If wsaccel
+is installed its C implementation is used instead.
+"""
+try:  # pragma: no cover
+    from wsaccel.xormask import XorMaskerSimple
+except ImportError:  # pragma: no cover
+    XorMaskerSimple = None
+
+
+def has_accelerator() -> bool:
+    return XorMaskerSimple is not None
+
+
+def mask_python(payload: bytes, masking_key: bytes) -> bytes:
+    length = len(payload)
+    if length == 0:
+        return b""
+    key = (masking_key * (length // 4 + 1))[:length]
+    masked = int.from_bytes(payload, "little")\
+        ^ int.from_bytes(key, "little")
+    return masked.to_bytes(length, "little")
+
+
+def mask_payload(payload: bytes, masking_key: bytes) -> bytes:
+    """Masks (or unmasks) a payload with a 4 bytes key
+
+    Args:
+        payload (bytes): frame payload
+        masking_key (bytes): 4 bytes masking key
+
+    Returns:
+        bytes: masked payload
+    """
+    if XorMaskerSimple is not None:  # pragma: no cover
+        return XorMaskerSimple(masking_key).process(payload)
+    return mask_python(payload, masking_key)
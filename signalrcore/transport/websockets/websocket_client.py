@@ -6,11 +6,14 @@ import urllib.parse as parse
 
 from typing import Optional, Callable, Union
 
-from ..sockets.errors import SocketClosedError, NoHeaderException
+from ..sockets.errors import SocketClosedError, NoHeaderException, \
+    MessageTooBigError
 from ..sockets.base_socket_client import BaseSocketClient
+from .frame import encode_frame
 from ...types import DEFAULT_ENCODING
 
 THREAD_NAME = "Signalrcore websocket client"
+RECV_BUFFER_SIZE = 64 * 1024
 
 
 class WebSocketClient(BaseSocketClient):
@@ -26,7 +29,8 @@ class WebSocketClient(BaseSocketClient):
             on_message: Callable = None,
             on_open: Callable = None,
             on_error: Callable = None,
-            on_close: Callable = None):
+            on_close: Callable = None,
+            max_message_size: Optional[int] = None):
         super(WebSocketClient, self).__init__(
             thread_name=THREAD_NAME,
             success_status_code=b"101",
@@ -42,6 +46,11 @@ class WebSocketClient(BaseSocketClient):
             on_error=on_error,
             on_close=on_close
         )
+        self.max_message_size = max_message_size
+        self._recv_buffer = bytearray(RECV_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buffer)
+        self._start = 0  # first unread byte
+        self._end = 0  # end of the received data
 
     def get_socket_headers(self):
         parsed_url = parse.urlparse(self.url)
@@ -66,8 +75,8 @@ class WebSocketClient(BaseSocketClient):
 
     def prepare_data(self, data):
         if self.is_binary:
-            return data
-        return data.decode(DEFAULT_ENCODING)
+            return bytes(data)
+        return str(data, DEFAULT_ENCODING)
 
     def send(
             self,
@@ -80,33 +89,79 @@ class WebSocketClient(BaseSocketClient):
         # Text or binary opcode (no fragmentation)
         payload = message.encode(DEFAULT_ENCODING)\
             if type(message) is str else message
-        header = bytes([0x80 | opcode])
-        length = len(payload)
-        if length <= 125:
-            header += bytes([0x80 | length])
-        elif length <= 65535:
-            header += bytes([0x80 | 126]) + struct.pack(">H", length)
+        self.sock.sendall(encode_frame(payload, opcode))
+
+    def _buffer_initial_data(self, data: bytes):
+        """Keeps frame bytes received along with the http handshake"""
+        self._fill_from(data)
+
+    def _fill_from(self, data: bytes):
+        self._reserve(len(data))
+        self._recv_buffer[self._end: self._end + len(data)] = data
+        self._end += len(data)
+
+    def _reserve(self, n: int):
+        """Makes room for n more bytes after the unread data,
+        compacting the buffer or growing it if needed."""
+        unread = self._end - self._start
+
+        if self._end + n <= len(self._recv_buffer):
+            return
+
+        size = len(self._recv_buffer)
+
+        if unread + n > size:
+            size = max(unread + n, size * 2)
+
+        if size != len(self._recv_buffer):
+            buffer = bytearray(size)
+            buffer[0: unread] = self._recv_view[self._start: self._end]
+            self._recv_buffer = buffer
+            self._recv_view = memoryview(buffer)
         else:
-            header += bytes([0x80 | 127]) + struct.pack(">Q", length)
-
-        # Mask the payload
-        masking_key = os.urandom(4)
-        masked_payload = bytes(
-            b ^ masking_key[i % 4]
-            for i, b in enumerate(payload))
-        frame = header + masking_key + masked_payload
-        self.sock.sendall(frame)
-
-    def _recv_exactly(self, n):
-        """Receive exactly n bytes, looping over partial reads."""
-        data = b""
-        while len(data) < n:
-            chunk = self.sock.recv(n - len(data))
-            if not chunk:  # pragma: no cover
-                raise SocketClosedError()
-            data += chunk
+            self._recv_view[0: unread] =\
+                self._recv_view[self._start: self._end]
+
+        self._start, self._end = 0, unread
+
+    def _recv_exactly(self, n) -> memoryview:
+        """Receive exactly n bytes, reading as much as the socket has
+        available into the receive buffer. The returned view is only
+        valid until the next read.
+        """
+        unread = self._end - self._start
+
+        if unread < n:
+            self._reserve(
+                max(n - unread, RECV_BUFFER_SIZE - unread)
+                if unread < RECV_BUFFER_SIZE else n - unread)
+
+            while self._end - self._start < n:
+                read = self.sock.recv_into(self._recv_view[self._end:])
+                if read == 0:  # pragma: no cover
+                    raise SocketClosedError()
+                self._end += read
+
+        data = self._recv_view[self._start: self._start + n]
+        self._start += n
+
+        if self._start == self._end:
+            self._start = self._end = 0
+            if len(self._recv_buffer) > RECV_BUFFER_SIZE:
+                # release memory used by a big message
+                self._recv_buffer = bytearray(RECV_BUFFER_SIZE)
+                self._recv_view = memoryview(self._recv_buffer)
         return data
 
+    def _check_message_size(self, size: int):
+        if self.max_message_size is not None\
+                and size > self.max_message_size:
+            try:
+                self.send(struct.pack(">H", 1009), opcode=0x8)
+            except Exception:  # pragma: no cover
+                pass
+            raise MessageTooBigError(size, self.max_message_size)
+
     def _read_one_frame(self):
         """Read a single WebSocket frame. Returns (fin, opcode, data)."""
         try:
@@ -139,6 +194,8 @@ class WebSocketClient(BaseSocketClient):
         elif payload_len == 127:  # pragma: no cover
             payload_len = struct.unpack(">Q", self._recv_exactly(8))[0]
 
+        self._check_message_size(payload_len)
+
         data = self._recv_exactly(payload_len)
 
         return fin, opcode, data
@@ -150,13 +207,18 @@ class WebSocketClient(BaseSocketClient):
             raise SocketClosedError()
 
         payload = data
-        while not fin:
-            fin, cont_opcode, data = self._read_one_frame()
-            if cont_opcode == 0x8:  # pragma: no cover
-                raise SocketClosedError()
-            payload += data
+
+        if not fin:
+            fragments = bytearray(data)
+            while not fin:
+                fin, cont_opcode, data = self._read_one_frame()
+                if cont_opcode == 0x8:  # pragma: no cover
+                    raise SocketClosedError()
+                self._check_message_size(len(fragments) + len(data))
+                fragments += data
+            payload = fragments
 
         if self.is_trace_enabled():
-            self.logger.debug(f"[TRACE] - {payload}")
+            self.logger.debug(f"[TRACE] - {bytes(payload)}")
 
         return self.prepare_data(payload)
@@ -9,6 +9,8 @@ from .websocket_client import WebSocketClient, SocketClosedError
 
 class WebsocketTransport(BaseTransport):
     _client: Optional[WebSocketClient] = None
+    supports_stateful_reconnect = True
+    requires_connection_token = False
 
     def __init__(
             self,
@@ -18,7 +20,10 @@ class WebsocketTransport(BaseTransport):
         self.handshake_received = False
         self.connection_checker = ConnectionStateChecker(
             lambda: self.send(PingMessage()),
-            keep_alive_interval
+            keep_alive_interval,
+            scheduler=self.scheduler,
+            server_timeout=self.server_timeout,
+            on_server_timeout=self.on_server_timeout
         )
 
     def create_client(self) -> WebSocketClient:
@@ -32,7 +37,8 @@ class WebsocketTransport(BaseTransport):
             on_message=self.on_message,
             on_error=self.on_socket_error,
             on_close=self.on_socket_close,
-            on_open=self.on_socket_open)
+            on_open=self.on_socket_open,
+            max_message_size=self.max_message_size)
 
     def evaluate_handshake(self, message):
         self.logger.debug("Evaluating handshake {0}".format(message))
@@ -42,8 +48,10 @@ class WebsocketTransport(BaseTransport):
             self._set_state(TransportState.connected)
             if self.reconnection_handler is not None:
                 self.reconnection_handler.reconnecting = False
-                if not self.connection_checker.running:
-                    self.connection_checker.start()
+            use_checker = self.reconnection_handler is not None\
+                or self.server_timeout is not None
+            if use_checker and not self.connection_checker.running:
+                self.connection_checker.start()
         else:
             self.logger.error(msg.error)
             self.on_socket_error(msg.error)
@@ -62,19 +70,60 @@ class WebsocketTransport(BaseTransport):
         super().on_socket_error(error)
 
     def on_socket_close(self):
-        if not self.manually_closing and\
-                self.reconnection_handler is not None\
-                and not self.is_reconnecting():
-            self.handle_reconnect()
+        if self.resume() or self.handle_reconnect():
             return
+        if self.reconnector is not None and self.reconnector.running:
+            return  # an attempt socket closed, the reconnector retries
         self._set_state(TransportState.disconnected)
 
     def on_socket_open(self):
         self.logger.debug("-- web socket open --")
+        if self._resuming:
+            self._resend()
+            return
         self.send_handshake()
 
+    def resume(self) -> bool:
+        """Stateful reconnect: opens a new socket on the same server
+        connection, without negotiation nor handshake, and sends the
+        messages not acknowledged yet. The regular reconnection runs if
+        the server does not accept it.
+
+        Returns:
+            bool: True if the stateful reconnection started
+        """
+        if self.message_buffer is None\
+                or self.manually_closing\
+                or self._resuming\
+                or not self.handshake_received:
+            return False
+
+        self.logger.warning("Connection lost, stateful reconnect")
+        self._resuming = True
+        self._set_state(TransportState.reconnecting)
+        self.scheduler.schedule(0, self._resume)
+        return True
+
+    def _resume(self):
+        try:
+            if self.send_queue is not None:
+                self.send_queue.clear()  # buffered messages are resent
+            self._client.dispose()
+            self._client = self.create_client()
+            self._client.connect()
+        except Exception as ex:
+            self.logger.warning(f"Stateful reconnect failed {ex}")
+            self._resuming = False
+            self.handshake_received = False
+
+            if self.reconnection_handler is None or self.manually_closing:
+                self._set_state(TransportState.disconnected)
+                return
+            self._reconnect()
+
     def on_message(self, app, raw_message):
         self.logger.debug("Message received {0}".format(raw_message))
+        self.connection_checker.last_received = time.time()
         if not self.handshake_received:
             messages = self.evaluate_handshake(raw_message)
             self._set_state(TransportState.connected)
@@ -87,11 +136,10 @@ class WebsocketTransport(BaseTransport):
         return self._on_message(
             self.protocol.parse_messages(raw_message))
 
-    def send(self, message):
-        self.logger.debug("Sending message {0}".format(message))
+    def _send_data(self, data):
         try:
             self._client.send(
-                self.protocol.encode(message),
+                data,
                 opcode=0x2
                 if type(self.protocol) is MessagePackHubProtocol else
                 0x1)
@@ -99,8 +147,10 @@ class WebsocketTransport(BaseTransport):
             if self.reconnection_handler is not None:
                 self.reconnection_handler.reset()
         except (OSError, SocketClosedError) as ex:  # pragma: no cover
-            self.handshake_received = False  # pragma: no cover
             self.logger.warning("Connection closed {0}".format(ex))
+            if self.resume():
+                return  # sequenced messages are sent again
+            self.handshake_received = False  # pragma: no cover
             # pragma: no cover
             if self.reconnection_handler is None:  # pragma: no cover
                 self._set_state(TransportState.disconnected)
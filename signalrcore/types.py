@@ -12,6 +12,20 @@ class HubProtocolEncoding(enum.Enum):
     binary = "Binary"
 
 
+class DispatchMode(enum.Enum):
+    inline = "Inline"
+    thread_pool = "ThreadPool"
+    serialized = "Serialized"
+    asyncio = "Asyncio"
+
+
+class OverflowPolicy(enum.Enum):
+    block = "Block"
+    drop_oldest = "DropOldest"
+    drop_newest = "DropNewest"
+    coalesce_latest = "CoalesceLatest"
+
+
 RECORD_SEPARATOR = chr(0x1E)
 DEFAULT_ENCODING = "utf-8"
 CRLF = "\r\n"
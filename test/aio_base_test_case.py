@@ -30,6 +30,7 @@ class AIOBaseTestCase(unittest.IsolatedAsyncioTestCase):
 class AIOConnectionBaseTestCase(AIOBaseTestCase):
     server_url = Urls.server_url_ssl
     connection: AIOBaseHubConnection
+    native_transport = False
 
     async def get_connection(self, options={"verify_ssl": False})\
             -> AIOBaseHubConnection:
@@ -45,6 +46,9 @@ class AIOConnectionBaseTestCase(AIOBaseTestCase):
                 "max_attempts": 5
             })
 
+        if self.native_transport:
+            builder.with_native_transport()
+
         hub = builder.build()
 
         await hub.start()
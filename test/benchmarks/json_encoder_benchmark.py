@@ -0,0 +1,72 @@
+"""JSON hub protocol encoding throughput
+
+    python -m test.benchmarks.json_encoder_benchmark
+"""
+import json
+import time
+
+from signalrcore.protocol.json_encoder import \
+    JsonMessageEncoder, available_backends, KEY_NAMES
+from signalrcore.messages.invocation_message import InvocationMessage
+from signalrcore.messages.stream_item_message import StreamItemMessage
+from signalrcore.messages.completion_message import CompletionMessage
+from signalrcore.messages.message_type import MessageType
+from signalrcore.types import RECORD_SEPARATOR
+
+MIN_BENCH_TIME = 0.5  # seconds per measure
+
+
+def legacy_encode(message) -> str:
+    """Previous encoder: copies __dict__ on every message (the original
+    renamed keys in place) and encodes twice, once for the debug log"""
+    def default(o):
+        if type(o) is MessageType:
+            return o.value
+        return {KEY_NAMES.get(k, k): v for k, v in vars(o).items()}
+    encoder = json.JSONEncoder(default=default)
+    encoder.encode(message)
+    return encoder.encode(message) + RECORD_SEPARATOR
+
+
+def messages_per_second(function, message) -> float:
+    iterations = 0
+    t0 = time.perf_counter()
+    elapsed = 0
+    while elapsed < MIN_BENCH_TIME:
+        for _ in range(100):
+            function(message)
+        iterations += 100
+        elapsed = time.perf_counter() - t0
+    return iterations / elapsed
+
+
+def main():
+    messages = [
+        ("invocation", InvocationMessage(
+            "b6c4c0ba-4be4-4d4c-8f1a-8a2c4d0b9b1e",
+            "SendMessage",
+            ["user", "a short chat message", {"n": 1, "tags": ["x"]}])),
+        ("stream item", StreamItemMessage(
+            "42", {"price": 10.5, "symbol": "ABC", "volume": 1000})),
+        ("completion", CompletionMessage("42", [1, 2, 3, 4], None))
+    ]
+
+    functions = [("legacy", legacy_encode)] + [
+        (backend, JsonMessageEncoder(backend).encode)
+        for backend in available_backends()
+    ]
+
+    print("{0:>12} | ".format("message") + " | ".join(
+        "{0:>10}".format(name) for name, _ in functions) + "  (msg/s)")
+
+    for name, message in messages:
+        results = [
+            messages_per_second(function, message)
+            for _, function in functions
+        ]
+        print("{0:>12} | ".format(name) + " | ".join(
+            "{0:>10.0f}".format(result) for result in results))
+
+
+if __name__ == "__main__":
+    main()
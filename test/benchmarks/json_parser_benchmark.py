@@ -0,0 +1,107 @@
+"""JSON hub protocol parsing throughput and allocations
+
+    python -m test.benchmarks.json_parser_benchmark
+"""
+import json
+import time
+import tracemalloc
+
+from signalrcore.protocol.json_hub_protocol import JsonHubProtocol
+from signalrcore.messages.invocation_message import InvocationMessage
+from signalrcore.messages.stream_item_message import StreamItemMessage
+from signalrcore.messages.completion_message import CompletionMessage
+from signalrcore.messages.ping_message import PingMessage
+from signalrcore.messages.message_type import MessageType
+from signalrcore.types import RECORD_SEPARATOR
+
+MIN_BENCH_TIME = 0.5  # seconds per measure
+BATCH_SIZES = [1, 10, 100]
+
+RECORDS = [
+    '{"type":1,"target":"ReceiveMessage",'
+    '"arguments":["user","a short chat message"]}',
+    '{"type":2,"invocationId":"42",'
+    '"item":{"price":10.5,"symbol":"ABC","volume":1000}}',
+    '{"type":3,"invocationId":"42","result":[1,2,3,4]}',
+    '{"type":6}'
+]
+
+
+def legacy_parse(raw):
+    """Previous parser: split, replace, build a list, then rewrite
+    every dict before unpacking it into the message class"""
+    raw_messages = [
+        record.replace(RECORD_SEPARATOR, "")
+        for record in raw.split(RECORD_SEPARATOR)
+        if record is not None and record != ""
+        and record != RECORD_SEPARATOR
+    ]
+    result = []
+    for raw_message in raw_messages:
+        dict_message = json.loads(raw_message)
+        if len(dict_message.keys()) > 0:
+            message_type = MessageType(dict_message.get("type", 6))
+            dict_message["invocation_id"] =\
+                dict_message.get("invocationId", None)
+            dict_message["headers"] = dict_message.get("headers", {})
+            dict_message["error"] = dict_message.get("error", None)
+            dict_message["result"] = dict_message.get("result", None)
+            dict_message["sequence_id"] =\
+                dict_message.get("sequenceId", None)
+            if message_type is MessageType.invocation:
+                result.append(InvocationMessage(**dict_message))
+            elif message_type is MessageType.stream_item:
+                result.append(StreamItemMessage(**dict_message))
+            elif message_type is MessageType.completion:
+                result.append(CompletionMessage(**dict_message))
+            else:
+                result.append(PingMessage())
+    return result
+
+
+def messages_per_second(function, raw, count) -> float:
+    iterations = 0
+    t0 = time.perf_counter()
+    elapsed = 0
+    while elapsed < MIN_BENCH_TIME:
+        function(raw)
+        iterations += 1
+        elapsed = time.perf_counter() - t0
+    return count * iterations / elapsed
+
+
+def main():
+    protocol = JsonHubProtocol(backend="json")
+    functions = [
+        ("legacy", legacy_parse),
+        ("incremental", protocol.parse_messages)
+    ]
+
+    print("{0:>6} | ".format("batch") + " | ".join(
+        "{0:>12}".format(name) for name, _ in functions) + "  (msg/s)")
+
+    for batch in BATCH_SIZES:
+        raw = "".join(
+            RECORDS[i % len(RECORDS)] + RECORD_SEPARATOR
+            for i in range(batch))
+        results = [
+            messages_per_second(function, raw, batch)
+            for _, function in functions
+        ]
+        print("{0:>6} | ".format(batch) + " | ".join(
+            "{0:>12.0f}".format(result) for result in results))
+
+    print()
+    print("peak memory per 100 messages batch")
+    raw = "".join(
+        RECORDS[i % len(RECORDS)] + RECORD_SEPARATOR for i in range(100))
+    for name, function in functions:
+        tracemalloc.start()
+        function(raw)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("{0:>12}: {1} bytes".format(name, peak))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Websocket payload masking throughput
+
+    python -m test.benchmarks.masking_benchmark
+"""
+import os
+import time
+
+from signalrcore.transport.websockets.masking import \
+    mask_payload, mask_python, has_accelerator
+
+SIZES = [64, 1024, 16 * 1024, 256 * 1024, 1024 * 1024, 16 * 1024 * 1024]
+MIN_BENCH_TIME = 0.5  # seconds per measure
+
+
+def mask_per_byte(payload: bytes, masking_key: bytes) -> bytes:
+    return bytes(b ^ masking_key[i % 4] for i, b in enumerate(payload))
+
+
+def throughput(function, payload: bytes, masking_key: bytes) -> float:
+    iterations = 0
+    t0 = time.perf_counter()
+    elapsed = 0
+    while elapsed < MIN_BENCH_TIME:
+        function(payload, masking_key)
+        iterations += 1
+        elapsed = time.perf_counter() - t0
+    return len(payload) * iterations / elapsed / (1024 * 1024)
+
+
+def main():
+    masking_key = os.urandom(4)
+    functions = [
+        ("per byte", mask_per_byte),
+        ("int.from_bytes", mask_python)
+    ]
+
+    if has_accelerator():  # pragma: no cover
+        functions.append(("wsaccel", mask_payload))
+
+    print("{0:>10} | ".format("size") + " | ".join(
+        "{0:>16}".format(name) for name, _ in functions) + "  (MB/s)")
+
+    for size in SIZES:
+        payload = os.urandom(size)
+        results = [
+            throughput(function, payload, masking_key)
+            for _, function in functions
+        ]
+        print("{0:>10} | ".format(size) + " | ".join(
+            "{0:>16.1f}".format(result) for result in results))
+
+
+if __name__ == "__main__":
+    main()
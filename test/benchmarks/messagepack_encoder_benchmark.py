@@ -0,0 +1,96 @@
+"""MessagePack hub protocol encoding throughput
+
+    python -m test.benchmarks.messagepack_encoder_benchmark
+"""
+import time
+
+import msgpack
+
+from signalrcore.protocol.messagepack_protocol import MessagePackHubProtocol
+from signalrcore.messages.invocation_message import InvocationMessage
+from signalrcore.messages.stream_item_message import StreamItemMessage
+from signalrcore.messages.completion_message import CompletionMessage
+
+MIN_BENCH_TIME = 0.5  # seconds per measure
+
+PRIORITY = [
+    "type",
+    "headers",
+    "invocation_id",
+    "target",
+    "arguments",
+    "item",
+    "result_kind",
+    "result",
+    "stream_ids"
+]
+
+
+def legacy_encode(message) -> bytes:
+    """Previous encoder: hasattr/getattr walk, packb and bytes
+    concatenation of the length prefix"""
+    result = []
+    for attribute in PRIORITY:
+        if hasattr(message, attribute):
+            if attribute == "type":
+                result.append(getattr(message, attribute).value)
+            else:
+                result.append(getattr(message, attribute))
+    encoded_message = msgpack.packb(result)
+    value = len(encoded_message)
+    buffer = b''
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            buffer += bytes((byte | 0x80, ))
+        else:
+            buffer += bytes((byte, ))
+            break
+    return buffer + encoded_message
+
+
+def messages_per_second(function, message) -> float:
+    iterations = 0
+    t0 = time.perf_counter()
+    elapsed = 0
+    while elapsed < MIN_BENCH_TIME:
+        for _ in range(100):
+            function(message)
+        iterations += 100
+        elapsed = time.perf_counter() - t0
+    return iterations / elapsed
+
+
+def main():
+    protocol = MessagePackHubProtocol()
+    messages = [
+        ("invocation", InvocationMessage(
+            "b6c4c0ba-4be4-4d4c-8f1a-8a2c4d0b9b1e",
+            "SendMessage",
+            ["user", "a short chat message"],
+            headers={})),
+        ("stream item", StreamItemMessage(
+            "42", {"price": 10.5, "symbol": "ABC", "volume": 1000})),
+        ("completion", CompletionMessage("42", [1, 2, 3, 4], None)),
+        ("16KB item", StreamItemMessage("42", b"\x00" * 16 * 1024))
+    ]
+    functions = [
+        ("legacy", legacy_encode),
+        ("precompiled", protocol.encode)
+    ]
+
+    print("{0:>12} | ".format("message") + " | ".join(
+        "{0:>12}".format(name) for name, _ in functions) + "  (msg/s)")
+
+    for name, message in messages:
+        results = [
+            messages_per_second(function, message)
+            for _, function in functions
+        ]
+        print("{0:>12} | ".format(name) + " | ".join(
+            "{0:>12.0f}".format(result) for result in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""MessagePack hub protocol parsing throughput
+
+    python -m test.benchmarks.messagepack_parser_benchmark
+"""
+import time
+
+import msgpack
+
+from signalrcore.protocol.messagepack_protocol import MessagePackHubProtocol
+
+MIN_BENCH_TIME = 0.5  # seconds per measure
+BATCH_SIZES = [1, 10, 100]
+
+MESSAGES = [
+    [1, {}, None, "ReceiveMessage", ["user", "a short chat message"], []],
+    [2, {}, "42", {"price": 10.5, "symbol": "ABC", "volume": 1000}],
+    [3, {}, "42", 3, [1, 2, 3, 4]],
+    [6]
+]
+
+
+def legacy_parse(protocol, raw):
+    """Previous parser: per byte varint loop, slice and unpackb"""
+    messages = []
+    offset = 0
+    num_bits_to_shift = [0, 7, 14, 21, 28]
+    while offset < len(raw):
+        length = 0
+        num_bytes = 0
+        while True:
+            byte_read = raw[offset + num_bytes]
+            length |= (byte_read & 0x7F) << num_bits_to_shift[num_bytes]
+            num_bytes += 1
+            if byte_read & 0x80 == 0:
+                break
+        offset = offset + num_bytes
+        values = msgpack.unpackb(raw[offset: offset + length])
+        offset = offset + length
+        messages.append(protocol._decode_message(values))
+    return messages
+
+
+def messages_per_second(function, chunks, count) -> float:
+    iterations = 0
+    t0 = time.perf_counter()
+    elapsed = 0
+    while elapsed < MIN_BENCH_TIME:
+        for chunk in chunks:
+            function(chunk)
+        iterations += 1
+        elapsed = time.perf_counter() - t0
+    return count * iterations / elapsed
+
+
+def main():
+    protocol = MessagePackHubProtocol()
+    functions = [
+        ("legacy", lambda raw: legacy_parse(protocol, raw)),
+        ("incremental", protocol.parse_messages)
+    ]
+
+    print("{0:>6} | ".format("batch") + " | ".join(
+        "{0:>12}".format(name) for name, _ in functions) + "  (msg/s)")
+
+    for batch in BATCH_SIZES:
+        raw = b""
+        for i in range(batch):
+            payload = msgpack.packb(MESSAGES[i % len(MESSAGES)])
+            raw += protocol._to_varint(len(payload)) + payload
+        results = [
+            messages_per_second(function, [raw], batch)
+            for _, function in functions
+        ]
+        print("{0:>6} | ".format(batch) + " | ".join(
+            "{0:>12.0f}".format(result) for result in results))
+
+    # large messages are unpacked from the buffer without copies
+    payload = msgpack.packb([2, {}, "42", b"\x00" * 256 * 1024])
+    raw = protocol._to_varint(len(payload)) + payload
+    results = [
+        messages_per_second(function, [raw], 1)
+        for _, function in functions
+    ]
+    print("{0:>6} | ".format("256KB") + " | ".join(
+        "{0:>12.0f}".format(result) for result in results))
+
+    # split frames are only supported by the incremental parser
+    raw = b""
+    for i in range(100):
+        payload = msgpack.packb(MESSAGES[i % len(MESSAGES)])
+        raw += protocol._to_varint(len(payload)) + payload
+    chunks = [raw[i: i + 1000] for i in range(0, len(raw), 1000)]
+    print("{0:>6} | {1:>12} | {2:>12.0f}  (100 messages, 1KB frames)".format(
+        "split", "-",
+        messages_per_second(protocol.parse_messages, chunks, 100)))
+
+
+if __name__ == "__main__":
+    main()
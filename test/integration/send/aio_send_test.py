@@ -1,5 +1,7 @@
+import asyncio
 import threading
 from typing import Dict
+from signalrcore.transport.base_transport import TransportState
 from ...aio_base_test_case import AIOConnectionBaseTestCase
 
 
@@ -27,3 +29,28 @@ class AIOSendTests(AIOConnectionBaseTestCase):
 
         self.assertTrue(
             LOCKS[identifier].acquire(timeout=10))
+
+
+class AIONativeSendTests(AIOConnectionBaseTestCase):
+    native_transport = True
+
+    async def test_aio_native_send(self):
+        identifier = self.get_random_id()
+        loop = asyncio.get_running_loop()
+        received = asyncio.Event()
+
+        def release(msg):
+            if identifier in msg[1]:
+                loop.call_soon_threadsafe(received.set)
+
+        self.connection.on("ReceiveMessage", release)
+        message = "new message {0}".format(identifier)
+        username = "mandrewcito"
+
+        await self.connection.send("SendMessage", [username, message])
+
+        await asyncio.wait_for(received.wait(), timeout=10)
+
+        self.assertEqual(
+            TransportState.connected,
+            self.connection.transport.state)
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from ..base_test_case import BaseTestCase
+from signalrcore.hub.dispatchers import InlineDispatcher, \
+    ThreadPoolDispatcher, SerializedDispatcher, AsyncioDispatcher
+from signalrcore.hub_connection_builder import HubConnectionBuilder
+from signalrcore.types import DispatchMode
+
+
+class TestDispatchers(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def test_inline(self):
+        dispatcher = InlineDispatcher()
+        calls = []
+        dispatcher.dispatch("a", calls.append, 1)
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(dispatcher.metrics.dispatched, 1)
+        self.assertEqual(dispatcher.queue_depth(), 0)
+        self.assertRaises(
+            ZeroDivisionError, dispatcher.dispatch, "a", lambda: 1 / 0)
+
+    def test_thread_pool(self):
+        dispatcher = ThreadPoolDispatcher(max_workers=4)
+        calls = []
+        for i in range(20):
+            dispatcher.dispatch(str(i % 4), calls.append, i)
+        dispatcher.dispatch("error", lambda: 1 / 0)
+        dispatcher.shutdown()
+
+        self.assertEqual(sorted(calls), list(range(20)))
+        self.assertEqual(dispatcher.metrics.completed, 21)
+        self.assertEqual(dispatcher.metrics.errors, 1)
+
+    def test_serialized_keeps_order_per_key(self):
+        dispatcher = SerializedDispatcher(max_workers=4)
+        calls = {"slow": [], "fast": []}
+        started = threading.Event()
+
+        def slow(i):
+            started.set()
+            time.sleep(0.01)
+            calls["slow"].append(i)
+
+        for i in range(10):
+            dispatcher.dispatch("slow", slow, i)
+        started.wait(1)
+        self.assertGreater(dispatcher.queue_depth("slow"), 0)
+
+        for i in range(10):
+            dispatcher.dispatch("fast", calls["fast"].append, i)
+        time.sleep(0.05)
+        # independent targets do not wait for the slow one
+        self.assertEqual(calls["fast"], list(range(10)))
+
+        dispatcher.shutdown()
+        self.assertEqual(calls["slow"], list(range(10)))
+        self.assertEqual(dispatcher.queue_depth(), 0)
+        self.assertGreaterEqual(dispatcher.metrics.max_pending, 10)
+
+    def test_asyncio(self):
+        calls = []
+
+        async def handler(i):
+            calls.append(("coroutine", i))
+
+        async def main():
+            dispatcher = AsyncioDispatcher(asyncio.get_running_loop())
+            thread = threading.Thread(target=lambda: [
+                dispatcher.dispatch("a", calls.append, 1),
+                dispatcher.dispatch("a", handler, 2)])
+            thread.start()
+            thread.join()
+            for _ in range(10):
+                await asyncio.sleep(0)
+            return dispatcher
+
+        dispatcher = asyncio.run(main())
+        self.assertEqual(calls, [1, ("coroutine", 2)])
+        self.assertEqual(dispatcher.metrics.completed, 2)
+
+    def test_builder(self):
+        builder = HubConnectionBuilder().with_url("http://localhost")
+        connection = builder.build()
+        self.assertIsInstance(connection.dispatcher, InlineDispatcher)
+
+        connection = builder\
+            .with_dispatcher(DispatchMode.serialized, max_workers=2)\
+            .build()
+        self.assertIsInstance(connection.dispatcher, SerializedDispatcher)
+        connection.dispatcher.shutdown()
+
+        self.assertRaises(TypeError, builder.with_dispatcher, "inline")
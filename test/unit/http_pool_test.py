@@ -0,0 +1,67 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+from ..base_test_case import BaseTestCase
+from signalrcore.helpers import HttpConnectionPool, RequestHelpers
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    clients = set()
+
+    def do_POST(self):
+        KeepAliveHandler.clients.add(self.client_address)
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        status = 404 if self.path.startswith("/missing") else 200
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpConnectionPool(BaseTestCase):
+    def setUp(self):
+        KeepAliveHandler.clients = set()
+        self.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), KeepAliveHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = "http://127.0.0.1:{0}/chatHub".format(
+            self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuse_connection(self):
+        pool = HttpConnectionPool()
+        for i in range(5):
+            data = "{0}".format(i).encode("utf-8")
+            response = pool.request(self.url, "POST", {}, data=data)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content, data)
+        self.assertEqual(len(KeepAliveHandler.clients), 1)
+        pool.close()
+
+    def test_reconnect_closed_connection(self):
+        pool = HttpConnectionPool()
+        pool.request(self.url, "POST", {}, data=b"1")
+        for idle in pool._idle.values():
+            for connection in idle:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+        response = pool.request(self.url, "POST", {}, data=b"2")
+        self.assertEqual(response.content, b"2")
+        pool.close()
+
+    def test_error_status(self):
+        with self.assertRaises(HTTPError):
+            RequestHelpers.post(
+                self.url.replace("chatHub", "missing"),
+                headers={},
+                data=b"{}")
@@ -0,0 +1,102 @@
+import threading
+from ..base_test_case import BaseTestCase
+from signalrcore.transport.inbound_queue import InboundQueue
+from signalrcore.messages.invocation_message import InvocationMessage
+from signalrcore.messages.completion_message import CompletionMessage
+from signalrcore.types import OverflowPolicy
+
+
+def invocation(target, value):
+    return InvocationMessage(None, target, [value])
+
+
+class TestInboundQueue(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def fill(self, policy, messages, max_size=3):
+        delivered = []
+        queue = InboundQueue(delivered.extend, max_size, policy)
+        queue.put_all(messages)
+        queue.start()
+        queue.stop()
+        return queue, delivered
+
+    def values(self, messages):
+        return [
+            (m.target, m.arguments[0]) if m.target is not None else m.result
+            for m in messages
+        ]
+
+    def test_deliver_in_order(self):
+        messages = [invocation("a", i) for i in range(5)]
+        queue, delivered = self.fill(OverflowPolicy.drop_newest, messages, 10)
+        self.assertEqual(delivered, messages)
+        self.assertEqual(queue.metrics.delivered, 5)
+        self.assertEqual(queue.pending(), 0)
+
+    def test_drop_newest(self):
+        queue, delivered = self.fill(
+            OverflowPolicy.drop_newest,
+            [invocation("a", i) for i in range(5)])
+        self.assertEqual(
+            self.values(delivered), [("a", 0), ("a", 1), ("a", 2)])
+        self.assertEqual(queue.metrics.dropped, 2)
+
+    def test_drop_oldest(self):
+        queue, delivered = self.fill(
+            OverflowPolicy.drop_oldest,
+            [invocation("a", i) for i in range(5)])
+        self.assertEqual(
+            self.values(delivered), [("a", 2), ("a", 3), ("a", 4)])
+        self.assertEqual(queue.metrics.dropped, 2)
+
+    def test_coalesce_latest(self):
+        messages = [
+            invocation("a", 0),
+            invocation("b", 0),
+            invocation("c", 0),
+            invocation("a", 1),
+            invocation("b", 1),
+            invocation("a", 2),
+            invocation("d", 0)]
+        queue, delivered = self.fill(OverflowPolicy.coalesce_latest, messages)
+        self.assertEqual(
+            self.values(delivered), [("b", 1), ("c", 0), ("d", 0)])
+        self.assertEqual(queue.metrics.coalesced, 3)
+        self.assertEqual(queue.metrics.dropped, 1)
+
+    def test_completions_are_not_dropped(self):
+        completion = CompletionMessage("1", 42, None)
+        queue, delivered = self.fill(
+            OverflowPolicy.drop_newest,
+            [invocation("a", i) for i in range(3)] + [completion])
+        self.assertIn(completion, delivered)
+        self.assertEqual(len(delivered), 4)
+
+    def test_block(self):
+        release = threading.Event()
+        delivered = []
+
+        def handle(messages):
+            release.wait(1)
+            delivered.extend(messages)
+
+        queue = InboundQueue(handle, 2, OverflowPolicy.block)
+        queue.start()
+        producer = threading.Thread(
+            target=queue.put_all,
+            args=([invocation("a", i) for i in range(6)], ))
+        producer.start()
+        producer.join(0.1)
+        self.assertTrue(producer.is_alive())  # waiting for room
+
+        release.set()
+        producer.join(1)
+        queue.stop()
+        self.assertEqual(
+            self.values(delivered), [("a", i) for i in range(6)])
+        self.assertGreater(queue.metrics.blocked, 0)
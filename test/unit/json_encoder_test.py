@@ -0,0 +1,75 @@
+import json
+from ..base_test_case import BaseTestCase
+from signalrcore.protocol.json_encoder import \
+    JsonMessageEncoder, available_backends
+from signalrcore.protocol.json_hub_protocol import JsonHubProtocol
+from signalrcore.messages.handshake.request import HandshakeRequestMessage
+from signalrcore.messages.invocation_message import \
+    InvocationMessage, InvocationClientStreamMessage
+from signalrcore.messages.stream_item_message import StreamItemMessage
+from signalrcore.messages.completion_message import \
+    CompletionClientStreamMessage
+from signalrcore.messages.ping_message import PingMessage
+
+
+class Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class TestJsonEncoder(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def encode(self, message):
+        return [
+            json.loads(JsonMessageEncoder(backend).encode(message))
+            for backend in available_backends()
+        ]
+
+    def test_invocation(self):
+        message = InvocationMessage(
+            "1", "Send", ["a", Point(1, 2)], headers={"h": "v"})
+        for data in self.encode(message):
+            self.assertEqual(data, {
+                "type": 1,
+                "headers": {"h": "v"},
+                "invocationId": "1",
+                "target": "Send",
+                "arguments": ["a", {"x": 1, "y": 2}]
+            })
+
+    def test_message_is_not_modified(self):
+        message = InvocationClientStreamMessage(["2"], "Upload", [])
+        protocol = JsonHubProtocol(backend="json")
+        first = protocol.encode(message)
+
+        self.assertEqual(first, protocol.encode(message))
+        self.assertEqual(message.stream_ids, ["2"])
+        self.assertEqual(json.loads(first[:-1])["streamIds"], ["2"])
+
+    def test_messages(self):
+        cases = [
+            (StreamItemMessage("1", 42),
+                {"type": 2, "headers": {}, "invocationId": "1", "item": 42}),
+            (CompletionClientStreamMessage("1"),
+                {"type": 3, "headers": {}, "invocationId": "1"}),
+            (PingMessage(), {"type": 6}),
+            (HandshakeRequestMessage("json", 1),
+                {"protocol": "json", "version": 1})
+        ]
+        for message, expected in cases:
+            for data in self.encode(message):
+                self.assertEqual(data, expected)
+
+    def test_big_integers(self):
+        message = StreamItemMessage("1", 2 ** 70)
+        for data in self.encode(message):
+            self.assertEqual(data["item"], 2 ** 70)
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, JsonMessageEncoder, "simplejson")
@@ -0,0 +1,66 @@
+from ..base_test_case import BaseTestCase
+from signalrcore.protocol.json_hub_protocol import JsonHubProtocol
+from signalrcore.messages.invocation_message import InvocationMessage
+from signalrcore.messages.completion_message import CompletionMessage
+from signalrcore.messages.close_message import CloseMessage
+from signalrcore.messages.ping_message import PingMessage
+
+INVOCATION = '{"type":1,"target":"Receive","arguments":["a",1]}\x1e'
+COMPLETION = '{"type":3,"invocationId":"7","result":42}\x1e'
+
+
+class TestJsonParser(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def test_parse_messages(self):
+        protocol = JsonHubProtocol()
+        messages = protocol.parse_messages(
+            INVOCATION + COMPLETION + '{"type":6}\x1e{}\x1e')
+
+        self.assertEqual(
+            [type(m) for m in messages],
+            [InvocationMessage, CompletionMessage, PingMessage])
+        self.assertEqual(messages[0].target, "Receive")
+        self.assertEqual(messages[0].arguments, ["a", 1])
+        self.assertEqual(messages[1].invocation_id, "7")
+        self.assertEqual(messages[1].result, 42)
+        self.assertIsNone(messages[1].error)
+
+    def test_partial_records(self):
+        protocol = JsonHubProtocol()
+        data = INVOCATION + COMPLETION
+        messages = []
+        for i in range(0, len(data), 7):
+            messages += protocol.parse_messages(data[i: i + 7])
+
+        self.assertEqual(
+            [type(m) for m in messages],
+            [InvocationMessage, CompletionMessage])
+
+    def test_handshake_drops_partial_record(self):
+        protocol = JsonHubProtocol()
+        protocol.parse_messages(COMPLETION[:10])
+        response, messages = protocol.decode_handshake(
+            '{}\x1e' + INVOCATION)
+
+        self.assertIsNone(response.error)
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(type(messages[0]), InvocationMessage)
+
+    def test_close(self):
+        protocol = JsonHubProtocol()
+        message = protocol.parse_messages(
+            '{"type":7,"error":"bye","allowReconnect":true}\x1e')[0]
+
+        self.assertEqual(type(message), CloseMessage)
+        self.assertEqual(message.error, "bye")
+        self.assertTrue(message.allow_reconnect)
+
+    def test_unknown_type(self):
+        protocol = JsonHubProtocol()
+        self.assertRaises(
+            ValueError, protocol.parse_messages, '{"type":99}\x1e')
@@ -0,0 +1,69 @@
+import threading
+import time
+from ..base_test_case import BaseTestCase
+from signalrcore.hub.handlers import LatestHandler
+from signalrcore.hub_connection_builder import HubConnectionBuilder
+
+
+class TestLatestHandler(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def wait_for(self, condition, timeout=2):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def test_coalesce_while_busy(self):
+        release = threading.Event()
+        calls = []
+
+        def callback(arguments):
+            release.wait(1)
+            calls.append(arguments[0])
+
+        handler = LatestHandler("Tick", callback)
+        for i in range(100):
+            handler([i])
+        release.set()
+        self.wait_for(lambda: handler.pending() == 0 and 99 in calls)
+        handler.close()
+
+        self.assertEqual(calls[-1], 99)
+        self.assertLess(len(calls), 100)
+        self.assertEqual(handler.metrics.received, 100)
+        self.assertEqual(
+            handler.metrics.coalesced + len(calls), 100)
+
+    def test_keys(self):
+        calls = []
+        handler = LatestHandler(
+            "Price",
+            calls.append,
+            key=lambda arguments: arguments[0],
+            min_interval=0.2)
+        handler(["a", 1])
+        self.wait_for(lambda: len(calls) == 1)
+        for i in range(2, 10):
+            handler(["a", i])
+            handler(["b", i])
+        self.wait_for(lambda: len(calls) == 3)
+        time.sleep(0.05)
+        handler.close()
+
+        # a was delivered recently, b goes first
+        self.assertEqual(calls, [["a", 1], ["b", 9], ["a", 9]])
+
+    def test_connection(self):
+        connection = HubConnectionBuilder()\
+            .with_url("http://localhost")\
+            .build()
+        handler = connection.on_latest("Tick", lambda _: None)
+        self.assertIn(handler, connection.handlers["Tick"])
+
+        connection.unsubscribe("Tick", handler)
+        handler(["ignored"])
+        self.assertEqual(handler.pending(), 0)
@@ -0,0 +1,41 @@
+import os
+from ..base_test_case import BaseTestCase
+from signalrcore.transport.websockets.masking import \
+    mask_payload, mask_python
+from signalrcore.transport.websockets.frame import encode_frame
+
+
+class TestMasking(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def mask_per_byte(self, payload, masking_key):
+        return bytes(b ^ masking_key[i % 4] for i, b in enumerate(payload))
+
+    def test_mask_matches_per_byte_mask(self):
+        masking_key = os.urandom(4)
+        for size in [0, 1, 3, 4, 5, 125, 126, 65535, 65536, 100003]:
+            payload = os.urandom(size)
+            expected = self.mask_per_byte(payload, masking_key)
+            self.assertEqual(mask_python(payload, masking_key), expected)
+            self.assertEqual(mask_payload(payload, masking_key), expected)
+
+    def test_mask_is_reversible(self):
+        masking_key = os.urandom(4)
+        payload = b"\x00\xff" * 1000
+        self.assertEqual(
+            mask_payload(mask_payload(payload, masking_key), masking_key),
+            payload)
+
+    def test_encode_frame(self):
+        payload = os.urandom(300)
+        frame = encode_frame(payload, 0x2)
+        self.assertEqual(frame[0], 0x82)
+        self.assertEqual(frame[1], 0x80 | 126)
+        masking_key = frame[4:8]
+        self.assertEqual(
+            self.mask_per_byte(frame[8:], masking_key),
+            payload)
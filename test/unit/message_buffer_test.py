@@ -0,0 +1,101 @@
+import threading
+from ..base_test_case import BaseTestCase
+from signalrcore.hub.errors import HubConnectionError
+from signalrcore.messages.ack_message import AckMessage
+from signalrcore.messages.invocation_message import InvocationMessage
+from signalrcore.messages.ping_message import PingMessage
+from signalrcore.messages.sequence_message import SequenceMessage
+from signalrcore.transport.message_buffer import MessageBuffer
+from signalrcore.transport.scheduler import Scheduler
+
+
+def invocation(i):
+    return InvocationMessage(str(i), "target", [i])
+
+
+class TestMessageBuffer(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def create_buffer(self, max_bytes=100, acks=None):
+        self.scheduler = Scheduler()
+        self.addCleanup(self.scheduler.shutdown)
+        send_ack = acks.append if acks is not None else lambda _: None
+        return MessageBuffer(send_ack, self.scheduler, max_bytes, timeout=0.1)
+
+    def test_ack_releases(self):
+        buffer = self.create_buffer()
+        self.assertFalse(buffer.add(PingMessage(), "ping"))
+        for i in range(3):
+            self.assertTrue(buffer.add(invocation(i), "data{0}".format(i)))
+        self.assertEqual(buffer.pending(), 3)
+
+        buffer.receive([AckMessage(2)])
+        self.assertEqual(buffer.pending(), 1)
+        self.assertEqual(buffer.buffered_bytes(), 5)
+
+        sequence, messages = buffer.resend_messages()
+        self.assertEqual(sequence.sequence_id, 3)
+        self.assertEqual(messages, ["data2"])
+
+        buffer.ack(3)
+        sequence, messages = buffer.resend_messages()
+        self.assertEqual(sequence.sequence_id, 4)
+        self.assertEqual(messages, [])
+
+    def test_full_buffer(self):
+        buffer = self.create_buffer(max_bytes=10)
+        with buffer.condition:
+            buffer.add(invocation(0), "0123456789")
+
+            self.assertRaises(
+                HubConnectionError,
+                buffer.add, invocation(1), "x", False)
+            self.assertRaises(
+                HubConnectionError,
+                buffer.add, invocation(1), "x")
+
+            threading.Timer(0.02, buffer.ack, (1,)).start()
+            self.assertTrue(buffer.add(invocation(1), "x"))
+
+    def test_dedupe_replayed(self):
+        buffer = self.create_buffer()
+        received = buffer.receive(
+            [invocation(i) for i in range(3)] + [PingMessage()])
+        self.assertEqual(len(received), 4)
+
+        # reconnection, the server sends again from the second message
+        replayed = [SequenceMessage(2)] + [invocation(i) for i in range(1, 5)]
+        received = buffer.receive(replayed)
+        self.assertEqual(
+            [message.arguments[0] for message in received], [3, 4])
+
+    def test_lost_messages(self):
+        buffer = self.create_buffer()
+        buffer.receive([invocation(0)])
+        self.assertRaises(
+            HubConnectionError,
+            buffer.receive, [SequenceMessage(5)])
+
+    def test_periodic_ack(self):
+        acks = []
+        buffer = self.create_buffer(acks=acks)
+        buffer.receive([invocation(i) for i in range(3)])
+        buffer._ack_timer()
+        buffer._ack_timer()  # nothing new received
+        self.assertEqual(acks, [3])
+        buffer.close()
+
+    def test_reset(self):
+        buffer = self.create_buffer()
+        buffer.add(invocation(0), "data")
+        buffer.receive([invocation(0)])
+        buffer.reset()
+
+        self.assertEqual(buffer.pending(), 0)
+        self.assertEqual(len(buffer.receive([invocation(0)])), 1)
+        self.assertEqual(buffer.resend_messages()[0].sequence_id, 1)
+        buffer.close()
@@ -0,0 +1,80 @@
+import threading
+import msgpack
+from ..base_test_case import BaseTestCase
+from signalrcore.protocol.messagepack_protocol import MessagePackHubProtocol
+from signalrcore.messages.invocation_message import \
+    InvocationMessage, InvocationClientStreamMessage
+from signalrcore.messages.stream_item_message import StreamItemMessage
+from signalrcore.messages.completion_message import \
+    CompletionMessage, CompletionClientStreamMessage
+from signalrcore.messages.stream_invocation_message import \
+    StreamInvocationMessage
+from signalrcore.messages.cancel_invocation_message import \
+    CancelInvocationMessage
+from signalrcore.messages.ping_message import PingMessage
+
+
+class TestMessagePackEncoder(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def decode(self, data: bytes) -> list:
+        length, shift, offset = 0, 0, 0
+        while True:
+            byte = data[offset]
+            length |= (byte & 0x7F) << shift
+            shift += 7
+            offset += 1
+            if byte & 0x80 == 0:
+                break
+        self.assertEqual(len(data) - offset, length)
+        return msgpack.unpackb(data[offset:])
+
+    def test_layouts(self):
+        protocol = MessagePackHubProtocol()
+        cases = [
+            (InvocationMessage("1", "Send", [1], headers={}),
+                [1, {}, "1", "Send", [1]]),
+            (InvocationClientStreamMessage(["2"], "Upload", []),
+                [1, {}, None, "Upload", [], ["2"]]),
+            (StreamItemMessage("2", "item"), [2, {}, "2", "item"]),
+            (CompletionMessage("1", 42, None), [3, {}, "1", 3, 42]),
+            (CompletionMessage("1", None, "error"),
+                [3, {}, "1", 1, "error"]),
+            (CompletionClientStreamMessage("2"), [3, {}, "2", 2]),
+            (StreamInvocationMessage("3", "Counter", [10], ["4"]),
+                [4, {}, "3", "Counter", [10], ["4"]]),
+            (CancelInvocationMessage("3"), [5, {}, "3"]),
+            (PingMessage(), [6])
+        ]
+        for message, expected in cases:
+            self.assertEqual(self.decode(protocol.encode(message)), expected)
+
+    def test_varint(self):
+        protocol = MessagePackHubProtocol()
+        for size in [0, 127, 128, 16384, 2 ** 21]:
+            message = StreamItemMessage("1", b"\x00" * size)
+            self.assertEqual(
+                self.decode(protocol.encode(message))[3],
+                b"\x00" * size)
+
+    def test_threads(self):
+        protocol = MessagePackHubProtocol()
+        errors = []
+
+        def encode(n):
+            message = InvocationMessage(str(n), "Send", [n] * n, headers={})
+            for _ in range(200):
+                if self.decode(protocol.encode(message))[4] != [n] * n:
+                    errors.append(n)  # pragma: no cover
+
+        threads = [
+            threading.Thread(target=encode, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
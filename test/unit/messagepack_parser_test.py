@@ -0,0 +1,65 @@
+import msgpack
+from ..base_test_case import BaseTestCase
+from signalrcore.protocol.messagepack_protocol import MessagePackHubProtocol
+from signalrcore.messages.invocation_message import InvocationMessage
+from signalrcore.messages.completion_message import CompletionMessage
+from signalrcore.messages.ping_message import PingMessage
+
+
+class TestMessagePackParser(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def pack(self, protocol, *messages):
+        data = b""
+        for message in messages:
+            payload = msgpack.packb(message)
+            data += protocol._to_varint(len(payload)) + payload
+        return data
+
+    def test_parse_messages(self):
+        protocol = MessagePackHubProtocol()
+        data = self.pack(
+            protocol,
+            [1, {}, None, "Receive", ["a" * 300], []],
+            [3, {}, "1", 3, 42],
+            [6])
+        messages = protocol.parse_messages(data)
+
+        self.assertEqual(
+            [type(m) for m in messages],
+            [InvocationMessage, CompletionMessage, PingMessage])
+        self.assertEqual(messages[0].arguments, ["a" * 300])
+        self.assertEqual(messages[1].result, 42)
+
+    def test_split_messages(self):
+        protocol = MessagePackHubProtocol()
+        data = self.pack(
+            protocol,
+            [1, {}, None, "Receive", ["a" * 300], []],
+            [3, {}, "1", 3, 42])
+
+        for step in [1, 2, 5, 100]:
+            messages = []
+            for i in range(0, len(data), step):
+                messages += protocol.parse_messages(data[i: i + step])
+            self.assertEqual(
+                [type(m) for m in messages],
+                [InvocationMessage, CompletionMessage])
+            self.assertEqual(len(protocol._buffer), 0)
+
+    def test_invocation_without_stream_ids(self):
+        protocol = MessagePackHubProtocol()
+        message = protocol.parse_messages(
+            self.pack(protocol, [1, {}, None, "Receive", [1]]))[0]
+        self.assertEqual(type(message), InvocationMessage)
+        self.assertEqual(message.arguments, [1])
+
+    def test_invalid_message_keeps_batch(self):
+        protocol = MessagePackHubProtocol()
+        messages = protocol.parse_messages(
+            self.pack(protocol, [2, {}], [99], [6]))
+        self.assertEqual([type(m) for m in messages], [PingMessage])
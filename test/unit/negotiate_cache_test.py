@@ -0,0 +1,145 @@
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ..base_test_case import BaseTestCase
+from signalrcore.hub.negotiation import NegotiateCache, NegotiationHandler, \
+    AzureResponse, token_expiry
+from signalrcore.types import HttpTransportType
+
+
+def jwt(exp):
+    payload = base64.urlsafe_b64encode(
+        json.dumps({"exp": exp}).encode("utf-8")).decode("utf-8")
+    return "header.{0}.signature".format(payload.rstrip("="))
+
+
+class NegotiateHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+    response = {}
+
+    def do_POST(self):
+        NegotiateHandler.requests.append(self.path)
+        body = json.dumps(NegotiateHandler.response).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestNegotiateCache(BaseTestCase):
+    def setUp(self):
+        NegotiateHandler.requests = []
+        NegotiateHandler.response = {
+            "negotiateVersion": 1,
+            "connectionId": "id",
+            "connectionToken": "token",
+            "availableTransports": [
+                {
+                    "transport": "WebSockets",
+                    "transferFormats": ["Text", "Binary"]
+                },
+                {
+                    "transport": "LongPolling",
+                    "transferFormats": ["Text", "Binary"]
+                }
+            ]
+        }
+        self.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), NegotiateHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = "http://127.0.0.1:{0}/chatHub".format(
+            self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def negotiate(self, cache, require_connection_token=False, headers={}):
+        return NegotiationHandler(
+            self.url,
+            headers,
+            {},
+            None,
+            False,
+            cache=cache,
+            require_connection_token=require_connection_token).negotiate()
+
+    def test_reuses_transports(self):
+        cache = NegotiateCache()
+        url, _, response = self.negotiate(cache)
+        self.assertIn("id=id", url)
+
+        url, _, response = self.negotiate(cache)
+        self.assertEqual(len(NegotiateHandler.requests), 1)
+        self.assertNotIn("id=", url)
+        self.assertEqual(
+            [t.transport for t in response.available_transports],
+            [HttpTransportType.web_sockets])
+
+        # other auth identity
+        self.negotiate(cache, headers={"Authorization": "Bearer x"})
+        self.assertEqual(len(NegotiateHandler.requests), 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_connection_token_required(self):
+        cache = NegotiateCache()
+        self.negotiate(cache)
+        url, _, _ = self.negotiate(cache, require_connection_token=True)
+        self.assertEqual(len(NegotiateHandler.requests), 2)
+        self.assertIn("id=id", url)
+
+    def test_expiration(self):
+        cache = NegotiateCache(ttl=0.05)
+        self.negotiate(cache)
+        time.sleep(0.06)
+        self.negotiate(cache)
+        self.assertEqual(len(NegotiateHandler.requests), 2)
+
+        handler = NegotiationHandler(
+            self.url, {}, {}, None, False, cache=cache,
+            require_connection_token=False)
+        handler.invalidate()
+        handler.negotiate()
+        self.assertEqual(len(NegotiateHandler.requests), 3)
+
+    def test_azure_redirect(self):
+        token = jwt(time.time() + 3600)
+        NegotiateHandler.response = {
+            "url": "https://azure.service/client/?hub=chat",
+            "accessToken": token
+        }
+        cache = NegotiateCache()
+        for _ in range(3):
+            url, headers, response = self.negotiate(
+                cache, require_connection_token=True)
+            self.assertEqual(url, "wss://azure.service/client/?hub=chat")
+            self.assertEqual(headers["Authorization"], "Bearer " + token)
+            self.assertIsInstance(response, AzureResponse)
+        self.assertEqual(len(NegotiateHandler.requests), 1)
+
+        # access token about to expire, not reused
+        NegotiateHandler.response["accessToken"] = jwt(time.time() + 10)
+        cache.clear()
+        self.negotiate(cache)
+        self.negotiate(cache)
+        self.assertEqual(len(NegotiateHandler.requests), 3)
+
+    def test_token_expiry(self):
+        self.assertEqual(token_expiry(jwt(100)), 100)
+        self.assertIsNone(token_expiry("opaque"))
+
+    def test_max_entries(self):
+        cache = NegotiateCache(max_entries=2)
+        for i in range(3):
+            self.negotiate(cache, headers={"Authorization": str(i)})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(self.url, {"Authorization": "0"}))
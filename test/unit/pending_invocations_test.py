@@ -0,0 +1,62 @@
+import time
+from ..base_test_case import BaseTestCase
+from signalrcore.hub.errors import HubConnectionError, InvocationError
+from signalrcore.hub.invocations import PendingInvocations
+from signalrcore.messages.completion_message import CompletionMessage
+
+
+class TestPendingInvocations(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def test_complete(self):
+        pending = PendingInvocations()
+        future = pending.add("1")
+        self.assertIn("1", pending)
+
+        self.assertTrue(
+            pending.complete(CompletionMessage("1", 3, None)))
+        self.assertEqual(future.result(timeout=1), 3)
+        self.assertEqual(len(pending), 0)
+        self.assertFalse(
+            pending.complete(CompletionMessage("1", 3, None)))
+
+    def test_error(self):
+        pending = PendingInvocations()
+        future = pending.add("1")
+        pending.complete(CompletionMessage("1", None, "hub error"))
+
+        with self.assertRaises(InvocationError) as context:
+            future.result(timeout=1)
+        self.assertEqual(context.exception.message.invocation_id, "1")
+
+    def test_timeout(self):
+        pending = PendingInvocations()
+        expired = pending.add("1", timeout=0.01)
+        alive = pending.add("2", timeout=60)
+        time.sleep(0.02)
+        pending.expire()
+
+        self.assertRaises(TimeoutError, expired.result, 1)
+        self.assertFalse(alive.done())
+        self.assertEqual(len(pending), 1)
+
+    def test_bounded(self):
+        pending = PendingInvocations(max_pending=2)
+        futures = [pending.add(str(i)) for i in range(3)]
+
+        self.assertRaises(HubConnectionError, futures[0].result, 1)
+        self.assertFalse(futures[1].done())
+        self.assertEqual(len(pending), 2)
+
+    def test_fail_all(self):
+        pending = PendingInvocations()
+        futures = [pending.add(str(i)) for i in range(3)]
+        pending.fail_all(HubConnectionError("Connection closed"))
+
+        for future in futures:
+            self.assertRaises(HubConnectionError, future.result, 1)
+        self.assertEqual(len(pending), 0)
@@ -1,6 +1,9 @@
+import collections
+import random
 from ..base_test_case import BaseTestCase
 from signalrcore.transport.reconnection\
-    import RawReconnectionHandler, IntervalReconnectionHandler
+    import RawReconnectionHandler, IntervalReconnectionHandler, \
+    ExponentialReconnectionHandler, JitterType
 
 
 class TestReconnectionHandlerMethods(BaseTestCase):
@@ -26,3 +29,47 @@ class TestReconnectionHandlerMethods(BaseTestCase):
         for interval in intervals:
             self.assertEqual(handler.next(), interval)
         self.assertRaises(ValueError, handler.next)
+
+    def test_exponential_handler(self):
+        handler = ExponentialReconnectionHandler(
+            1, 10, max_attempts=6, jitter=JitterType.none)
+        self.assertEqual(
+            [handler.next() for _ in range(6)], [1, 2, 4, 8, 10, 10])
+        self.assertRaises(ValueError, handler.next)
+
+        handler.reset()
+        self.assertEqual(handler.next(), 1)
+
+    def test_exponential_handler_jitter(self):
+        rng = random.Random(1)
+        full = ExponentialReconnectionHandler(1, 30, rng=rng)
+        decorrelated = ExponentialReconnectionHandler(
+            1, 30, jitter=JitterType.decorrelated, rng=rng)
+
+        for attempt in range(10):
+            self.assertLessEqual(full.next(), min(30, 2 ** attempt))
+            self.assertTrue(1 <= decorrelated.next() <= 30)
+
+    def test_reconnect_storm_spread(self):
+        """Simulates clients dropped at once by a server restart, the
+        fourth reconnect attempt of each client is counted in the second
+        it hits the server"""
+        clients = 1000
+
+        def attempts_per_second(jitter):
+            rng = random.Random(42)
+            seconds = collections.Counter()
+            for _ in range(clients):
+                handler = ExponentialReconnectionHandler(
+                    1, 60, jitter=jitter, rng=rng)
+                elapsed = sum(handler.next() for _ in range(4))
+                seconds[int(elapsed)] += 1
+            return seconds
+
+        lockstep = attempts_per_second(JitterType.none)
+        self.assertEqual(list(lockstep.values()), [clients])
+
+        for jitter in (JitterType.full, JitterType.decorrelated):
+            seconds = attempts_per_second(jitter)
+            self.assertGreater(len(seconds), 10, jitter)
+            self.assertLess(max(seconds.values()), clients / 5, jitter)
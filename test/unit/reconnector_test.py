@@ -0,0 +1,80 @@
+import threading
+import time
+from ..base_test_case import BaseTestCase
+from signalrcore.transport.reconnection import RawReconnectionHandler
+from signalrcore.transport.reconnector import Reconnector, ReconnectState
+from signalrcore.transport.scheduler import Scheduler
+
+
+class TestReconnector(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def create_reconnector(self, failures, max_attempts=None):
+        self.scheduler = Scheduler()
+        self.addCleanup(self.scheduler.shutdown)
+        self.done = threading.Event()
+        self.errors = []
+        calls = []
+
+        def attempt():
+            calls.append(time.time())
+            if len(calls) <= failures:
+                raise ConnectionRefusedError("refused")
+            self.done.set()
+
+        def on_give_up(error):
+            self.errors.append(error)
+            self.done.set()
+
+        return calls, Reconnector(
+            RawReconnectionHandler(0.01, max_attempts),
+            attempt,
+            on_give_up,
+            self.scheduler)
+
+    def test_reconnects(self):
+        calls, reconnector = self.create_reconnector(failures=2)
+        self.assertTrue(reconnector.start())
+        self.assertFalse(reconnector.start())  # already reconnecting
+
+        self.assertTrue(self.done.wait(1))
+        time.sleep(0.01)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(reconnector.state, ReconnectState.idle)
+
+        metrics = reconnector.metrics
+        self.assertEqual(metrics.attempts, 3)
+        self.assertEqual(metrics.failures, 2)
+        self.assertEqual(metrics.successes, 1)
+        self.assertTrue(metrics.last_attempt.succeeded)
+        self.assertEqual(
+            [attempt.delay for attempt in metrics.history], [0, 0.01, 0.01])
+        self.assertIsInstance(
+            metrics.history[0].error, ConnectionRefusedError)
+
+    def test_gives_up(self):
+        calls, reconnector = self.create_reconnector(
+            failures=10, max_attempts=1)
+        reconnector.start()
+
+        self.assertTrue(self.done.wait(1))
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(len(self.errors), 1)
+        self.assertEqual(reconnector.metrics.gave_up, 1)
+        self.assertFalse(reconnector.running)
+
+    def test_cancel(self):
+        calls, reconnector = self.create_reconnector(failures=10)
+        reconnector.handler = RawReconnectionHandler(0.05, None)
+        reconnector.start()
+        time.sleep(0.02)
+        reconnector.cancel()
+        time.sleep(0.1)
+
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(reconnector.running)
+        self.assertEqual(self.scheduler.pending(), 0)
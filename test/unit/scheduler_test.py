@@ -0,0 +1,105 @@
+import threading
+import time
+from ..base_test_case import BaseTestCase
+from signalrcore.transport.reconnection import ConnectionStateChecker
+from signalrcore.transport.scheduler import Scheduler, get_scheduler
+
+
+class TestScheduler(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def test_order(self):
+        scheduler = Scheduler()
+        calls = []
+        done = threading.Event()
+        scheduler.schedule(0.03, lambda: (calls.append(3), done.set()))
+        scheduler.schedule(0.01, calls.append, 1)
+        scheduler.schedule(0.02, calls.append, 2)
+
+        self.assertTrue(done.wait(1))
+        self.assertEqual(calls, [1, 2, 3])
+        scheduler.shutdown()
+
+    def test_cancel(self):
+        scheduler = Scheduler()
+        calls = []
+        task = scheduler.schedule(0.01, calls.append, 1)
+        task.cancel()
+        self.assertEqual(scheduler.pending(), 0)
+        time.sleep(0.05)
+        self.assertEqual(calls, [])
+        scheduler.shutdown()
+
+    def test_failing_callback(self):
+        scheduler = Scheduler()
+        done = threading.Event()
+        scheduler.schedule(0, lambda: 1 / 0)
+        scheduler.schedule(0.01, done.set)
+        self.assertTrue(done.wait(1))
+        scheduler.shutdown()
+
+    def test_shared(self):
+        self.assertIs(get_scheduler(), get_scheduler())
+
+    def test_connection_checker(self):
+        scheduler = Scheduler()
+        pings = []
+        checker = ConnectionStateChecker(
+            lambda: pings.append(time.time()),
+            keep_alive_interval=0.05,
+            sleep=0.05,
+            scheduler=scheduler)
+        checker.start()
+        checker.start()  # already running
+        time.sleep(0.02)
+        self.assertEqual(pings, [])
+
+        time.sleep(0.2)
+        checker.stop()
+        count = len(pings)
+        self.assertGreater(count, 0)
+        self.assertEqual(scheduler.pending(), 0)
+
+        time.sleep(0.1)
+        self.assertEqual(len(pings), count)
+        scheduler.shutdown()
+
+    def test_connection_checker_messages(self):
+        scheduler = Scheduler()
+        pings = []
+        checker = ConnectionStateChecker(
+            lambda: pings.append(1),
+            keep_alive_interval=0.1,
+            scheduler=scheduler)
+        checker.start()
+        for _ in range(4):
+            time.sleep(0.05)
+            checker.last_message = time.time()
+        checker.stop()
+        self.assertEqual(pings, [])
+        scheduler.shutdown()
+
+    def test_server_timeout(self):
+        scheduler = Scheduler()
+        pings, timeouts = [], []
+        checker = ConnectionStateChecker(
+            lambda: pings.append(1),
+            keep_alive_interval=10,
+            scheduler=scheduler,
+            server_timeout=0.05,
+            on_server_timeout=lambda: timeouts.append(time.time()))
+        checker.start()
+        for _ in range(3):
+            time.sleep(0.03)
+            checker.last_received = time.time()
+        self.assertEqual(timeouts, [])
+
+        time.sleep(0.07)
+        checker.stop()
+        self.assertEqual(len(timeouts), 1)
+        self.assertEqual(pings, [])
+        scheduler.shutdown()
@@ -0,0 +1,52 @@
+import threading
+from ..base_test_case import BaseTestCase
+from signalrcore.transport.send_queue import SendQueue
+
+
+class TestSendQueue(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def test_coalesce_messages(self):
+        writes = []
+        queue = SendQueue(writes.append, max_batch_bytes=40, max_linger=0.5)
+        for i in range(10):
+            queue.put("msg{0}\x1e".format(i))
+        queue.start()
+        queue.stop()
+
+        self.assertEqual(
+            "".join(writes),
+            "".join("msg{0}\x1e".format(i) for i in range(10)))
+        self.assertTrue(all(len(data) <= 40 for data in writes))
+        self.assertEqual(queue.metrics.messages, 10)
+        self.assertEqual(queue.metrics.batches, len(writes))
+        self.assertEqual(queue.metrics.max_batch_messages, 8)
+
+    def test_big_message_is_sent_alone(self):
+        writes = []
+        queue = SendQueue(writes.append, max_batch_bytes=4)
+        queue.put(b"\x01" * 10)
+        queue.put(b"\x02")
+        queue.start()
+        queue.stop()
+        self.assertEqual(writes, [b"\x01" * 10, b"\x02"])
+
+    def test_linger(self):
+        writes = []
+        written = threading.Event()
+
+        def write(data):
+            writes.append(data)
+            written.set()
+
+        queue = SendQueue(write, max_batch_bytes=1024, max_linger=0.2)
+        queue.start()
+        queue.put(b"\x01")
+        queue.put(b"\x02")
+        self.assertTrue(written.wait(timeout=5))
+        queue.stop()
+        self.assertEqual(writes, [b"\x01\x02"])
@@ -0,0 +1,96 @@
+import os
+import random
+import struct
+from ..base_test_case import BaseTestCase
+from signalrcore.transport.websockets.websocket_client import \
+    WebSocketClient
+from signalrcore.transport.sockets.errors import MessageTooBigError
+
+
+def server_frame(payload: bytes, opcode: int = 0x2, fin: bool = True):
+    header = bytes([(0x80 if fin else 0) | opcode])
+    length = len(payload)
+    if length <= 125:
+        header += bytes([length])
+    elif length <= 65535:
+        header += bytes([126]) + struct.pack(">H", length)
+    else:
+        header += bytes([127]) + struct.pack(">Q", length)
+    return header + payload
+
+
+class FakeSocket(object):
+    """Returns the stream in random sized chunks"""
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    def recv_into(self, buffer):
+        size = min(len(buffer), random.randint(1, 70000))
+        chunk = self.data[self.offset: self.offset + size]
+        buffer[0: len(chunk)] = chunk
+        self.offset += len(chunk)
+        return len(chunk)
+
+    def sendall(self, data):
+        pass
+
+
+class TestWebsocketReceive(BaseTestCase):
+    def setUp(self):  # pragma: no cover
+        pass
+
+    def tearDown(self):  # pragma: no cover
+        pass
+
+    def get_client(self, data: bytes, **kwargs) -> WebSocketClient:
+        client = WebSocketClient(
+            "ws://localhost/chatHub", is_binary=True, **kwargs)
+        client.sock = FakeSocket(data)
+        return client
+
+    def test_receive_frames(self):
+        payloads = [
+            os.urandom(size)
+            for size in [0, 1, 125, 126, 65535, 65536, 300000, 10]
+        ]
+        client = self.get_client(
+            b"".join(server_frame(payload) for payload in payloads))
+
+        for payload in payloads:
+            self.assertEqual(client._recv_frame(), payload)
+
+    def test_receive_fragmented_frame(self):
+        fragments = [os.urandom(100000) for _ in range(5)]
+        data = server_frame(fragments[0], fin=False)
+        for fragment in fragments[1:-1]:
+            data += server_frame(fragment, opcode=0x0, fin=False)
+        data += server_frame(fragments[-1], opcode=0x0)
+
+        client = self.get_client(data)
+        self.assertEqual(client._recv_frame(), b"".join(fragments))
+
+    def test_receive_data_sent_with_handshake(self):
+        first, second = os.urandom(20), os.urandom(20)
+        client = self.get_client(server_frame(second))
+        client._buffer_initial_data(server_frame(first))
+        self.assertEqual(client._recv_frame(), first)
+        self.assertEqual(client._recv_frame(), second)
+
+    def test_text_frame(self):
+        client = self.get_client(server_frame(
+            "{\"type\": 6}\x1e".encode("utf-8"), opcode=0x1))
+        client.is_binary = False
+        self.assertEqual(client._recv_frame(), "{\"type\": 6}\x1e")
+
+    def test_max_message_size(self):
+        client = self.get_client(
+            server_frame(os.urandom(2000)),
+            max_message_size=1024)
+        self.assertRaises(MessageTooBigError, client._recv_frame)
+
+    def test_max_message_size_fragmented(self):
+        data = server_frame(os.urandom(600), fin=False)\
+            + server_frame(os.urandom(600), opcode=0x0)
+        client = self.get_client(data, max_message_size=1024)
+        self.assertRaises(MessageTooBigError, client._recv_frame)